@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark do StatusReporter.
+
+Mede a vazão de atualizações de progresso e consultas de status com várias
+threads simultâneas, comparando o padrão antigo (uma conexão nova por
+chamada, journal padrão) com o pool de conexões do StatusReporter.
+
+Uso:
+    python benchmark_status_reporter.py --threads 8 --chamadas 500
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.append(str(Path(__file__).parent))
+
+from shared.status_reporter import StatusReporter
+
+
+def _progresso_conexao_por_chamada(db_path: Path) -> Callable[[str, int], None]:
+    """
+    Reproduz o `reportar_progresso` original: uma conexão nova por chamada.
+    """
+    def reportar(nome_modulo: str, progresso: int) -> None:
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                UPDATE status_modulos
+                SET progresso = ?, mensagem = ?, timestamp_atualizacao = ?
+                WHERE nome_modulo = ?
+            """, (progresso, "processando", datetime.now(), nome_modulo))
+            conn.commit()
+    return reportar
+
+
+def _status_conexao_por_chamada(db_path: Path) -> Callable[[str], None]:
+    """
+    Reproduz o `obter_status_modulo` original: uma conexão nova por chamada.
+    """
+    def obter(nome_modulo: str) -> None:
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                SELECT nome_modulo, status, progresso FROM status_modulos
+                WHERE nome_modulo = ? ORDER BY timestamp_atualizacao DESC LIMIT 1
+            """, (nome_modulo,)).fetchone()
+    return obter
+
+
+def _medir(threads: int, chamadas: int, progresso: Callable[[str, int], None],
+           status: Callable[[str], None]) -> float:
+    """
+    Executa o cenário e retorna as chamadas por segundo.
+
+    Cada thread representa um módulo: alterna uma atualização de progresso
+    com uma consulta de status.
+    """
+    def trabalho(indice: int) -> None:
+        nome = f"modulo_{indice}"
+        for i in range(chamadas):
+            progresso(nome, i % 100)
+            status(nome)
+
+    trabalhadores = [threading.Thread(target=trabalho, args=(i,)) for i in range(threads)]
+    inicio = time.perf_counter()
+    for t in trabalhadores:
+        t.start()
+    for t in trabalhadores:
+        t.join()
+    return threads * chamadas * 2 / (time.perf_counter() - inicio)
+
+
+def executar(threads: int, chamadas: int) -> Dict[str, float]:
+    """
+    Executa o benchmark nos dois modos.
+
+    Returns:
+        Chamadas por segundo de cada modo
+    """
+    with tempfile.TemporaryDirectory() as diretorio:
+        resultados = {}
+
+        # Modo antigo: banco com journal padrão, conexão por chamada
+        db_antigo = Path(diretorio) / "antigo.db"
+        reporter = StatusReporter(str(db_antigo))
+        for i in range(threads):
+            reporter.reportar_inicio(f"modulo_{i}", "teste", "media")
+        reporter.fechar()
+        with sqlite3.connect(db_antigo) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        resultados["conexao_por_chamada"] = _medir(
+            threads, chamadas, _progresso_conexao_por_chamada(db_antigo), _status_conexao_por_chamada(db_antigo)
+        )
+
+        # Modo atual: pool do StatusReporter
+        reporter = StatusReporter(str(Path(diretorio) / "pool.db"), tamanho_pool=threads)
+        for i in range(threads):
+            reporter.reportar_inicio(f"modulo_{i}", "teste", "media")
+        resultados["pool_conexoes"] = _medir(
+            threads, chamadas, reporter.reportar_progresso, reporter.obter_status_modulo
+        )
+        reporter.fechar()
+
+        return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do StatusReporter")
+    parser.add_argument("--threads", type=int, default=8, help="Módulos simultâneos")
+    parser.add_argument("--chamadas", type=int, default=500, help="Atualizações por módulo")
+    args = parser.parse_args()
+
+    resultados = executar(args.threads, args.chamadas)
+    base = resultados["conexao_por_chamada"]
+    for modo, vazao in resultados.items():
+        print(f"  {modo:22s} {vazao:10.0f} chamadas/s  ({vazao / base:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
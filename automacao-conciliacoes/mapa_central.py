@@ -11,10 +11,11 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import importlib.util
 import subprocess
 
@@ -22,7 +23,9 @@ import subprocess
 sys.path.append(str(Path(__file__).parent))
 
 from shared.status_reporter import StatusReporter, MapaCentralAPI
-from shared.base_conciliacao import BaseConciliacao
+from shared.base_conciliacao import BaseConciliacao, VARIAVEL_TIMEOUT_EXECUCAO
+from shared.pool_workers import PoolWorkers
+from shared.agendador import AgendadorModulos
 
 
 class MapaCentral:
@@ -33,19 +36,27 @@ class MapaCentral:
         config (dict): Configurações globais
         status_reporter (StatusReporter): Reporter de status
         api (MapaCentralAPI): API para comunicação
+        modo_execucao (str): "subprocesso" (um interpretador por módulo) ou
+            "pool" (workers pré-aquecidos)
         logger (logging.Logger): Logger principal
     """
     
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(self, config_path: str = "config.json", modo_execucao: Optional[str] = None):
         """
         Inicializa o mapa central.
         
         Args:
             config_path: Caminho para arquivo de configuração
+            modo_execucao: Sobrepõe `configuracao.modo_execucao`
         """
         self.config = self._carregar_configuracao(config_path)
+        self.modo_execucao = modo_execucao or self.config.get("configuracao", {}).get("modo_execucao", "subprocesso")
+        self._pool_workers: Optional[PoolWorkers] = None
         self.status_reporter = StatusReporter()
-        self.api = MapaCentralAPI()
+        self.api = MapaCentralAPI(
+            self.status_reporter,
+            max_staleness_segundos=self.config.get("configuracao", {}).get("max_staleness_dashboard", 2.0)
+        )
         self.logger = self._configurar_logger()
         
         self.logger.info("🗺️ Mapa Central de Controle inicializado")
@@ -115,7 +126,8 @@ class MapaCentral:
             "configuracao": {
                 "timeout_execucao": 300,
                 "max_execucoes_paralelas": 3,
-                "retry_attempts": 2
+                "retry_attempts": 2,
+                "modo_execucao": "subprocesso"
             },
             "conciliacoes": {}
         }
@@ -156,6 +168,7 @@ class MapaCentral:
                         "diretorio": str(modulo_dir),
                         "categoria": config.get("modulo", {}).get("categoria", "outras"),
                         "criticidade": config.get("modulo", {}).get("criticidade", "media"),
+                        "depende_de": config.get("modulo", {}).get("depende_de", []),
                         "config": config
                     })
         
@@ -163,6 +176,42 @@ class MapaCentral:
         return modulos
     
     async def executar_modulo(self, modulo: Dict[str, Any], data_referencia: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Executa um módulo específico de conciliação e avalia os alertas.
+        
+        Args:
+            modulo: Informações do módulo
+            data_referencia: Data de referência para execução
+            
+        Returns:
+            Resultados da execução
+        """
+        resultado = await self._executar_modulo(modulo, data_referencia)
+        # Alertas avaliados onde o status é gravado, não na leitura do dashboard
+        await self._avaliar_alertas()
+        return resultado
+    
+    async def _avaliar_alertas(self) -> None:
+        """
+        Avalia os alertas em uma thread, sem bloquear o laço de eventos
+        enquanto espera o lock de escrita do banco.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.api.avaliar_alertas)
+    
+    def iniciar_avaliacao_alertas(self) -> None:
+        """
+        Inicia a avaliação periódica de alertas durante uma execução de módulos.
+        
+        Usa `configuracao.intervalo_avaliacao_alertas` (0 desativa), para que
+        prazos de inatividade vençam mesmo sem novas gravações. Comandos
+        avulsos (--status, --relatorio...) não precisam dela; `encerrar` a
+        interrompe.
+        """
+        self.api.iniciar_avaliacao_periodica(
+            self.config.get("configuracao", {}).get("intervalo_avaliacao_alertas", 60.0)
+        )
+    
+    async def _executar_modulo(self, modulo: Dict[str, Any], data_referencia: Optional[str] = None) -> Dict[str, Any]:
         """
         Executa um módulo específico de conciliação.
         
@@ -174,6 +223,7 @@ class MapaCentral:
             Resultados da execução
         """
         nome_modulo = modulo["nome"]
+        inicio = datetime.now()
         
         try:
             self.logger.info(f"🚀 Iniciando execução: {nome_modulo}")
@@ -192,40 +242,33 @@ class MapaCentral:
                 modulo["criticidade"]
             )
             
-            # Executar módulo via subprocess para isolamento
-            cmd = [
-                sys.executable,
-                modulo["caminho"]
-            ]
-            
-            if data_referencia:
-                cmd.extend(["--data", data_referencia])
+            argumentos = ["--data", data_referencia] if data_referencia else []
             
             # Executar com timeout
             timeout = self.config.get("configuracao", {}).get("timeout_execucao", 300)
             
-            processo = await asyncio.create_subprocess_exec(
-                *cmd,
-                cwd=modulo["diretorio"],
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    processo.communicate(),
-                    timeout=timeout
-                )
+                # O módulo dimensiona buscas longas pelo timeout efetivo do orquestrador
+                ambiente = {VARIAVEL_TIMEOUT_EXECUCAO: str(timeout)}
+                if self.modo_execucao == "pool":
+                    codigo_saida, stdout, stderr = await self._executar_em_pool(modulo, argumentos, timeout, ambiente)
+                else:
+                    codigo_saida, stdout, stderr = await self._executar_em_subprocesso(
+                        modulo, argumentos, timeout, ambiente
+                    )
+                
+                metricas = {"tempo_execucao": (datetime.now() - inicio).total_seconds()}
                 
-                if processo.returncode == 0:
+                if codigo_saida == 0:
                     # Sucesso
                     resultado = {
                         "status": "sucesso",
                         "modulo": nome_modulo,
-                        "stdout": stdout.decode('utf-8'),
-                        "stderr": stderr.decode('utf-8'),
-                        "codigo_saida": processo.returncode,
-                        "data_referencia": data_referencia or datetime.now().strftime("%Y-%m-%d")
+                        "stdout": stdout,
+                        "stderr": stderr,
+                        "codigo_saida": codigo_saida,
+                        "data_referencia": data_referencia or datetime.now().strftime("%Y-%m-%d"),
+                        "metricas": metricas
                     }
                     
                     self.status_reporter.reportar_sucesso(nome_modulo, resultado)
@@ -233,7 +276,7 @@ class MapaCentral:
                     
                 else:
                     # Erro
-                    erro = stderr.decode('utf-8') or "Erro desconhecido"
+                    erro = stderr or "Erro desconhecido"
                     self.status_reporter.reportar_erro(nome_modulo, erro)
                     self.logger.error(f"❌ Erro: {nome_modulo} - {erro}")
                     
@@ -241,14 +284,14 @@ class MapaCentral:
                         "status": "erro",
                         "modulo": nome_modulo,
                         "erro": erro,
-                        "codigo_saida": processo.returncode
+                        "codigo_saida": codigo_saida,
+                        "metricas": metricas
                     }
                 
                 return resultado
                 
             except asyncio.TimeoutError:
                 # Timeout
-                processo.kill()
                 erro = f"Timeout após {timeout} segundos"
                 self.status_reporter.reportar_erro(nome_modulo, erro)
                 self.logger.error(f"⏰ Timeout: {nome_modulo}")
@@ -270,6 +313,84 @@ class MapaCentral:
                 "erro": erro
             }
     
+    async def _executar_em_subprocesso(self, modulo: Dict[str, Any], argumentos: List[str],
+                                       timeout: float, ambiente: Optional[Dict[str, str]] = None
+                                       ) -> Tuple[int, str, str]:
+        """
+        Executa o script do módulo em um novo interpretador.
+        
+        Args:
+            modulo: Informações do módulo
+            argumentos: Argumentos de linha de comando do script
+            timeout: Tempo máximo da execução em segundos
+            ambiente: Variáveis de ambiente adicionais da execução
+            
+        Returns:
+            Código de saída, stdout e stderr
+            
+        Raises:
+            asyncio.TimeoutError: Se a execução exceder o timeout (o processo é morto)
+        """
+        processo = await asyncio.create_subprocess_exec(
+            sys.executable,
+            # Caminho absoluto: o processo roda com cwd no diretório do módulo
+            str(Path(modulo["caminho"]).resolve()),
+            *argumentos,
+            cwd=modulo["diretorio"],
+            env={**os.environ, **(ambiente or {})},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(processo.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            processo.kill()
+            raise
+        
+        return processo.returncode, stdout.decode('utf-8'), stderr.decode('utf-8')
+    
+    async def _executar_em_pool(self, modulo: Dict[str, Any], argumentos: List[str],
+                                timeout: float, ambiente: Optional[Dict[str, str]] = None
+                                ) -> Tuple[int, str, str]:
+        """
+        Executa o script do módulo em um worker pré-aquecido.
+        
+        Args:
+            modulo: Informações do módulo
+            argumentos: Argumentos de linha de comando do script
+            timeout: Tempo máximo da execução em segundos
+            ambiente: Variáveis de ambiente adicionais da execução
+            
+        Returns:
+            Código de saída, stdout e stderr
+            
+        Raises:
+            asyncio.TimeoutError: Se a execução exceder o timeout (o worker é substituído)
+        """
+        if self._pool_workers is None:
+            configuracao = self.config.get("configuracao", {})
+            self._pool_workers = PoolWorkers(
+                tamanho=configuracao.get("max_execucoes_paralelas", 3),
+                modulos_pre_importados=configuracao.get("modulos_pre_importados"),
+                max_tarefas_por_worker=configuracao.get("max_tarefas_por_worker", 0)
+            )
+        
+        resultado = await self._pool_workers.executar(
+            modulo["caminho"], modulo["diretorio"], argumentos, timeout, ambiente
+        )
+        return resultado["codigo_saida"], resultado["stdout"], resultado["stderr"]
+    
+    async def encerrar(self) -> None:
+        """
+        Libera os recursos de execução (workers do pool, se criados, e a
+        avaliação periódica de alertas).
+        """
+        self.api.parar_avaliacao_periodica()
+        if self._pool_workers is not None:
+            await self._pool_workers.encerrar()
+            self._pool_workers = None
+    
     async def executar_todos_modulos(self, data_referencia: Optional[str] = None) -> Dict[str, Any]:
         """
         Executa todos os módulos de conciliação.
@@ -287,32 +408,48 @@ class MapaCentral:
             self.logger.warning("⚠️ Nenhum módulo encontrado")
             return {"status": "erro", "mensagem": "Nenhum módulo encontrado"}
         
+        # Ordenar pelas dependências declaradas, priorizando o caminho crítico
+        duracoes = self.status_reporter.obter_duracoes_esperadas([m["nome"] for m in modulos])
+        try:
+            agendador = AgendadorModulos(modulos, duracoes)
+        except ValueError as e:
+            self.logger.error(f"❌ {e}")
+            return {"status": "erro", "mensagem": str(e)}
+        
+        caminho_critico = agendador.caminho_critico()
+        self.logger.info(
+            f"🧭 Caminho crítico: {' → '.join(caminho_critico)} "
+            f"(~{agendador.prioridades[caminho_critico[0]]:.0f}s)"
+        )
+        
         # Configurar limite de execuções paralelas
         max_paralelas = self.config.get("configuracao", {}).get("max_execucoes_paralelas", 3)
-        semaforo = asyncio.Semaphore(max_paralelas)
-        
-        async def executar_com_semaforo(modulo):
-            async with semaforo:
-                return await self.executar_modulo(modulo, data_referencia)
         
         # Executar módulos
         inicio = datetime.now()
-        tarefas = [executar_com_semaforo(modulo) for modulo in modulos]
-        resultados = await asyncio.gather(*tarefas, return_exceptions=True)
+        previsao = self._prever_prazo(agendador, max_paralelas, inicio)
+        resultados = await agendador.executar(
+            lambda modulo: self.executar_modulo(modulo, data_referencia),
+            max_paralelas,
+            ao_ignorar=self._reportar_ignorado
+        )
+        if any(resultado.get("status") == "ignorado" for resultado in resultados):
+            await self._avaliar_alertas()
         fim = datetime.now()
         
         # Consolidar resultados
         sucessos = 0
         erros = 0
         timeouts = 0
+        ignorados = 0
         
         for resultado in resultados:
-            if isinstance(resultado, Exception):
-                erros += 1
-            elif resultado.get("status") == "sucesso":
+            if resultado.get("status") == "sucesso":
                 sucessos += 1
             elif resultado.get("status") == "timeout":
                 timeouts += 1
+            elif resultado.get("status") == "ignorado":
+                ignorados += 1
             else:
                 erros += 1
         
@@ -323,8 +460,10 @@ class MapaCentral:
             "sucessos": sucessos,
             "erros": erros,
             "timeouts": timeouts,
+            "ignorados": ignorados,
             "taxa_sucesso": (sucessos / len(modulos) * 100) if modulos else 0,
             "resultados_detalhados": resultados,
+            "previsao": previsao,
             "data_referencia": data_referencia or datetime.now().strftime("%Y-%m-%d")
         }
         
@@ -332,6 +471,87 @@ class MapaCentral:
         
         return consolidado
     
+    def _prever_prazo(self, agendador: AgendadorModulos, max_paralelas: int, inicio: datetime) -> Dict[str, Any]:
+        """
+        Prevê o término da execução e compara com `configuracao.horario_execucao`.
+        
+        Args:
+            agendador: Agendador com os módulos e durações esperadas
+            max_paralelas: Máximo de módulos executando ao mesmo tempo
+            inicio: Instante de início da execução
+            
+        Returns:
+            Dicionário com duração e término previstos, o prazo (se configurado),
+            se o prazo já havia passado no início, se o prazo deve ser perdido e
+            os módulos previstos para depois dele
+        """
+        simulacao = agendador.simular(max_paralelas)
+        termino_previsto = inicio + timedelta(seconds=simulacao["makespan"])
+        
+        previsao = {
+            "duracao_prevista": simulacao["makespan"],
+            "termino_previsto": termino_previsto.isoformat(),
+            "prazo": None,
+            "prazo_ja_passado": False,
+            "prazo_em_risco": False,
+            "modulos_apos_prazo": []
+        }
+        
+        horario = self.config.get("configuracao", {}).get("horario_execucao")
+        if not horario:
+            self.logger.info(f"⏱️ Término previsto: {termino_previsto:%H:%M:%S} ({simulacao['makespan']:.0f}s)")
+            return previsao
+        
+        try:
+            horas, minutos = (int(parte) for parte in horario.split(":"))
+            prazo = inicio.replace(hour=horas, minute=minutos, second=0, microsecond=0)
+        except ValueError:
+            self.logger.warning(f"⚠️ horario_execucao inválido: {horario}")
+            return previsao
+        
+        previsao["prazo"] = prazo.isoformat()
+        
+        if inicio >= prazo:
+            # Execução fora do horário (reprocessamento, execução manual): não há o que prever
+            previsao["prazo_ja_passado"] = True
+            self.logger.warning(
+                f"⏰ Execução iniciada após o prazo das {horario}; "
+                f"término previsto às {termino_previsto:%H:%M:%S}"
+            )
+            return previsao
+        
+        previsao["modulos_apos_prazo"] = sorted(
+            (nome for nome, fim in simulacao["termino"].items() if inicio + timedelta(seconds=fim) > prazo),
+            key=simulacao["termino"].__getitem__
+        )
+        previsao["prazo_em_risco"] = bool(previsao["modulos_apos_prazo"])
+        
+        if previsao["prazo_em_risco"]:
+            self.logger.warning(
+                f"⏰ Prazo das {horario} deve ser perdido: término previsto às {termino_previsto:%H:%M:%S}; "
+                f"{len(previsao['modulos_apos_prazo'])} módulos previstos após o prazo "
+                f"({', '.join(previsao['modulos_apos_prazo'])})"
+            )
+        else:
+            self.logger.info(f"⏱️ Término previsto às {termino_previsto:%H:%M:%S}, dentro do prazo das {horario}")
+        
+        return previsao
+    
+    def _reportar_ignorado(self, modulo: Dict[str, Any], motivo: str) -> None:
+        """
+        Registra um módulo que não foi executado porque uma dependência falhou.
+        
+        Os alertas dos módulos ignorados são avaliados uma vez, ao final da
+        execução.
+        
+        Args:
+            modulo: Informações do módulo
+            motivo: Motivo de o módulo ter sido ignorado
+        """
+        self.status_reporter.reportar_ignorado(
+            modulo["nome"], motivo, modulo["categoria"], modulo["criticidade"]
+        )
+    
     async def executar_por_categoria(self, categoria: str, data_referencia: Optional[str] = None) -> Dict[str, Any]:
         """
         Executa módulos de uma categoria específica.
@@ -352,19 +572,33 @@ class MapaCentral:
             self.logger.warning(f"⚠️ Nenhum módulo encontrado para categoria: {categoria}")
             return {"status": "erro", "mensagem": f"Nenhum módulo encontrado para categoria: {categoria}"}
         
+        # Dependências fora da categoria não fazem parte desta execução
+        duracoes = self.status_reporter.obter_duracoes_esperadas([m["nome"] for m in modulos_categoria])
+        try:
+            agendador = AgendadorModulos(modulos_categoria, duracoes)
+        except ValueError as e:
+            self.logger.error(f"❌ {e}")
+            return {"status": "erro", "mensagem": str(e)}
+        
         # Executar módulos da categoria
-        resultados = []
-        for modulo in modulos_categoria:
-            resultado = await self.executar_modulo(modulo, data_referencia)
-            resultados.append(resultado)
+        max_paralelas = self.config.get("configuracao", {}).get("max_execucoes_paralelas", 3)
+        resultados = await agendador.executar(
+            lambda modulo: self.executar_modulo(modulo, data_referencia),
+            max_paralelas,
+            ao_ignorar=self._reportar_ignorado
+        )
+        if any(resultado.get("status") == "ignorado" for resultado in resultados):
+            await self._avaliar_alertas()
         
         # Consolidar resultados
         sucessos = len([r for r in resultados if r.get("status") == "sucesso"])
+        ignorados = len([r for r in resultados if r.get("status") == "ignorado"])
         
         return {
             "categoria": categoria,
             "total_modulos": len(modulos_categoria),
             "sucessos": sucessos,
+            "ignorados": ignorados,
             "taxa_sucesso": (sucessos / len(modulos_categoria) * 100) if modulos_categoria else 0,
             "resultados": resultados,
             "data_referencia": data_referencia or datetime.now().strftime("%Y-%m-%d")
@@ -378,7 +612,8 @@ class MapaCentral:
             Caminho do arquivo de relatório gerado
         """
         try:
-            # Obter dados do dashboard
+            # Obter dados do dashboard, com os alertas em dia
+            self.api.avaliar_alertas()
             dados = self.api.obter_dashboard_data()
             
             # Criar diretório de relatórios
@@ -400,13 +635,19 @@ class MapaCentral:
             self.logger.error(f"❌ Erro ao gerar relatório: {e}")
             raise
     
-    def obter_status_dashboard(self) -> Dict[str, Any]:
+    def obter_status_dashboard(self, avaliar_alertas: bool = False) -> Dict[str, Any]:
         """
         Obtém dados para o dashboard em tempo real.
         
+        Args:
+            avaliar_alertas: Se True, avalia os alertas antes da leitura
+                (comandos avulsos, sem a avaliação periódica em andamento)
+            
         Returns:
             Dados formatados para dashboard
         """
+        if avaliar_alertas:
+            self.api.avaliar_alertas()
         return self.api.obter_dashboard_data()
 
 
@@ -422,6 +663,8 @@ Exemplos de uso:
   python mapa_central.py --modulos "Mod1,Mod2"          # Executar módulos específicos
   python mapa_central.py --status                       # Mostrar status atual
   python mapa_central.py --relatorio                    # Gerar relatório consolidado
+  python mapa_central.py --all --modo-execucao pool      # Executar com workers pré-aquecidos
+  python mapa_central.py --compactar-banco              # Manutenção: VACUUM do banco de status
         """
     )
     
@@ -468,10 +711,23 @@ Exemplos de uso:
         help='Descobrir e listar módulos disponíveis'
     )
     
+    parser.add_argument(
+        '--compactar-banco',
+        action='store_true',
+        help='Manutenção: ativar auto_vacuum incremental com um VACUUM completo do banco de status'
+    )
+    
+    parser.add_argument(
+        '--modo-execucao',
+        type=str,
+        choices=['subprocesso', 'pool'],
+        help='Executar cada módulo em um novo interpretador ou em workers pré-aquecidos'
+    )
+    
     args = parser.parse_args()
     
     # Inicializar mapa central
-    mapa = MapaCentral()
+    mapa = MapaCentral(modo_execucao=args.modo_execucao)
     
     try:
         if args.descobrir:
@@ -483,7 +739,7 @@ Exemplos de uso:
         
         elif args.status:
             # Mostrar status
-            dados = mapa.obter_status_dashboard()
+            dados = mapa.obter_status_dashboard(avaliar_alertas=True)
             print(f"\n📊 Status do Sistema:")
             print(f"  Total de módulos: {dados.get('estatisticas', {}).get('total_modulos', 0)}")
             print(f"  Sucessos: {dados.get('estatisticas', {}).get('modulos_sucesso', 0)}")
@@ -491,6 +747,13 @@ Exemplos de uso:
             print(f"  Executando: {dados.get('estatisticas', {}).get('modulos_executando', 0)}")
             print(f"  Taxa de sucesso: {dados.get('estatisticas', {}).get('taxa_sucesso', 0):.1f}%")
         
+        elif args.compactar_banco:
+            # Manutenção do banco de status
+            if mapa.status_reporter.ativar_auto_vacuum():
+                print("\n🧹 Banco de status compactado")
+            else:
+                print("\n⚠️ Banco de status ocupado; tente novamente fora do horário de execução")
+        
         elif args.relatorio:
             # Gerar relatório
             arquivo = mapa.gerar_relatorio_consolidado()
@@ -498,14 +761,22 @@ Exemplos de uso:
         
         elif args.all:
             # Executar todos
+            mapa.iniciar_avaliacao_alertas()
             resultado = await mapa.executar_todos_modulos(args.data)
             print(f"\n✅ Execução concluída:")
             print(f"  Sucessos: {resultado['sucessos']}/{resultado['total_modulos']}")
+            if resultado.get('ignorados'):
+                print(f"  Ignorados por dependência: {resultado['ignorados']}")
+            if resultado.get('previsao', {}).get('prazo_ja_passado'):
+                print(f"  ⏰ Execução iniciada após o prazo das {resultado['previsao']['prazo'][11:16]}")
+            elif resultado.get('previsao', {}).get('prazo_em_risco'):
+                print(f"  ⏰ Prazo previsto para ser perdido: término previsto {resultado['previsao']['termino_previsto']}")
             print(f"  Taxa de sucesso: {resultado['taxa_sucesso']:.1f}%")
             print(f"  Tempo total: {resultado['tempo_total_execucao']:.1f}s")
         
         elif args.categoria:
             # Executar categoria
+            mapa.iniciar_avaliacao_alertas()
             resultado = await mapa.executar_por_categoria(args.categoria, args.data)
             print(f"\n✅ Categoria '{args.categoria}' executada:")
             print(f"  Sucessos: {resultado['sucessos']}/{resultado['total_modulos']}")
@@ -513,6 +784,7 @@ Exemplos de uso:
         
         elif args.modulos:
             # Executar módulos específicos
+            mapa.iniciar_avaliacao_alertas()
             nomes_modulos = [nome.strip() for nome in args.modulos.split(',')]
             modulos_disponiveis = mapa.descobrir_modulos()
             
@@ -533,6 +805,8 @@ Exemplos de uso:
     except Exception as e:
         print(f"\n❌ Erro: {e}")
         sys.exit(1)
+    finally:
+        await mapa.encerrar()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Agendamento dos módulos de conciliação respeitando dependências.
+
+Cada módulo pode declarar em `config.json` (seção "modulo") a lista
+`depende_de`. Os módulos formam um grafo acíclico: um módulo é iniciado
+assim que todas as suas dependências terminam com sucesso. Entre os
+prontos, sai primeiro o de maior criticidade (herdada dos módulos a
+jusante) e, no empate, o de maior caminho crítico (a maior soma de
+durações esperadas dele até o fim da cadeia de dependentes). Se uma
+dependência falha, todos os módulos a jusante são ignorados sem serem
+executados.
+"""
+
+import asyncio
+import heapq
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+
+
+# Peso de cada criticidade na fila de prontos (maior sai primeiro)
+PESOS_CRITICIDADE = {"critica": 3, "alta": 2, "media": 1, "baixa": 0}
+
+
+class AgendadorModulos:
+    """
+    Agendador de módulos em grafo de dependências.
+
+    Attributes:
+        modulos (dict): Nome -> informações do módulo (como em `descobrir_modulos`)
+        dependencias (dict): Nome -> módulos dos quais depende
+        dependentes (dict): Nome -> módulos que dependem dele
+        duracoes (dict): Nome -> duração esperada em segundos
+        prioridades (dict): Nome -> duração do caminho crítico a partir do módulo
+        criticidades (dict): Nome -> peso da maior criticidade entre o módulo
+            e seus dependentes
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, modulos: List[Dict[str, Any]], duracoes: Optional[Dict[str, float]] = None,
+                 duracao_padrao: Optional[float] = None):
+        """
+        Monta o grafo de dependências e calcula as prioridades.
+
+        Args:
+            modulos: Módulos a executar, cada um com "nome" e "depende_de"
+            duracoes: Duração esperada de cada módulo em segundos
+            duracao_padrao: Duração dos módulos sem histórico (padrão: média
+                das durações conhecidas)
+
+        Raises:
+            ValueError: Se as dependências formarem um ciclo
+        """
+        self.logger = logging.getLogger("agendador")
+        self.modulos = {modulo["nome"]: modulo for modulo in modulos}
+
+        self.dependencias: Dict[str, List[str]] = {}
+        self.dependentes: Dict[str, List[str]] = {nome: [] for nome in self.modulos}
+        for nome, modulo in self.modulos.items():
+            dependencias = []
+            for dependencia in modulo.get("depende_de") or []:
+                if dependencia not in self.modulos:
+                    self.logger.warning(f"⚠️ {nome} depende de {dependencia}, que não está nesta execução")
+                elif dependencia not in dependencias:
+                    dependencias.append(dependencia)
+                    self.dependentes[dependencia].append(nome)
+            self.dependencias[nome] = dependencias
+
+        self._ordem = self._ordenar_topologicamente()
+
+        duracoes = duracoes or {}
+        if duracao_padrao is None:
+            conhecidas = [duracoes[nome] for nome in self.modulos if nome in duracoes]
+            duracao_padrao = sum(conhecidas) / len(conhecidas) if conhecidas else 1.0
+        self.duracoes = {nome: duracoes.get(nome, duracao_padrao) for nome in self.modulos}
+
+        # Um módulo herda a criticidade dos que dependem dele: atrasá-lo atrasa todos
+        self.prioridades: Dict[str, float] = {}
+        self.criticidades: Dict[str, int] = {}
+        for nome in reversed(self._ordem):
+            self.prioridades[nome] = self.duracoes[nome] + max(
+                (self.prioridades[dependente] for dependente in self.dependentes[nome]), default=0.0
+            )
+            self.criticidades[nome] = max(
+                [PESOS_CRITICIDADE.get(self.modulos[nome].get("criticidade"), 1)]
+                + [self.criticidades[dependente] for dependente in self.dependentes[nome]]
+            )
+        self._indice = {nome: i for i, nome in enumerate(self.modulos)}
+
+    def _ordenar_topologicamente(self) -> List[str]:
+        """
+        Ordena os módulos de forma que dependências venham antes.
+
+        Returns:
+            Nomes dos módulos em ordem topológica
+
+        Raises:
+            ValueError: Se as dependências formarem um ciclo
+        """
+        pendentes = {nome: len(dependencias) for nome, dependencias in self.dependencias.items()}
+        fila = [nome for nome, total in pendentes.items() if total == 0]
+        ordem = []
+
+        while fila:
+            nome = fila.pop()
+            ordem.append(nome)
+            for dependente in self.dependentes[nome]:
+                pendentes[dependente] -= 1
+                if pendentes[dependente] == 0:
+                    fila.append(dependente)
+
+        if len(ordem) < len(self.modulos):
+            em_ciclo = sorted(nome for nome, total in pendentes.items() if total > 0)
+            raise ValueError(f"Ciclo de dependências entre os módulos: {', '.join(em_ciclo)}")
+
+        return ordem
+
+    def _chave(self, nome: str) -> Tuple[int, float, int, str]:
+        """
+        Calcula a chave de um módulo na fila de prontos (menor sai primeiro).
+
+        Args:
+            nome: Nome do módulo
+
+        Returns:
+            Tupla (criticidade, caminho crítico, ordem de descoberta, nome)
+        """
+        return (-self.criticidades[nome], -self.prioridades[nome], self._indice[nome], nome)
+
+    def simular(self, max_paralelas: int = 3) -> Dict[str, Any]:
+        """
+        Prevê a execução com as durações esperadas, supondo que tudo tenha sucesso.
+
+        Usa a mesma política de `executar`: ao liberar uma vaga, inicia o
+        primeiro módulo pronto na ordem de prioridade.
+
+        Args:
+            max_paralelas: Máximo de módulos executando ao mesmo tempo
+
+        Returns:
+            Dicionário com a duração total prevista (`makespan`) e o término
+            previsto de cada módulo em segundos desde o início (`termino`)
+        """
+        pendentes = {nome: len(dependencias) for nome, dependencias in self.dependencias.items()}
+        prontos = [self._chave(nome) for nome, total in pendentes.items() if total == 0]
+        heapq.heapify(prontos)
+
+        em_execucao: List[Tuple[float, int, str]] = []
+        termino: Dict[str, float] = {}
+        agora = 0.0
+
+        while prontos or em_execucao:
+            while prontos and len(em_execucao) < max(1, max_paralelas):
+                nome = heapq.heappop(prontos)[-1]
+                heapq.heappush(em_execucao, (agora + self.duracoes[nome], self._indice[nome], nome))
+
+            agora, _, nome = heapq.heappop(em_execucao)
+            termino[nome] = agora
+            for dependente in self.dependentes[nome]:
+                pendentes[dependente] -= 1
+                if pendentes[dependente] == 0:
+                    heapq.heappush(prontos, self._chave(dependente))
+
+        return {"makespan": agora, "termino": termino}
+
+    def caminho_critico(self) -> List[str]:
+        """
+        Retorna a cadeia de módulos de maior duração esperada.
+
+        Returns:
+            Nomes dos módulos do caminho crítico, do primeiro ao último
+        """
+        if not self.modulos:
+            return []
+
+        iniciais = [nome for nome in self.modulos if not self.dependencias[nome]]
+        atual = max(iniciais, key=self.prioridades.__getitem__)
+        caminho = [atual]
+        while self.dependentes[atual]:
+            atual = max(self.dependentes[atual], key=self.prioridades.__getitem__)
+            caminho.append(atual)
+        return caminho
+
+    def _ignorar_dependentes(self, nome: str, resultados: Dict[str, Dict[str, Any]],
+                             ao_ignorar: Optional[Callable[[Dict[str, Any], str], None]]) -> None:
+        """
+        Marca como ignorados todos os módulos a jusante de um módulo que falhou.
+
+        Args:
+            nome: Módulo que falhou
+            resultados: Resultados já obtidos (atualizado no lugar)
+            ao_ignorar: Chamado com o módulo e o motivo de cada módulo ignorado
+        """
+        motivo = f"dependência {nome} não concluída com sucesso"
+        fila = list(self.dependentes[nome])
+
+        while fila:
+            dependente = fila.pop()
+            if dependente in resultados:
+                continue
+
+            resultados[dependente] = {
+                "status": "ignorado",
+                "modulo": dependente,
+                "motivo": motivo
+            }
+            if ao_ignorar is not None:
+                ao_ignorar(self.modulos[dependente], motivo)
+            fila.extend(self.dependentes[dependente])
+
+    async def executar(self, executar_modulo: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                       max_paralelas: int = 3,
+                       ao_ignorar: Optional[Callable[[Dict[str, Any], str], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Executa os módulos respeitando dependências e o limite de paralelismo.
+
+        Um módulo conta como concluído com sucesso quando o resultado tem
+        status "sucesso"; qualquer outro status (ou exceção) ignora os
+        módulos a jusante.
+
+        Args:
+            executar_modulo: Corrotina que executa um módulo e retorna o resultado
+            max_paralelas: Máximo de módulos executando ao mesmo tempo
+            ao_ignorar: Chamado com o módulo e o motivo de cada módulo ignorado
+
+        Returns:
+            Resultados na ordem dos módulos recebidos
+        """
+        pendentes = {nome: len(dependencias) for nome, dependencias in self.dependencias.items()}
+        prontos = [self._chave(nome) for nome, total in pendentes.items() if total == 0]
+        heapq.heapify(prontos)
+
+        resultados: Dict[str, Dict[str, Any]] = {}
+        em_execucao: Dict[asyncio.Future, str] = {}
+
+        try:
+            while prontos or em_execucao:
+                while prontos and len(em_execucao) < max(1, max_paralelas):
+                    nome = heapq.heappop(prontos)[-1]
+                    em_execucao[asyncio.ensure_future(executar_modulo(self.modulos[nome]))] = nome
+
+                concluidas, _ = await asyncio.wait(em_execucao, return_when=asyncio.FIRST_COMPLETED)
+
+                for tarefa in concluidas:
+                    nome = em_execucao.pop(tarefa)
+                    try:
+                        resultado = tarefa.result()
+                    except Exception as e:
+                        resultado = {"status": "erro", "modulo": nome, "erro": str(e)}
+                    resultados[nome] = resultado
+
+                    if resultado.get("status") != "sucesso":
+                        self._ignorar_dependentes(nome, resultados, ao_ignorar)
+                        continue
+
+                    for dependente in self.dependentes[nome]:
+                        pendentes[dependente] -= 1
+                        if pendentes[dependente] == 0:
+                            heapq.heappush(prontos, self._chave(dependente))
+        finally:
+            for tarefa in em_execucao:
+                tarefa.cancel()
+
+        return [resultados[nome] for nome in self.modulos]
@@ -8,13 +8,31 @@ mapa central de controle.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Iterable
 import logging
 import json
 import os
 from pathlib import Path
 
+import numpy as np
+
+from shared.cache_entradas import CacheEntradas, concatenar_arrays, para_array
+from shared.carregador_xlsx import CarregadorXlsx
+from shared.casamento_agregado import CasadorAgregado
+from shared.casamento_registros import CasadorRegistros
+from shared.detector_duplicatas import DetectorDuplicatas
+from shared.indice_ngramas import casar_aproximado
+from shared.motor_comparacao import MotorComparacao, montar_resultado_validacao
+from shared.particionamento import indices_particoes, particionar, mesclar_resultados, validar_particao
+from shared.validacao_datas import ValidadorDatas
+from shared.validacao_incremental import ValidacaoIncremental
+
+
+# Variável de ambiente com o timeout efetivo da execução, definida pelo mapa central
+VARIAVEL_TIMEOUT_EXECUCAO = "CONCILIACAO_TIMEOUT_EXECUCAO"
+
 
 class BaseConciliacao(ABC):
     """
@@ -42,6 +60,7 @@ class BaseConciliacao(ABC):
         self.criticidade = criticidade
         self.logger = self._configurar_logger()
         self.config = self._carregar_configuracao()
+        self._validador_datas: Optional[ValidadorDatas] = None
         
         self.logger.info(f"🚀 Inicializando módulo: {self.nome}")
     
@@ -120,12 +139,42 @@ class BaseConciliacao(ABC):
             "execucao": {
                 "timeout": 300,
                 "retry_attempts": 3,
-                "retry_delay": 5
+                "retry_delay": 5,
+                "tamanho_bloco": 50000,
+                "modo_incremental": False,
+                "chave_particao": None,
+                "processos": 0
             },
             "validacoes": {
                 "tolerancia_percentual": 0.01,
+                "tolerancia_absoluta": 0.0,
                 "verificar_duplicatas": True,
-                "validar_datas": True
+                "validar_datas": True,
+                "formatos_data": ["%Y-%m-%d", "%d/%m/%Y", "%Y%m%d", "%d-%m-%Y"],
+                "somente_dias_uteis": True,
+                "feriados": [],
+                "colunas_data": [],
+                "data_minima": None,
+                "data_maxima": None,
+                "colunas_chave": [],
+                "pares_colunas": {},
+                "limiar_similaridade": 0.6,
+                "duplicatas": {
+                    "usar_bloom": False,
+                    "capacidade_esperada": 50000000,
+                    "taxa_falsos_positivos": 0.01
+                },
+                "casamento_agregado": {
+                    "max_itens_grupo": 30,
+                    "max_tamanho_subconjunto": 6,
+                    "tempo_max_grupo": 2.0,
+                    "fracao_timeout": 0.5
+                }
+            },
+            "cache": {
+                "ativo": True,
+                "diretorio": "dados/cache",
+                "limite_mb": 2048
             },
             "saida": {
                 "gerar_relatorio": True,
@@ -176,6 +225,391 @@ class BaseConciliacao(ABC):
         """
         pass
     
+    def _ler_xlsx_em_blocos(self, caminho: str, aba: Optional[str] = None,
+                            colunas: Optional[List[str]] = None) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Lê uma planilha xlsx em streaming, em blocos colunares de tamanho fixo.
+        
+        O tamanho do bloco vem de `execucao.tamanho_bloco` na configuração.
+        
+        Args:
+            caminho: Caminho do arquivo xlsx
+            aba: Nome da aba (padrão: aba ativa)
+            colunas: Colunas a manter (padrão: todas)
+            
+        Yields:
+            Dicionário nome da coluna -> lista de valores do bloco
+        """
+        tamanho_bloco = self.config.get("execucao", {}).get("tamanho_bloco", 50000)
+        carregador = CarregadorXlsx(tamanho_bloco)
+        
+        self.logger.info(f"📁 Lendo planilha em blocos de {tamanho_bloco} linhas: {caminho}")
+        yield from carregador.ler_blocos(caminho, aba=aba, colunas=colunas)
+    
+    def _carregar_xlsx(self, caminho: str, aba: Optional[str] = None,
+                       colunas: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Carrega as colunas de uma planilha, reaproveitando o cache de entradas.
+        
+        Na primeira leitura a planilha é lida em blocos e gravada no cache
+        colunar (`cache` na configuração). Reexecuções com o mesmo arquivo
+        obtêm as colunas mapeadas em memória, sem interpretar o xlsx.
+        
+        Args:
+            caminho: Caminho do arquivo xlsx
+            aba: Nome da aba (padrão: aba ativa)
+            colunas: Colunas a manter (padrão: todas)
+            
+        Returns:
+            Dicionário nome da coluna -> array NumPy
+        """
+        config_cache = self.config.get("cache", {})
+        cache = None
+        chave = None
+        variante = json.dumps({"aba": aba, "colunas": colunas})
+        
+        if config_cache.get("ativo", True):
+            cache = CacheEntradas(
+                config_cache.get("diretorio", "dados/cache"),
+                int(config_cache.get("limite_mb", 2048) * 1024 ** 2)
+            )
+            chave = cache.impressao_digital(caminho, variante)
+            dados = cache.obter(caminho, variante, chave=chave)
+            if dados is not None:
+                return dados
+        
+        # Cada bloco vira array assim que é lido; só um bloco fica em listas Python
+        partes: Dict[str, List[np.ndarray]] = {}
+        for bloco in self._ler_xlsx_em_blocos(caminho, aba=aba, colunas=colunas):
+            for nome, valores in bloco.items():
+                partes.setdefault(nome, []).append(para_array(valores))
+        
+        dados = {nome: concatenar_arrays(arrays) for nome, arrays in partes.items()}
+        
+        if cache is not None:
+            cache.armazenar(caminho, dados, variante, chave=chave)
+        
+        return dados
+    
+    def _comparar_colunas(self, sistema: Dict[str, Any], fonte: Dict[str, Any],
+                          chaves: List[str], colunas_valor: List[str]) -> Dict[str, Any]:
+        """
+        Compara colunas do sistema e da fonte com o motor vetorizado.
+        
+        Aplica `validacoes.tolerancia_percentual` e `validacoes.tolerancia_absoluta`
+        da configuração do módulo a todos os registros de uma só vez.
+        
+        Args:
+            sistema: Colunas do sistema (nome da coluna -> valores)
+            fonte: Colunas da fonte (nome da coluna -> valores)
+            chaves: Colunas que compõem a chave de conciliação
+            colunas_valor: Colunas numéricas a comparar
+            
+        Returns:
+            Contagens e divergências no formato de `_executar_validacoes`
+        """
+        motor = MotorComparacao.a_partir_de_config(self.config)
+        return motor.comparar(sistema, fonte, chaves, colunas_valor)
+    
+    def _casar_registros(self, esquerda: List[Dict[str, Any]], direita: List[Dict[str, Any]],
+                         chaves: List[str], colunas_valor: List[str]) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+        """
+        Casa registros de dois lados por chave composta (hash join).
+        
+        Args:
+            esquerda: Registros do lado esquerdo (ex.: posições internas)
+            direita: Registros do lado direito (ex.: custódia)
+            chaves: Campos que compõem a chave (ex.: ["isin", "carteira", "data"])
+            colunas_valor: Campos numéricos comparados nos pares casados
+            
+        Returns:
+            Tupla (resultado no formato de `_executar_validacoes`, grupos
+            de registros casados, divergentes e exclusivos de cada lado)
+        """
+        inicio = datetime.now()
+        validacoes = self.config.get("validacoes", {})
+        
+        casador = CasadorRegistros(
+            chaves,
+            colunas_valor,
+            tolerancia_percentual=validacoes.get("tolerancia_percentual", 0.0),
+            tolerancia_absoluta=validacoes.get("tolerancia_absoluta", 0.0),
+            max_divergencias_detalhadas=validacoes.get("max_divergencias_detalhadas", 1000)
+        )
+        grupos = casador.casar(esquerda, direita)
+        
+        return casador.para_resultado_validacao(grupos, inicio), grupos
+    
+    def _validar_coluna_datas(self, valores: Any, data_minima: Optional[str] = None,
+                              data_maxima: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Valida uma coluna de datas inteira, conforme `validacoes.validar_datas`.
+        
+        Os textos distintos já interpretados ficam em cache na instância, de
+        modo que blocos seguintes da mesma planilha não os interpretam de novo.
+        
+        Args:
+            valores: Valores da coluna (textos, datas ou números seriais)
+            data_minima: Menor data aceita, YYYY-MM-DD
+            data_maxima: Maior data aceita, YYYY-MM-DD
+            
+        Returns:
+            Datas interpretadas, máscara `valida` e contagens, ou None se a
+            validação estiver desativada
+        """
+        validacoes = self.config.get("validacoes", {})
+        if not validacoes.get("validar_datas", True):
+            return None
+        
+        if self._validador_datas is None:
+            self._validador_datas = ValidadorDatas(
+                formatos=validacoes.get("formatos_data"),
+                somente_dias_uteis=validacoes.get("somente_dias_uteis", True),
+                feriados=validacoes.get("feriados", [])
+            )
+        
+        self._validador_datas.definir_intervalo(data_minima, data_maxima)
+        
+        return self._validador_datas.validar(valores)
+    
+    def _verificar_duplicatas(self, blocos: Iterable[Dict[str, Any]],
+                              chaves: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Detecta registros duplicados, conforme `validacoes.verificar_duplicatas`.
+        
+        Consome os blocos colunares (ex.: de `_ler_xlsx_em_blocos`) e agrupa
+        os registros pelo hash das colunas de chave. Com
+        `validacoes.duplicatas.usar_bloom`, usa filtro de Bloom e arquivo
+        temporário em disco para entradas muito grandes.
+        
+        Args:
+            blocos: Blocos colunares dos dados
+            chaves: Colunas de chave (padrão: `validacoes.colunas_chave`)
+            
+        Returns:
+            Resumo dos grupos duplicados ou None se a verificação estiver
+            desativada ou não houver colunas de chave
+        """
+        validacoes = self.config.get("validacoes", {})
+        if not validacoes.get("verificar_duplicatas", True):
+            return None
+        
+        chaves = chaves or validacoes.get("colunas_chave", [])
+        if not chaves:
+            self.logger.info("ℹ️ Verificação de duplicatas ignorada: nenhuma coluna de chave (validacoes.colunas_chave)")
+            return None
+        
+        config_duplicatas = validacoes.get("duplicatas", {})
+        
+        detector = DetectorDuplicatas(
+            chaves,
+            usar_bloom=config_duplicatas.get("usar_bloom", False),
+            capacidade_esperada=config_duplicatas.get("capacidade_esperada", 50000000),
+            taxa_falsos_positivos=config_duplicatas.get("taxa_falsos_positivos", 0.01),
+            max_grupos_detalhados=validacoes.get("max_divergencias_detalhadas", 1000)
+        )
+        
+        self.logger.info(f"🔁 Verificando duplicatas por {', '.join(chaves)}")
+        for bloco in blocos:
+            detector.adicionar_bloco(bloco)
+        
+        return detector.finalizar()
+    
+    def _casar_aproximado(self, esquerda: List[Dict[str, Any]], direita: List[Dict[str, Any]],
+                          campo_esquerda: str, campo_direita: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Casa por similaridade de texto os registros que sobraram do casamento exato.
+        
+        Tipicamente recebe `somente_esquerda` e `somente_direita` de
+        `_casar_registros`. Usa um índice de trigramas e o limiar
+        `validacoes.limiar_similaridade`.
+        
+        Args:
+            esquerda: Registros não casados do lado esquerdo
+            direita: Registros não casados do lado direito
+            campo_esquerda: Campo texto comparado (ex.: nome do ativo)
+            campo_direita: Campo texto do lado direito (padrão: o mesmo)
+            
+        Returns:
+            Pares encontrados e índices que continuam sem par
+        """
+        limiar = self.config.get("validacoes", {}).get("limiar_similaridade", 0.6)
+        return casar_aproximado(esquerda, direita, campo_esquerda, campo_direita, limiar=limiar)
+    
+    def _casar_agregado(self, esquerda: List[Dict[str, Any]], direita: List[Dict[str, Any]],
+                        chaves: List[str], coluna_valor: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Casa lançamentos que correspondem à soma de vários lançamentos do outro lado.
+        
+        O tempo total da busca é limitado a `fracao_timeout` de
+        `execucao.timeout`, para que grupos patológicos não levem o módulo
+        ao timeout do mapa central.
+        
+        Args:
+            esquerda: Registros do lado esquerdo (ex.: razão contábil)
+            direita: Registros do lado direito (ex.: linhas da fonte)
+            chaves: Campos usados para agrupar candidatos
+            coluna_valor: Campo numérico somado
+            
+        Returns:
+            Tupla (resultado no formato de `_executar_validacoes`,
+            casamentos e índices não casados de cada lado)
+        """
+        inicio = datetime.now()
+        validacoes = self.config.get("validacoes", {})
+        limites = validacoes.get("casamento_agregado", {})
+        timeout = self._timeout_execucao()
+        
+        casador = CasadorAgregado(
+            chaves,
+            coluna_valor,
+            tolerancia_percentual=validacoes.get("tolerancia_percentual", 0.0),
+            tolerancia_absoluta=validacoes.get("tolerancia_absoluta", 0.0),
+            max_itens_grupo=limites.get("max_itens_grupo", 30),
+            max_tamanho_subconjunto=limites.get("max_tamanho_subconjunto", 6),
+            tempo_max_grupo=limites.get("tempo_max_grupo", 2.0)
+        )
+        resultado = casador.casar(esquerda, direita, tempo_limite=timeout * limites.get("fracao_timeout", 0.5))
+        
+        return casador.para_resultado_validacao(resultado, len(esquerda), inicio), resultado
+    
+    def _timeout_execucao(self) -> float:
+        """
+        Retorna o tempo máximo da execução do módulo em segundos.
+        
+        Quando executado pelo mapa central, vale o timeout do orquestrador
+        (`configuracao.timeout_execucao`), recebido pela variável de ambiente
+        `VARIAVEL_TIMEOUT_EXECUCAO`; fora dele, `execucao.timeout` do módulo.
+        
+        Returns:
+            Timeout efetivo em segundos
+        """
+        padrao = float(self.config.get("execucao", {}).get("timeout", 300))
+        valor = os.environ.get(VARIAVEL_TIMEOUT_EXECUCAO)
+        if not valor:
+            return padrao
+        
+        try:
+            return float(valor)
+        except ValueError:
+            self.logger.warning(f"⚠️ {VARIAVEL_TIMEOUT_EXECUCAO} inválido ({valor}); usando execucao.timeout")
+            return padrao
+    
+    def _validar_linhas(self, colunas: Dict[str, Any]) -> Any:
+        """
+        Valida registro a registro um conjunto de colunas.
+        
+        Usado pelo modo incremental, que precisa do veredito de cada registro
+        para reaproveitá-lo no dia seguinte. A implementação padrão compara,
+        com as tolerâncias do módulo, os pares de colunas declarados em
+        `validacoes.pares_colunas` (coluna do sistema -> coluna da fonte).
+        Módulos com regras próprias podem sobrescrever este método.
+        
+        Args:
+            colunas: Colunas a validar (nome -> array NumPy)
+            
+        Returns:
+            Máscara booleana com True para registros válidos
+        """
+        pares = self.config.get("validacoes", {}).get("pares_colunas", {})
+        motor = MotorComparacao.a_partir_de_config(self.config)
+        return motor.validar_pares(colunas, pares)
+    
+    def _suporta_validacao_linhas(self) -> bool:
+        """
+        Verifica se o módulo sabe validar registro a registro.
+        
+        Returns:
+            True se `_validar_linhas` foi sobrescrito ou há pares de colunas configurados
+        """
+        sobrescrito = type(self)._validar_linhas is not BaseConciliacao._validar_linhas
+        return sobrescrito or bool(self.config.get("validacoes", {}).get("pares_colunas"))
+    
+    def _executar_validacoes_incrementais(self, dados: Dict[str, Any], data_referencia: str) -> Dict[str, Any]:
+        """
+        Executa as validações apenas sobre registros novos ou alterados desde D-1.
+        
+        O estado conciliado de cada data é gravado em `dados/historico`. Os
+        registros cujo conteúdo não mudou herdam o veredito do dia anterior;
+        os demais passam por `_validar_linhas`. Sem colunas de chave ou sem
+        regra de validação por registro, executa `_executar_validacoes` completo.
+        
+        Args:
+            dados: Dados carregados, com as colunas em `colunas` e,
+                opcionalmente, as colunas de chave em `chaves`
+            data_referencia: Data de referência no formato YYYY-MM-DD
+            
+        Returns:
+            Resultados no formato de `_executar_validacoes`
+        """
+        inicio = datetime.now()
+        chaves = dados.get("chaves") or self.config.get("validacoes", {}).get("colunas_chave", [])
+        if not chaves:
+            self.logger.warning("⚠️ Modo incremental sem colunas de chave (validacoes.colunas_chave); "
+                                "executando validação completa")
+            return self._executar_validacoes(dados)
+        
+        if not self._suporta_validacao_linhas():
+            self.logger.warning("⚠️ Modo incremental sem validacoes.pares_colunas nem _validar_linhas próprio; "
+                                "executando validação completa")
+            return self._executar_validacoes(dados)
+        
+        assinatura = json.dumps(self.config.get("validacoes", {}), sort_keys=True)
+        veredito, estatisticas = ValidacaoIncremental(self.nome).executar(
+            dados["colunas"], chaves, self._validar_linhas, data_referencia, assinatura
+        )
+        
+        return montar_resultado_validacao(
+            len(veredito),
+            int(veredito.sum()),
+            [],
+            [],
+            inicio,
+            data_referencia=data_referencia,
+            incremental=estatisticas
+        )
+    
+    def _executar_validacoes_particionadas(self, dados: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Executa `_executar_validacoes` em paralelo, uma vez por partição dos dados.
+        
+        Os dados são divididos pela coluna `execucao.chave_particao` e cada
+        partição é validada em um processo separado (`execucao.processos`;
+        0 usa todos os núcleos). A instância do módulo é enviada aos
+        processos, então `_executar_validacoes` não deve depender de estado
+        que não possa ser serializado.
+        
+        Args:
+            dados: Dados carregados, com ao menos uma tabela colunar
+                (`colunas`, `sistema`, `fonte`...) contendo a coluna de partição
+            
+        Returns:
+            Resultados consolidados no formato de `_executar_validacoes`,
+            com o resumo de cada partição em `particoes`
+        """
+        inicio = datetime.now()
+        execucao = self.config.get("execucao", {})
+        coluna = execucao.get("chave_particao")
+        if not coluna:
+            raise ValueError("Validação particionada exige execucao.chave_particao")
+        
+        indices = indices_particoes(dados, coluna)
+        particoes = particionar(dados, coluna, indices)
+        processos = min(execucao.get("processos") or os.cpu_count() or 1, len(particoes))
+        self.logger.info(f"🧩 {len(particoes)} partições por '{coluna}' em {processos} processos")
+        
+        if processos <= 1:
+            resultados = {valor: self._executar_validacoes(parte) for valor, parte in particoes.items()}
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                futuros = {
+                    valor: executor.submit(validar_particao, self, parte)
+                    for valor, parte in particoes.items()
+                }
+                resultados = {valor: futuro.result() for valor, futuro in futuros.items()}
+        
+        return mesclar_resultados(resultados, inicio, indices)
+    
     def _gerar_relatorio(self, resultados: Dict[str, Any]) -> str:
         """
         Gera relatório padrão dos resultados.
@@ -351,14 +785,23 @@ class ConciliacaoTemplate(BaseConciliacao):
             
             # 4. Executar validações
             self.logger.info("🔍 Executando validações...")
-            resultados = self._executar_validacoes(dados)
-            
-            # 5. Gerar relatório
+            if self.config.get("execucao", {}).get("modo_incremental", False) and "colunas" in dados:
+                resultados = self._executar_validacoes_incrementais(dados, data_ref)
+            elif self.config.get("execucao", {}).get("chave_particao"):
+                resultados = self._executar_validacoes_particionadas(dados)
+            else:
+                resultados = self._executar_validacoes(dados)
+            
+            # 5. Verificar duplicatas e datas (validacoes.verificar_duplicatas / validar_datas)
+            self._anexar_duplicatas(dados, resultados)
+            self._anexar_validacao_datas(dados, resultados)
+            
+            # 6. Gerar relatório
             if self.config.get("saida", {}).get("gerar_relatorio", True):
                 self.logger.info("📄 Gerando relatório...")
                 self._gerar_relatorio(resultados)
             
-            # 6. Salvar histórico
+            # 7. Salvar histórico
             if self.config.get("saida", {}).get("salvar_historico", True):
                 self._salvar_historico(resultados)
             
@@ -369,6 +812,76 @@ class ConciliacaoTemplate(BaseConciliacao):
             self.logger.error(f"❌ Erro na execução: {e}")
             raise
     
+    def _anexar_duplicatas(self, dados: Dict[str, Any], resultados: Dict[str, Any]) -> None:
+        """
+        Verifica duplicatas em cada tabela colunar dos dados e anexa o resumo aos resultados.
+        
+        Tabelas sem alguma das colunas de chave são ignoradas. Grupos
+        duplicados geram um alerta `registros_duplicados` por tabela.
+        
+        Args:
+            dados: Dados carregados (`colunas`, `sistema` e/ou `fonte`)
+            resultados: Resultados das validações, alterados no lugar
+        """
+        chaves = dados.get("chaves") or self.config.get("validacoes", {}).get("colunas_chave", [])
+        
+        for tabela in ("colunas", "sistema", "fonte"):
+            colunas = dados.get(tabela)
+            if not isinstance(colunas, dict) or not chaves or not all(chave in colunas for chave in chaves):
+                continue
+            
+            resumo = self._verificar_duplicatas([colunas], chaves)
+            if resumo is None:
+                return
+            
+            resultados.setdefault("duplicatas", {})[tabela] = resumo
+            if resumo["registros_duplicados"]:
+                resultados.setdefault("alertas", []).append({
+                    "tipo": "registros_duplicados",
+                    "tabela": tabela,
+                    "quantidade": resumo["registros_duplicados"]
+                })
+    
+    def _anexar_validacao_datas(self, dados: Dict[str, Any], resultados: Dict[str, Any]) -> None:
+        """
+        Valida as colunas de `validacoes.colunas_data` e anexa as contagens aos resultados.
+        
+        Usa o intervalo `validacoes.data_minima`/`data_maxima`. Colunas com
+        datas rejeitadas geram um alerta `datas_rejeitadas`.
+        
+        Args:
+            dados: Dados carregados (`colunas`, `sistema` e/ou `fonte`)
+            resultados: Resultados das validações, alterados no lugar
+        """
+        validacoes = self.config.get("validacoes", {})
+        colunas_data = validacoes.get("colunas_data", [])
+        
+        for tabela in ("colunas", "sistema", "fonte"):
+            colunas = dados.get(tabela)
+            if not isinstance(colunas, dict):
+                continue
+            
+            for coluna in colunas_data:
+                if coluna not in colunas:
+                    continue
+                
+                validacao = self._validar_coluna_datas(
+                    colunas[coluna], validacoes.get("data_minima"), validacoes.get("data_maxima")
+                )
+                if validacao is None:
+                    return
+                
+                contagens = validacao["contagens"]
+                resultados.setdefault("datas", {}).setdefault(tabela, {})[coluna] = contagens
+                rejeitadas = contagens["total_registros"] - contagens["datas_validas"]
+                if rejeitadas:
+                    resultados.setdefault("alertas", []).append({
+                        "tipo": "datas_rejeitadas",
+                        "tabela": tabela,
+                        "coluna": coluna,
+                        "quantidade": rejeitadas
+                    })
+    
     def _carregar_dados(self, data_referencia: str) -> Dict[str, Any]:
         """
         Implementação exemplo de carregamento de dados.
@@ -404,18 +917,26 @@ class ConciliacaoTemplate(BaseConciliacao):
         """
         # TODO: Implementar validações específicas
         self.logger.info("🔍 Executando validações básicas")
+        inicio = datetime.now()
+        
+        # Exemplo de comparação colunar sistema vs. fonte
+        if "sistema" in dados and "fonte" in dados:
+            comparacao = self._comparar_colunas(
+                dados["sistema"],
+                dados["fonte"],
+                dados.get("chaves", []),
+                dados.get("colunas_valor", [])
+            )
+            return montar_resultado_validacao(
+                comparacao.pop("total_registros"),
+                comparacao.pop("registros_validos"),
+                [],
+                [],
+                inicio,
+                **{campo: valor for campo, valor in comparacao.items() if campo != "registros_invalidos"}
+            )
         
         # Exemplo de estrutura de resultados
-        return {
-            "status": "sucesso",
-            "total_registros": dados.get("metadados", {}).get("total_registros", 0),
-            "registros_validos": 0,
-            "registros_invalidos": 0,
-            "erros": [],
-            "alertas": [],
-            "metricas": {
-                "tempo_execucao": 0,
-                "taxa_sucesso": 100.0
-            }
-        }
+        total = dados.get("metadados", {}).get("total_registros", 0)
+        return montar_resultado_validacao(total, total, [], [], inicio)
 
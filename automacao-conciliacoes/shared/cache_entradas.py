@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Cache de entradas já interpretadas.
+
+Este módulo guarda as colunas de cada arquivo de entrada em formato binário
+colunar (.npy, mapeável em memória), identificadas pela impressão digital
+do arquivo (caminho, tamanho, data de modificação e hash do conteúdo).
+Reexecuções da mesma data de referência reaproveitam o cache e não precisam
+interpretar o xlsx novamente.
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: índice atualizado sem bloqueio entre processos
+    fcntl = None
+
+
+# Tamanho da leitura ao calcular o hash do conteúdo
+_TAMANHO_LEITURA = 1024 * 1024
+
+# Idade mínima (segundos) para descartar gravações temporárias abandonadas
+_IDADE_TEMPORARIO_ABANDONADO = 3600
+
+
+def para_array(valores: Sequence[Any]) -> np.ndarray:
+    """
+    Converte uma coluna de valores Python em array NumPy de tipo fixo.
+
+    Números viram float64 (int64 quando não há ausentes), datas viram
+    datetime64 e os demais valores viram texto. Ausentes são representados
+    por NaN, NaT ou texto vazio, conforme o tipo.
+
+    Args:
+        valores: Valores da coluna
+
+    Returns:
+        Array sem dtype `object`, adequado para gravação mapeável
+    """
+    presentes = [valor for valor in valores if valor is not None]
+    tem_nulos = len(presentes) != len(valores)
+
+    if presentes and all(isinstance(valor, bool) for valor in presentes) and not tem_nulos:
+        return np.asarray(valores, dtype=bool)
+
+    if presentes and all(isinstance(valor, int) and not isinstance(valor, bool) for valor in presentes) \
+            and not tem_nulos:
+        return np.asarray(valores, dtype=np.int64)
+
+    if presentes and all(isinstance(valor, (int, float)) for valor in presentes):
+        return np.asarray([np.nan if valor is None else valor for valor in valores], dtype=np.float64)
+
+    if presentes and all(isinstance(valor, datetime) for valor in presentes):
+        return np.asarray([np.datetime64("NaT") if valor is None else valor for valor in valores],
+                          dtype="datetime64[us]")
+
+    if presentes and all(isinstance(valor, date) for valor in presentes):
+        return np.asarray([np.datetime64("NaT") if valor is None else valor for valor in valores],
+                          dtype="datetime64[D]")
+
+    return np.asarray(["" if valor is None else str(valor) for valor in valores], dtype=str)
+
+
+def _valores_com_ausentes(array: np.ndarray) -> List[Any]:
+    """
+    Converte um array de `para_array` de volta em valores Python, com None nos ausentes.
+
+    Args:
+        array: Array gerado por `para_array`
+
+    Returns:
+        Lista de valores
+    """
+    if array.dtype.kind == 'f':
+        return [None if valor != valor else valor for valor in array.tolist()]
+    # NaT já vira None em tolist()
+    if array.dtype.kind == 'U':
+        return [valor if valor != "" else None for valor in array.tolist()]
+    return array.tolist()
+
+
+def concatenar_arrays(partes: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Junta os arrays de uma coluna gerados bloco a bloco por `para_array`.
+
+    O resultado tem o mesmo tipo que `para_array` daria para a coluna
+    inteira. Blocos de tipos compatíveis (inteiros e reais, datas, textos)
+    são concatenados direto; só colunas com tipos realmente misturados
+    entre blocos voltam a valores Python para a conversão final.
+
+    Args:
+        partes: Arrays da coluna, na ordem dos blocos
+
+    Returns:
+        Array da coluna inteira
+    """
+    if not partes:
+        return para_array([])
+
+    tipos = {parte.dtype.kind for parte in partes}
+    if len(tipos) == 1 and (tipos <= {'b', 'i', 'U'} or len({parte.dtype for parte in partes}) == 1):
+        return np.concatenate(partes)
+    if tipos <= {'b', 'i', 'f'}:
+        return np.concatenate([parte.astype(np.float64) for parte in partes])
+
+    return para_array([valor for parte in partes for valor in _valores_com_ausentes(parte)])
+
+
+class CacheEntradas:
+    """
+    Cache colunar de arquivos de entrada com expulsão LRU por tamanho total.
+
+    Attributes:
+        diretorio (Path): Diretório do cache
+        limite_bytes (int): Tamanho máximo do cache em bytes
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, diretorio: Union[str, Path] = "dados/cache", limite_bytes: int = 2 * 1024 ** 3):
+        """
+        Inicializa o cache.
+
+        Args:
+            diretorio: Diretório onde as entradas serão gravadas
+            limite_bytes: Tamanho máximo do cache em bytes
+        """
+        self.diretorio = Path(diretorio)
+        self.limite_bytes = limite_bytes
+        self.logger = logging.getLogger("cache_entradas")
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+
+    def impressao_digital(self, caminho: Union[str, Path], variante: str = "") -> str:
+        """
+        Calcula a chave de cache de um arquivo.
+
+        A chave combina caminho absoluto, tamanho, data de modificação, hash
+        do conteúdo e a variante de leitura (aba, colunas).
+
+        Args:
+            caminho: Caminho do arquivo de entrada
+            variante: Identificador dos parâmetros de leitura
+
+        Returns:
+            Chave hexadecimal do arquivo
+        """
+        caminho = Path(caminho).resolve()
+        info = caminho.stat()
+
+        conteudo = hashlib.blake2b(digest_size=16)
+        with open(caminho, 'rb') as f:
+            for parte in iter(lambda: f.read(_TAMANHO_LEITURA), b""):
+                conteudo.update(parte)
+
+        chave = hashlib.blake2b(digest_size=16)
+        chave.update(f"{caminho}|{info.st_size}|{info.st_mtime_ns}|{conteudo.hexdigest()}|{variante}".encode())
+        return chave.hexdigest()
+
+    def obter(self, caminho: Union[str, Path], variante: str = "",
+              chave: Optional[str] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Obtém as colunas em cache de um arquivo, mapeadas em memória.
+
+        Args:
+            caminho: Caminho do arquivo de entrada
+            variante: Identificador dos parâmetros de leitura
+            chave: Impressão digital já calculada (evita ler o arquivo de novo)
+
+        Returns:
+            Colunas do arquivo ou None se não houver cache válido
+        """
+        chave = chave or self.impressao_digital(caminho, variante)
+        entrada = self.diretorio / chave
+        manifesto_path = entrada / "manifesto.json"
+
+        if not manifesto_path.exists():
+            return None
+
+        try:
+            with open(manifesto_path, 'r', encoding='utf-8') as f:
+                manifesto = json.load(f)
+
+            colunas = {
+                coluna["nome"]: np.load(entrada / coluna["arquivo"], mmap_mode='r')
+                for coluna in manifesto["colunas"]
+            }
+        except Exception as e:
+            self.logger.warning(f"⚠️ Cache corrompido para {caminho}: {e}")
+            shutil.rmtree(entrada, ignore_errors=True)
+            return None
+
+        with self._indice_bloqueado() as indice:
+            if chave in indice:
+                indice[chave]["ultimo_acesso"] = time.time()
+
+        self.logger.info(f"⚡ Cache reaproveitado: {Path(caminho).name}")
+        return colunas
+
+    def armazenar(self, caminho: Union[str, Path], colunas: Dict[str, Any], variante: str = "",
+                  chave: Optional[str] = None) -> None:
+        """
+        Grava as colunas interpretadas de um arquivo no cache.
+
+        Args:
+            caminho: Caminho do arquivo de entrada
+            colunas: Colunas interpretadas (nome -> valores ou array)
+            variante: Identificador dos parâmetros de leitura
+            chave: Impressão digital já calculada (evita ler o arquivo de novo)
+        """
+        chave = chave or self.impressao_digital(caminho, variante)
+        destino = self.diretorio / chave
+        temporario = self.diretorio / f"{chave}.tmp-{os.getpid()}"
+
+        try:
+            temporario.mkdir(parents=True, exist_ok=True)
+            manifesto = {"origem": str(caminho), "colunas": []}
+            total_bytes = 0
+
+            for posicao, (nome, valores) in enumerate(colunas.items()):
+                array = valores if isinstance(valores, np.ndarray) and valores.dtype != object \
+                    else para_array(list(valores))
+                arquivo = f"c{posicao}.npy"
+                np.save(temporario / arquivo, array, allow_pickle=False)
+                total_bytes += (temporario / arquivo).stat().st_size
+                manifesto["colunas"].append({"nome": nome, "arquivo": arquivo, "dtype": str(array.dtype)})
+
+            with open(temporario / "manifesto.json", 'w', encoding='utf-8') as f:
+                json.dump(manifesto, f, ensure_ascii=False)
+
+            # Publicar a entrada de forma atômica
+            if destino.exists():
+                shutil.rmtree(temporario, ignore_errors=True)
+            else:
+                os.replace(temporario, destino)
+
+        except Exception as e:
+            self.logger.warning(f"⚠️ Erro ao gravar cache de {caminho}: {e}")
+            shutil.rmtree(temporario, ignore_errors=True)
+            return
+
+        with self._indice_bloqueado() as indice:
+            indice[chave] = {"origem": str(caminho), "bytes": total_bytes, "ultimo_acesso": time.time()}
+            self._incluir_orfas(indice)
+            self._expulsar(indice)
+
+        self.logger.info(f"💾 Cache gravado: {Path(caminho).name} ({total_bytes / 1024 ** 2:.1f} MB)")
+
+    def _expulsar(self, indice: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Remove as entradas menos usadas até o cache caber no limite.
+
+        Args:
+            indice: Índice do cache (alterado no lugar)
+        """
+        total = sum(entrada["bytes"] for entrada in indice.values())
+
+        for chave in sorted(indice, key=lambda c: indice[c]["ultimo_acesso"]):
+            if total <= self.limite_bytes:
+                break
+
+            try:
+                shutil.rmtree(self.diretorio / chave)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                # Arquivo ainda mapeado por outro processo
+                self.logger.debug(f"Entrada de cache em uso, mantida: {chave} ({e})")
+                continue
+
+            total -= indice.pop(chave)["bytes"]
+            self.logger.info(f"🧹 Entrada de cache expulsa: {chave}")
+
+    def _incluir_orfas(self, indice: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Inclui no índice as entradas gravadas no disco mas ausentes dele.
+
+        Entradas podem ficar fora do índice se o processo morrer entre a
+        publicação e a atualização do índice. Elas passam a contar no tamanho
+        total e entram na fila de expulsão pela data de modificação.
+        Gravações temporárias abandonadas há mais de uma hora são removidas.
+
+        Args:
+            indice: Índice do cache (alterado no lugar)
+        """
+        agora = time.time()
+
+        for entrada in self.diretorio.iterdir():
+            if not entrada.is_dir() or entrada.name in indice:
+                continue
+
+            try:
+                if ".tmp-" in entrada.name:
+                    if agora - entrada.stat().st_mtime > _IDADE_TEMPORARIO_ABANDONADO:
+                        shutil.rmtree(entrada, ignore_errors=True)
+                    continue
+
+                indice[entrada.name] = {
+                    "origem": None,
+                    "bytes": sum(arquivo.stat().st_size for arquivo in entrada.iterdir()),
+                    "ultimo_acesso": entrada.stat().st_mtime
+                }
+            except FileNotFoundError:
+                # Removida por outro processo durante a varredura
+                continue
+
+    @contextmanager
+    def _indice_bloqueado(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """
+        Carrega o índice sob bloqueio exclusivo e o grava ao final.
+
+        O bloqueio (`fcntl.flock` em `indice.lock`) serializa a leitura,
+        alteração e gravação do índice entre processos, para que acessos
+        concorrentes não percam atualizações.
+
+        Yields:
+            Índice do cache, a ser alterado no lugar
+        """
+        with open(self.diretorio / "indice.lock", 'a') as trava:
+            if fcntl is not None:
+                fcntl.flock(trava.fileno(), fcntl.LOCK_EX)
+            try:
+                indice = self._carregar_indice()
+                yield indice
+                self._salvar_indice(indice)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(trava.fileno(), fcntl.LOCK_UN)
+
+    def _carregar_indice(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Carrega o índice de entradas do cache.
+
+        Returns:
+            Índice chave -> {origem, bytes, ultimo_acesso}
+        """
+        indice_path = self.diretorio / "indice.json"
+        if not indice_path.exists():
+            return {}
+
+        try:
+            with open(indice_path, 'r', encoding='utf-8') as f:
+                indice = json.load(f)
+        except Exception:
+            return {}
+
+        # Descartar entradas cujo diretório não existe mais
+        return {chave: info for chave, info in indice.items() if (self.diretorio / chave).exists()}
+
+    def _salvar_indice(self, indice: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Grava o índice de entradas do cache de forma atômica.
+
+        Args:
+            indice: Índice a gravar
+        """
+        temporario = self.diretorio / f"indice.json.tmp-{os.getpid()}"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(indice, f, ensure_ascii=False)
+        os.replace(temporario, self.diretorio / "indice.json")
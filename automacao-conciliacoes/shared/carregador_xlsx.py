@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Carregador de planilhas xlsx com memória limitada.
+
+Este módulo lê planilhas em modo somente leitura (streaming) e entrega os
+dados em blocos colunares de tamanho fixo, para que os módulos possam
+validar arquivos grandes sem carregar a pasta de trabalho inteira.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
+import logging
+
+from openpyxl import load_workbook
+
+
+class CarregadorXlsx:
+    """
+    Leitor em streaming de planilhas xlsx.
+
+    Attributes:
+        tamanho_bloco (int): Número de linhas por bloco entregue
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, tamanho_bloco: int = 50000):
+        """
+        Inicializa o carregador.
+
+        Args:
+            tamanho_bloco: Número de linhas por bloco
+        """
+        if tamanho_bloco <= 0:
+            raise ValueError(f"Tamanho de bloco inválido: {tamanho_bloco}")
+
+        self.tamanho_bloco = tamanho_bloco
+        self.logger = logging.getLogger("carregador_xlsx")
+
+    def listar_abas(self, caminho: Union[str, Path]) -> List[str]:
+        """
+        Lista as abas de uma planilha sem carregar seu conteúdo.
+
+        Args:
+            caminho: Caminho do arquivo xlsx
+
+        Returns:
+            Nomes das abas
+        """
+        workbook = load_workbook(caminho, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    def _nomes_colunas(self, cabecalho: Sequence[Any], caminho: Path) -> List[str]:
+        """
+        Monta nomes únicos para as colunas a partir da linha de cabeçalho.
+
+        Células vazias viram `coluna_{posição}` e nomes repetidos recebem o
+        sufixo `_2`, `_3`... na ordem em que aparecem.
+
+        Args:
+            cabecalho: Valores da linha de cabeçalho
+            caminho: Caminho do arquivo (para mensagens)
+
+        Returns:
+            Nomes das colunas, sem repetição
+        """
+        originais = [str(nome).strip() if nome is not None else f"coluna_{i}"
+                     for i, nome in enumerate(cabecalho)]
+        usados = set(originais)
+        vistos = set()
+        nomes = []
+
+        for nome in originais:
+            if nome not in vistos:
+                vistos.add(nome)
+                nomes.append(nome)
+                continue
+
+            sufixo = 2
+            while f"{nome}_{sufixo}" in usados:
+                sufixo += 1
+            novo = f"{nome}_{sufixo}"
+            usados.add(novo)
+            nomes.append(novo)
+            self.logger.warning(f"⚠️ Cabeçalho repetido em {caminho.name}: '{nome}' renomeado para '{novo}'")
+
+        return nomes
+
+    def ler_blocos(self, caminho: Union[str, Path], aba: Optional[str] = None,
+                   colunas: Optional[List[str]] = None,
+                   linha_cabecalho: int = 1) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Lê a planilha e entrega blocos colunares de tamanho fixo.
+
+        Apenas um bloco fica em memória por vez. A pasta de trabalho é aberta
+        em modo `read_only`, que percorre o XML da aba sem montar as células.
+
+        Cabeçalhos repetidos são renomeados com sufixo (`Valor`, `Valor_2`),
+        para que nenhuma coluna seja sobrescrita por outra de mesmo nome.
+
+        Args:
+            caminho: Caminho do arquivo xlsx
+            aba: Nome da aba (padrão: aba ativa)
+            colunas: Colunas a manter (padrão: todas as do cabeçalho)
+            linha_cabecalho: Número da linha (1-based) com os nomes das colunas
+
+        Yields:
+            Dicionário nome da coluna -> lista de valores do bloco
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+            KeyError: Se a aba ou alguma coluna solicitada não existir
+        """
+        caminho = Path(caminho)
+        if not caminho.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+
+        workbook = load_workbook(caminho, read_only=True, data_only=True)
+        try:
+            planilha = workbook[aba] if aba else workbook.active
+            linhas = planilha.iter_rows(min_row=linha_cabecalho, values_only=True)
+
+            cabecalho = next(linhas, None)
+            if cabecalho is None:
+                self.logger.warning(f"⚠️ Planilha vazia: {caminho}")
+                return
+
+            nomes = self._nomes_colunas(cabecalho, caminho)
+            selecionadas = colunas or nomes
+
+            faltantes = [coluna for coluna in selecionadas if coluna not in nomes]
+            if faltantes:
+                raise KeyError(f"Colunas ausentes em {caminho.name}: {', '.join(faltantes)}")
+
+            posicoes = [nomes.index(coluna) for coluna in selecionadas]
+            bloco = {coluna: [] for coluna in selecionadas}
+            total_linhas = 0
+            linhas_bloco = 0
+
+            for linha in linhas:
+                # Ignorar linhas totalmente vazias (comuns no fim das abas)
+                if not any(valor is not None for valor in linha):
+                    continue
+
+                for coluna, posicao in zip(selecionadas, posicoes):
+                    bloco[coluna].append(linha[posicao] if posicao < len(linha) else None)
+                linhas_bloco += 1
+
+                if linhas_bloco == self.tamanho_bloco:
+                    total_linhas += linhas_bloco
+                    yield bloco
+                    bloco = {coluna: [] for coluna in selecionadas}
+                    linhas_bloco = 0
+
+            if linhas_bloco:
+                total_linhas += linhas_bloco
+                yield bloco
+
+            self.logger.info(f"📁 Planilha lida: {caminho.name} ({total_linhas} linhas)")
+
+        finally:
+            workbook.close()
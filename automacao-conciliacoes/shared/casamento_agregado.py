@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Casamento agregado (um-para-muitos e muitos-para-muitos).
+
+Este módulo resolve casos em que um lançamento de um lado corresponde à
+soma de vários lançamentos do outro (ex.: liquidação D+0, PIS/COFINS).
+Os candidatos são agrupados por chave e, dentro de cada grupo, uma busca
+de subconjunto limitada e podada encontra as somas dentro da tolerância.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+import time
+
+from shared.motor_comparacao import dentro_tolerancia, limite_tolerancia, montar_resultado_validacao
+
+
+class BuscaInterrompida(Exception):
+    """Sinaliza que a busca de um grupo excedeu seus limites."""
+
+
+class CasadorAgregado:
+    """
+    Casador de um lançamento contra somas de lançamentos do outro lado.
+
+    Attributes:
+        chaves (list): Campos usados para agrupar candidatos
+        coluna_valor (str): Campo numérico somado
+        tolerancia_percentual (float): Tolerância relativa em percentual
+        tolerancia_absoluta (float): Tolerância absoluta
+        max_itens_grupo (int): Máximo de candidatos avaliados por grupo
+        max_tamanho_subconjunto (int): Máximo de lançamentos somados por casamento
+        tempo_max_grupo (float): Tempo máximo de busca por grupo, em segundos
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, chaves: List[str], coluna_valor: str,
+                 tolerancia_percentual: float = 0.0, tolerancia_absoluta: float = 0.0,
+                 max_itens_grupo: int = 30, max_tamanho_subconjunto: int = 6,
+                 tempo_max_grupo: float = 2.0):
+        """
+        Inicializa o casador agregado.
+
+        Args:
+            chaves: Campos usados para agrupar candidatos
+            coluna_valor: Campo numérico somado
+            tolerancia_percentual: Tolerância relativa em percentual
+            tolerancia_absoluta: Tolerância absoluta
+            max_itens_grupo: Máximo de candidatos avaliados por grupo
+            max_tamanho_subconjunto: Máximo de lançamentos somados por casamento
+            tempo_max_grupo: Tempo máximo de busca por grupo, em segundos
+        """
+        self.chaves = list(chaves)
+        self.coluna_valor = coluna_valor
+        self.tolerancia_percentual = tolerancia_percentual
+        self.tolerancia_absoluta = tolerancia_absoluta
+        self.max_itens_grupo = max_itens_grupo
+        self.max_tamanho_subconjunto = max_tamanho_subconjunto
+        self.tempo_max_grupo = tempo_max_grupo
+        self.logger = logging.getLogger("casamento_agregado")
+
+    def _agrupar(self, registros: List[Dict[str, Any]]) -> Dict[Tuple, List[int]]:
+        """
+        Agrupa os índices dos registros pela chave.
+
+        Args:
+            registros: Registros de um dos lados
+
+        Returns:
+            Dicionário chave -> índices dos registros
+        """
+        grupos: Dict[Tuple, List[int]] = {}
+        for indice, registro in enumerate(registros):
+            chave = tuple(registro.get(campo) for campo in self.chaves)
+            grupos.setdefault(chave, []).append(indice)
+        return grupos
+
+    def _limite(self, alvo: float) -> float:
+        """
+        Calcula a diferença máxima aceita para um valor alvo.
+
+        Args:
+            alvo: Valor a ser atingido pela soma
+
+        Returns:
+            Diferença absoluta máxima
+        """
+        return float(limite_tolerancia(alvo, self.tolerancia_percentual, self.tolerancia_absoluta))
+
+    def _buscar_subconjunto(self, alvo: float, valores: List[Tuple[int, float]],
+                            prazo: float) -> Optional[List[int]]:
+        """
+        Procura um subconjunto de valores cuja soma atinja o alvo.
+
+        A busca em profundidade percorre os valores em ordem decrescente de
+        módulo e poda ramos que não conseguem mais alcançar o alvo com os
+        valores restantes (limites das somas positivas e negativas).
+
+        Args:
+            alvo: Valor a ser atingido
+            valores: Pares (índice, valor) disponíveis
+            prazo: Instante (time.monotonic) limite da busca
+
+        Returns:
+            Índices do subconjunto encontrado ou None
+
+        Raises:
+            BuscaInterrompida: Se o prazo do grupo for excedido
+        """
+        limite = self._limite(alvo)
+        ordenados = sorted(valores, key=lambda par: abs(par[1]), reverse=True)
+
+        # Somas máximas (positivas) e mínimas (negativas) ainda alcançáveis
+        restante_pos = [0.0] * (len(ordenados) + 1)
+        restante_neg = [0.0] * (len(ordenados) + 1)
+        for i in range(len(ordenados) - 1, -1, -1):
+            valor = ordenados[i][1]
+            restante_pos[i] = restante_pos[i + 1] + max(valor, 0.0)
+            restante_neg[i] = restante_neg[i + 1] + min(valor, 0.0)
+
+        escolhidos: List[int] = []
+        passos = 0
+
+        def buscar(inicio: int, soma: float) -> bool:
+            nonlocal passos
+            passos += 1
+            if passos % 1024 == 0 and time.monotonic() > prazo:
+                raise BuscaInterrompida()
+
+            if escolhidos and abs(soma - alvo) <= limite:
+                return True
+            if len(escolhidos) >= self.max_tamanho_subconjunto:
+                return False
+
+            for i in range(inicio, len(ordenados)):
+                # Poda: nem somando tudo que resta o alvo é alcançável
+                if soma + restante_pos[i] < alvo - limite or soma + restante_neg[i] > alvo + limite:
+                    return False
+
+                escolhidos.append(i)
+                if buscar(i + 1, soma + ordenados[i][1]):
+                    return True
+                escolhidos.pop()
+
+            return False
+
+        if buscar(0, 0.0):
+            return [ordenados[i][0] for i in escolhidos]
+        return None
+
+    def _casar_grupo(self, esquerda: List[Dict[str, Any]], direita: List[Dict[str, Any]],
+                     indices_esq: List[int], indices_dir: List[int],
+                     prazo: float) -> Tuple[List[Dict[str, Any]], List[int], List[int]]:
+        """
+        Casa os lançamentos de um grupo de mesma chave.
+
+        Primeiro tenta casar cada lançamento de um lado contra somas do outro
+        (1:N e N:1); em seguida, se os totais restantes do grupo coincidirem,
+        fecha o grupo como um casamento N:M.
+
+        Args:
+            esquerda: Registros do lado esquerdo
+            direita: Registros do lado direito
+            indices_esq: Índices do grupo no lado esquerdo
+            indices_dir: Índices do grupo no lado direito
+            prazo: Instante (time.monotonic) limite da busca
+
+        Returns:
+            Tupla (casamentos, índices restantes à esquerda, índices restantes à direita)
+        """
+        def valor(registros: List[Dict[str, Any]], i: int) -> float:
+            return float(registros[i].get(self.coluna_valor) or 0.0)
+
+        casamentos = []
+        restantes_esq = list(indices_esq)
+        restantes_dir = list(indices_dir)
+
+        for lado_unico, lado_multiplo, restantes_unico, restantes_multiplo, tipo in (
+                (esquerda, direita, restantes_esq, restantes_dir, "1:N"),
+                (direita, esquerda, restantes_dir, restantes_esq, "N:1")):
+            for indice in list(restantes_unico):
+                alvo = valor(lado_unico, indice)
+                candidatos = [(i, valor(lado_multiplo, i)) for i in restantes_multiplo]
+                subconjunto = self._buscar_subconjunto(alvo, candidatos, prazo)
+
+                if subconjunto:
+                    restantes_unico.remove(indice)
+                    for i in subconjunto:
+                        restantes_multiplo.remove(i)
+
+                    soma = sum(valor(lado_multiplo, i) for i in subconjunto)
+                    esq, dir_ = ([indice], subconjunto) if tipo == "1:N" else (subconjunto, [indice])
+                    casamentos.append({"tipo": tipo, "esquerda": esq, "direita": dir_,
+                                       "diferenca": soma - alvo if tipo == "1:N" else alvo - soma})
+
+        if restantes_esq and restantes_dir:
+            total_esq = sum(valor(esquerda, i) for i in restantes_esq)
+            total_dir = sum(valor(direita, i) for i in restantes_dir)
+
+            if dentro_tolerancia(total_dir, total_esq, self.tolerancia_percentual,
+                                 self.tolerancia_absoluta):
+                casamentos.append({"tipo": "N:M", "esquerda": restantes_esq, "direita": restantes_dir,
+                                   "diferenca": total_dir - total_esq})
+                restantes_esq, restantes_dir = [], []
+
+        return casamentos, restantes_esq, restantes_dir
+
+    def casar(self, esquerda: List[Dict[str, Any]], direita: List[Dict[str, Any]],
+              tempo_limite: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Casa lançamentos agregados dos dois lados, grupo a grupo.
+
+        Grupos maiores que `max_itens_grupo`, ou cuja busca exceda
+        `tempo_max_grupo`, são marcados como interrompidos e seus lançamentos
+        ficam como não casados. Quando o tempo total (`tempo_limite`) se
+        esgota, os grupos restantes nem chegam a ser avaliados.
+
+        Args:
+            esquerda: Registros do lado esquerdo (ex.: razão contábil)
+            direita: Registros do lado direito (ex.: linhas da fonte)
+            tempo_limite: Tempo total máximo, em segundos
+
+        Returns:
+            Dicionário com `casamentos` (índices de cada lado), os índices
+            `nao_casados_esquerda`/`nao_casados_direita` e as chaves em
+            `grupos_interrompidos`
+        """
+        grupos_esq = self._agrupar(esquerda)
+        grupos_dir = self._agrupar(direita)
+        fim_total = time.monotonic() + tempo_limite if tempo_limite else None
+
+        casamentos = []
+        nao_casados_esq = []
+        nao_casados_dir = []
+        interrompidos = []
+
+        for chave in list(grupos_esq) + [c for c in grupos_dir if c not in grupos_esq]:
+            indices_esq = grupos_esq.get(chave, [])
+            indices_dir = grupos_dir.get(chave, [])
+            agora = time.monotonic()
+
+            if not indices_esq or not indices_dir:
+                nao_casados_esq.extend(indices_esq)
+                nao_casados_dir.extend(indices_dir)
+                continue
+
+            if len(indices_esq) + len(indices_dir) > self.max_itens_grupo \
+                    or (fim_total is not None and agora >= fim_total):
+                interrompidos.append(dict(zip(self.chaves, chave)))
+                nao_casados_esq.extend(indices_esq)
+                nao_casados_dir.extend(indices_dir)
+                continue
+
+            prazo = agora + self.tempo_max_grupo
+            if fim_total is not None:
+                prazo = min(prazo, fim_total)
+
+            try:
+                casados, restantes_esq, restantes_dir = self._casar_grupo(
+                    esquerda, direita, indices_esq, indices_dir, prazo
+                )
+            except BuscaInterrompida:
+                interrompidos.append(dict(zip(self.chaves, chave)))
+                nao_casados_esq.extend(indices_esq)
+                nao_casados_dir.extend(indices_dir)
+                continue
+
+            for casamento in casados:
+                casamento["chave"] = dict(zip(self.chaves, chave))
+            casamentos.extend(casados)
+            nao_casados_esq.extend(restantes_esq)
+            nao_casados_dir.extend(restantes_dir)
+
+        if interrompidos:
+            self.logger.warning(f"⚠️ {len(interrompidos)} grupos interrompidos por limite de tamanho ou tempo")
+
+        self.logger.info(
+            f"🧮 Casamento agregado concluído: {len(casamentos)} casamentos, "
+            f"{len(nao_casados_esq)} + {len(nao_casados_dir)} lançamentos não casados"
+        )
+
+        return {
+            "casamentos": casamentos,
+            "nao_casados_esquerda": nao_casados_esq,
+            "nao_casados_direita": nao_casados_dir,
+            "grupos_interrompidos": interrompidos
+        }
+
+    def para_resultado_validacao(self, resultado: Dict[str, Any], total_esquerda: int,
+                                 inicio: datetime) -> Dict[str, Any]:
+        """
+        Converte o resultado de `casar` no resultado padrão de validação.
+
+        Os registros são contados pelo lado esquerdo (o lado agregado).
+
+        Args:
+            resultado: Resultado de `casar`
+            total_esquerda: Total de registros do lado esquerdo
+            inicio: Instante de início do casamento
+
+        Returns:
+            Resultado no formato consumido pelo `StatusReporter`
+        """
+        casados_esq = sum(len(casamento["esquerda"]) for casamento in resultado["casamentos"])
+
+        alertas = []
+        if resultado["grupos_interrompidos"]:
+            alertas.append({
+                "tipo": "grupos_interrompidos",
+                "quantidade": len(resultado["grupos_interrompidos"]),
+                "chaves": resultado["grupos_interrompidos"][:100]
+            })
+        if resultado["nao_casados_direita"]:
+            alertas.append({"tipo": "somente_direita", "quantidade": len(resultado["nao_casados_direita"])})
+
+        return montar_resultado_validacao(
+            total_esquerda,
+            casados_esq,
+            [],
+            alertas,
+            inicio,
+            casamentos_agregados=len(resultado["casamentos"]),
+            grupos_interrompidos=len(resultado["grupos_interrompidos"])
+        )
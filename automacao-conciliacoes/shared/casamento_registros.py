@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Casamento de registros entre dois lados de uma conciliação.
+
+Este módulo fornece um casador por chave composta baseado em hash join de
+passagem única, que separa os registros em casados, exclusivos de cada lado
+e divergentes em valor.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Tuple, Iterable
+import logging
+
+import numpy as np
+
+from shared.motor_comparacao import dentro_tolerancia, montar_resultado_validacao
+
+
+class CasadorRegistros:
+    """
+    Casador de registros por chave composta (hash join de passagem única).
+
+    Attributes:
+        chaves (list): Campos que compõem a chave de casamento
+        colunas_valor (list): Campos numéricos comparados nos registros casados
+        tolerancia_percentual (float): Tolerância relativa em percentual
+        tolerancia_absoluta (float): Tolerância absoluta
+        max_divergencias_detalhadas (int): Limite de divergências detalhadas no resultado
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, chaves: List[str], colunas_valor: List[str],
+                 tolerancia_percentual: float = 0.0, tolerancia_absoluta: float = 0.0,
+                 max_divergencias_detalhadas: int = 1000):
+        """
+        Inicializa o casador.
+
+        Args:
+            chaves: Campos da chave composta (ex.: ["isin", "carteira", "data"])
+            colunas_valor: Campos numéricos a comparar
+            tolerancia_percentual: Tolerância relativa em percentual
+            tolerancia_absoluta: Tolerância absoluta
+            max_divergencias_detalhadas: Máximo de divergências listadas no resultado
+        """
+        if not chaves:
+            raise ValueError("Informe ao menos um campo de chave")
+
+        self.chaves = list(chaves)
+        self.colunas_valor = list(colunas_valor)
+        self.tolerancia_percentual = tolerancia_percentual
+        self.tolerancia_absoluta = tolerancia_absoluta
+        self.max_divergencias_detalhadas = max_divergencias_detalhadas
+        self.logger = logging.getLogger("casamento_registros")
+
+    def _chave(self, registro: Dict[str, Any]) -> Tuple:
+        """
+        Extrai a chave composta de um registro.
+
+        Args:
+            registro: Registro do lado esquerdo ou direito
+
+        Returns:
+            Tupla com os valores da chave
+        """
+        return tuple(registro.get(campo) for campo in self.chaves)
+
+    def _divergencias(self, pares: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Compara os campos de valor de todos os pares casados de uma vez.
+
+        Args:
+            pares: Pares (registro esquerdo, registro direito) casados pela chave
+
+        Returns:
+            Para cada par, os campos divergentes com os valores de cada lado
+        """
+        divergencias: List[Dict[str, Any]] = [{} for _ in pares]
+
+        for coluna in self.colunas_valor:
+            conciliado = dentro_tolerancia(
+                np.array([esquerdo.get(coluna) for esquerdo, _ in pares], dtype=np.float64),
+                np.array([direito.get(coluna) for _, direito in pares], dtype=np.float64),
+                self.tolerancia_percentual, self.tolerancia_absoluta
+            )
+            for posicao in np.flatnonzero(~conciliado).tolist():
+                esquerdo, direito = pares[posicao]
+                divergencias[posicao][coluna] = {"esquerda": esquerdo.get(coluna), "direita": direito.get(coluna)}
+
+        return divergencias
+
+    def casar(self, esquerda: Iterable[Dict[str, Any]],
+              direita: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Casa os registros dos dois lados pela chave composta.
+
+        O lado esquerdo é indexado em uma tabela hash e o direito é percorrido
+        uma única vez. Chaves repetidas são casadas na ordem de chegada.
+
+        Args:
+            esquerda: Registros do lado esquerdo (ex.: posições internas)
+            direita: Registros do lado direito (ex.: custódia)
+
+        Returns:
+            Dicionário com as listas `casados`, `divergentes`,
+            `somente_esquerda` e `somente_direita`
+        """
+        indice: Dict[Tuple, deque] = {}
+        for registro in esquerda:
+            indice.setdefault(self._chave(registro), deque()).append(registro)
+
+        pares = []
+        chaves_pares = []
+        somente_direita = []
+
+        for registro in direita:
+            chave = self._chave(registro)
+            pendentes = indice.get(chave)
+
+            if not pendentes:
+                somente_direita.append(registro)
+                continue
+
+            esquerdo = pendentes.popleft()
+            if not pendentes:
+                del indice[chave]
+
+            pares.append((esquerdo, registro))
+            chaves_pares.append(chave)
+
+        casados = []
+        divergentes = []
+        for (esquerdo, registro), chave, divergencias in zip(pares, chaves_pares, self._divergencias(pares)):
+            if divergencias:
+                divergentes.append({
+                    "chave": dict(zip(self.chaves, chave)),
+                    "esquerda": esquerdo,
+                    "direita": registro,
+                    "divergencias": divergencias
+                })
+            else:
+                casados.append((esquerdo, registro))
+
+        somente_esquerda = [registro for pendentes in indice.values() for registro in pendentes]
+
+        self.logger.info(
+            f"🔗 Casamento concluído: {len(casados)} casados, {len(divergentes)} divergentes, "
+            f"{len(somente_esquerda)} só esquerda, {len(somente_direita)} só direita"
+        )
+
+        return {
+            "casados": casados,
+            "divergentes": divergentes,
+            "somente_esquerda": somente_esquerda,
+            "somente_direita": somente_direita
+        }
+
+    def para_resultado_validacao(self, grupos: Dict[str, List[Any]],
+                                 inicio: datetime) -> Dict[str, Any]:
+        """
+        Converte os grupos de `casar` no resultado padrão de validação.
+
+        Args:
+            grupos: Resultado de `casar`
+            inicio: Instante de início do casamento
+
+        Returns:
+            Resultado no formato consumido pelo `StatusReporter`
+        """
+        casados = len(grupos["casados"])
+        divergentes = len(grupos["divergentes"])
+        somente_esquerda = len(grupos["somente_esquerda"])
+        somente_direita = len(grupos["somente_direita"])
+
+        erros = [
+            {"tipo": "valor_divergente", "chave": item["chave"], "divergencias": item["divergencias"]}
+            for item in grupos["divergentes"][:self.max_divergencias_detalhadas]
+        ]
+
+        alertas = []
+        if somente_esquerda:
+            alertas.append({"tipo": "somente_esquerda", "quantidade": somente_esquerda})
+        if somente_direita:
+            alertas.append({"tipo": "somente_direita", "quantidade": somente_direita})
+
+        return montar_resultado_validacao(
+            casados + divergentes + somente_esquerda + somente_direita,
+            casados,
+            erros,
+            alertas,
+            inicio,
+            registros_casados=casados,
+            registros_divergentes=divergentes,
+            registros_somente_esquerda=somente_esquerda,
+            registros_somente_direita=somente_direita,
+            divergencias_omitidas=max(0, divergentes - len(erros))
+        )
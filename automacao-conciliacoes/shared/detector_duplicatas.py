@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Detecção de registros duplicados em blocos colunares.
+
+Este módulo implementa `validacoes.verificar_duplicatas`. Os registros são
+identificados pelo hash das colunas de chave e processados bloco a bloco,
+como entregues pelo carregador xlsx. Para entradas muito grandes, um filtro
+de Bloom com descarte em disco mantém a memória previsível.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import logging
+import math
+import shutil
+import tempfile
+
+import numpy as np
+
+from shared.motor_comparacao import hash_linhas
+
+
+# Tipo dos registros gravados em disco no modo Bloom
+_REGISTRO_DISCO = np.dtype([("hash", "<u8"), ("linha", "<i8")])
+
+# Registros lidos por vez ao varrer o arquivo em disco
+_LEITURA_DISCO = 4_000_000
+
+
+def _valor_canonico(valor: Any) -> Optional[Tuple[str, Any]]:
+    """
+    Reduz um valor de chave à forma usada na comparação, como em `hash_linhas`.
+
+    Números são comparados como float, datas pelos microssegundos e
+    ausentes (None, NaN, NaT e texto vazio) são todos iguais entre si.
+
+    Args:
+        valor: Valor de uma coluna de chave
+
+    Returns:
+        Par (tipo, valor) ou None para ausentes
+    """
+    if valor is None or (isinstance(valor, float) and valor != valor):
+        return None
+    if isinstance(valor, str):
+        return ("t", valor) if valor else None
+    if isinstance(valor, (datetime, date, np.datetime64)):
+        instante = np.datetime64(valor, 'us')
+        return None if np.isnat(instante) else ("d", int(instante.astype(np.int64)))
+    if isinstance(valor, (int, float, np.number)):
+        numero = float(valor)
+        return None if numero != numero else ("n", numero + 0.0)  # unificar -0.0 e 0.0
+    return ("t", str(valor))
+
+
+def _coluna_para_disco(valores: Sequence) -> np.ndarray:
+    """
+    Converte uma coluna de chave em array para gravação, sem perder o tipo dos valores.
+
+    Args:
+        valores: Valores da coluna
+
+    Returns:
+        Array 1-D; listas mistas ou com ausentes ficam como `object`
+    """
+    array = np.asarray(valores)
+    if array.dtype.kind in 'US' and not isinstance(valores, np.ndarray):
+        array = np.asarray(valores, dtype=object)
+    if array.dtype.kind == 'M':
+        array = array.astype('datetime64[us]')
+    return array.reshape(-1)
+
+
+class FiltroBloom:
+    """
+    Filtro de Bloom vetorizado sobre hashes de 64 bits.
+
+    Attributes:
+        total_bits (int): Tamanho do filtro em bits
+        funcoes_hash (int): Número de posições marcadas por elemento
+    """
+
+    def __init__(self, capacidade: int, taxa_falsos_positivos: float = 0.01):
+        """
+        Dimensiona o filtro para a capacidade e taxa de falsos positivos.
+
+        Args:
+            capacidade: Número esperado de elementos distintos
+            taxa_falsos_positivos: Probabilidade aceitável de falso positivo
+        """
+        capacidade = max(1, capacidade)
+        self.total_bits = max(64, int(math.ceil(-capacidade * math.log(taxa_falsos_positivos) / math.log(2) ** 2)))
+        self.funcoes_hash = max(1, int(round(self.total_bits / capacidade * math.log(2))))
+        self._bits = np.zeros((self.total_bits + 7) // 8, dtype=np.uint8)
+
+    def _posicoes(self, hashes: np.ndarray) -> List[np.ndarray]:
+        """
+        Calcula as posições de bits de cada elemento (hash duplo).
+
+        Args:
+            hashes: Hashes uint64 dos elementos
+
+        Returns:
+            Uma lista com um array de posições por função de hash
+        """
+        total = np.uint64(self.total_bits)
+        with np.errstate(over='ignore'):
+            h1 = hashes % total
+            h2 = ((hashes >> np.uint64(32)) | np.uint64(1)) % total
+            return [(h1 + np.uint64(i) * h2) % total for i in range(self.funcoes_hash)]
+
+    def verificar_e_adicionar(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Verifica quais elementos possivelmente já estavam no filtro e os adiciona.
+
+        Args:
+            hashes: Hashes uint64 dos elementos
+
+        Returns:
+            Máscara com True para elementos possivelmente já vistos
+        """
+        posicoes = self._posicoes(hashes)
+        presente = np.ones(len(hashes), dtype=bool)
+
+        for pos in posicoes:
+            presente &= (self._bits[pos >> np.uint64(3)] & (np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8))) != 0
+
+        for pos in posicoes:
+            np.bitwise_or.at(self._bits, pos >> np.uint64(3), (np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8)))
+
+        return presente
+
+    @property
+    def tamanho_bytes(self) -> int:
+        """Retorna o tamanho do filtro em bytes."""
+        return int(self._bits.nbytes)
+
+
+class DetectorDuplicatas:
+    """
+    Detector de duplicatas por hash das colunas de chave.
+
+    No modo padrão guarda 16 bytes por registro em memória (hash e linha).
+    No modo Bloom guarda apenas o filtro e os hashes suspeitos; os pares
+    (hash, linha) e as colunas de chave de cada bloco vão para arquivos
+    temporários. No final, os registros com hash suspeito são agrupados
+    pelos valores reais das chaves, descartando colisões do hash de 64 bits.
+
+    Attributes:
+        chaves (list): Colunas que identificam um registro
+        usar_bloom (bool): Se True, usa filtro de Bloom com descarte em disco
+        max_grupos_detalhados (int): Limite de grupos listados no resultado
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, chaves: List[str], usar_bloom: bool = False,
+                 capacidade_esperada: int = 50_000_000, taxa_falsos_positivos: float = 0.01,
+                 diretorio_temporario: Optional[str] = None, max_grupos_detalhados: int = 1000):
+        """
+        Inicializa o detector.
+
+        Args:
+            chaves: Colunas que identificam um registro
+            usar_bloom: Se True, usa filtro de Bloom com descarte em disco
+            capacidade_esperada: Número esperado de registros (dimensiona o filtro)
+            taxa_falsos_positivos: Taxa de falsos positivos do filtro
+            diretorio_temporario: Diretório do arquivo de descarte (padrão: do sistema)
+            max_grupos_detalhados: Máximo de grupos listados no resultado
+        """
+        if not chaves:
+            raise ValueError("Informe ao menos uma coluna de chave para detectar duplicatas")
+
+        self.chaves = list(chaves)
+        self.usar_bloom = usar_bloom
+        self.max_grupos_detalhados = max_grupos_detalhados
+        self.logger = logging.getLogger("detector_duplicatas")
+
+        self._total = 0
+        self._hashes: List[np.ndarray] = []
+        self._suspeitos: List[np.ndarray] = []
+        self._filtro = None
+        self._diretorio = None
+        self._arquivo = None
+        self._blocos: List[Tuple[int, List[bool]]] = []
+
+        if usar_bloom:
+            self._filtro = FiltroBloom(capacidade_esperada, taxa_falsos_positivos)
+            self._diretorio = Path(tempfile.mkdtemp(prefix="duplicatas_", dir=diretorio_temporario))
+            self._arquivo = open(self._diretorio / "registros.bin", 'wb')
+            self.logger.info(f"🌸 Filtro de Bloom: {self._filtro.tamanho_bytes / 1024 ** 2:.1f} MB")
+
+    def adicionar_bloco(self, bloco: Dict[str, Sequence]) -> None:
+        """
+        Processa um bloco colunar de registros.
+
+        Args:
+            bloco: Colunas do bloco (nome -> valores)
+        """
+        hashes = hash_linhas(bloco, self.chaves)
+        linhas = np.arange(self._total, self._total + len(hashes), dtype=np.int64)
+        self._total += len(hashes)
+
+        if not self.usar_bloom:
+            self._hashes.append(hashes)
+            return
+
+        registros = np.empty(len(hashes), dtype=_REGISTRO_DISCO)
+        registros["hash"] = hashes
+        registros["linha"] = linhas
+        registros.tofile(self._arquivo)
+
+        # Colunas de chave do bloco, relidas no final só para os candidatos
+        objetos = []
+        for posicao, nome in enumerate(self.chaves):
+            coluna = _coluna_para_disco(bloco[nome])
+            np.save(self._arquivo_chave(len(self._blocos), posicao), coluna, allow_pickle=True)
+            objetos.append(coluna.dtype == object)
+        self._blocos.append((self._total - len(hashes), objetos))
+
+        # Repetições dentro do próprio bloco não são vistas pelo filtro
+        unicos, contagens = np.unique(hashes, return_counts=True)
+        self._suspeitos.append(unicos[contagens > 1])
+
+        suspeitos = self._filtro.verificar_e_adicionar(hashes)
+        self._suspeitos.append(np.unique(hashes[suspeitos]))
+
+    def _arquivo_chave(self, bloco: int, coluna: int) -> Path:
+        """
+        Retorna o arquivo temporário de uma coluna de chave de um bloco.
+
+        Args:
+            bloco: Posição do bloco
+            coluna: Posição da coluna em `chaves`
+
+        Returns:
+            Caminho do arquivo .npy
+        """
+        return self._diretorio / f"chave_{bloco}_{coluna}.npy"
+
+    def _rotular_chaves(self, linhas: np.ndarray) -> np.ndarray:
+        """
+        Relê as chaves reais dos registros candidatos e numera as chaves distintas.
+
+        Args:
+            linhas: Linhas dos registros candidatos
+
+        Returns:
+            Array com o mesmo rótulo para registros de chaves iguais
+        """
+        chaves: List[Any] = [None] * len(linhas)
+        inicios = np.array([inicio for inicio, _ in self._blocos], dtype=np.int64)
+        blocos = np.searchsorted(inicios, linhas, side='right') - 1
+
+        for bloco in np.unique(blocos).tolist():
+            posicoes = np.flatnonzero(blocos == bloco)
+            deslocamentos = linhas[posicoes] - inicios[bloco]
+            colunas = []
+            for coluna, objeto in enumerate(self._blocos[bloco][1]):
+                array = np.load(self._arquivo_chave(bloco, coluna), mmap_mode=None if objeto else 'r',
+                                allow_pickle=objeto)
+                colunas.append(np.asarray(array[deslocamentos]).tolist())
+                del array
+            for posicao, valores in zip(posicoes.tolist(), zip(*colunas)):
+                chaves[posicao] = tuple(_valor_canonico(valor) for valor in valores)
+
+        rotulos: Dict[Tuple, int] = {}
+        return np.fromiter((rotulos.setdefault(chave, len(rotulos)) for chave in chaves),
+                           dtype=np.int64, count=len(chaves))
+
+    def _agrupar(self, hashes: np.ndarray, linhas: np.ndarray,
+                 rotulos: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Identifica grupos de hashes repetidos.
+
+        Args:
+            hashes: Hashes dos registros
+            linhas: Linha de cada registro
+            rotulos: Rótulo das chaves reais de cada registro; registros de
+                mesmo hash e rótulos diferentes ficam em grupos separados
+
+        Returns:
+            Resumo com os grupos duplicados
+        """
+        if rotulos is None:
+            rotulos = np.zeros(len(hashes), dtype=np.int64)
+
+        ordem = np.lexsort((linhas, rotulos, hashes))
+        hashes = hashes[ordem]
+        linhas = linhas[ordem]
+        rotulos = rotulos[ordem]
+
+        inicio_grupo = np.flatnonzero(np.r_[True, (hashes[1:] != hashes[:-1]) | (rotulos[1:] != rotulos[:-1])])
+        tamanhos = np.diff(np.r_[inicio_grupo, len(hashes)])
+        repetidos = np.flatnonzero(tamanhos > 1)
+
+        grupos = [
+            {
+                "hash": f"{int(hashes[inicio_grupo[g]]):016x}",
+                "linhas": linhas[inicio_grupo[g]:inicio_grupo[g] + tamanhos[g]].tolist()
+            }
+            for g in repetidos[:self.max_grupos_detalhados].tolist()
+        ]
+
+        return {
+            "total_registros": self._total,
+            "grupos_duplicados": int(len(repetidos)),
+            "registros_duplicados": int(tamanhos[repetidos].sum() - len(repetidos)),
+            "grupos": grupos,
+            "grupos_omitidos": int(max(0, len(repetidos) - len(grupos)))
+        }
+
+    def finalizar(self) -> Dict[str, Any]:
+        """
+        Conclui a detecção e retorna os grupos duplicados.
+
+        `registros_duplicados` conta as ocorrências além da primeira de cada
+        grupo. As linhas são numeradas a partir de 0, na ordem dos blocos.
+
+        Returns:
+            Resumo com contagens e grupos (hash da chave e linhas)
+        """
+        try:
+            if not self.usar_bloom:
+                hashes = np.concatenate(self._hashes) if self._hashes else np.empty(0, dtype=np.uint64)
+                resultado = self._agrupar(hashes, np.arange(len(hashes), dtype=np.int64))
+            else:
+                self._arquivo.close()
+                suspeitos = np.unique(np.concatenate(self._suspeitos)) if self._suspeitos \
+                    else np.empty(0, dtype=np.uint64)
+
+                selecionados = []
+                if len(suspeitos) and self._total:
+                    registros = np.memmap(self._diretorio / "registros.bin", dtype=_REGISTRO_DISCO, mode='r')
+                    for inicio in range(0, len(registros), _LEITURA_DISCO):
+                        parte = np.array(registros[inicio:inicio + _LEITURA_DISCO])
+                        selecionados.append(parte[np.isin(parte["hash"], suspeitos)])
+                    del registros
+
+                candidatos = np.concatenate(selecionados) if selecionados else np.empty(0, dtype=_REGISTRO_DISCO)
+                resultado = self._agrupar(candidatos["hash"], candidatos["linha"],
+                                          self._rotular_chaves(candidatos["linha"]))
+        finally:
+            self._liberar()
+
+        self.logger.info(
+            f"🔁 Duplicatas: {resultado['grupos_duplicados']} grupos, "
+            f"{resultado['registros_duplicados']} registros repetidos em {resultado['total_registros']}"
+        )
+        return resultado
+
+    def _liberar(self) -> None:
+        """
+        Libera memória e remove arquivos temporários.
+        """
+        self._hashes = []
+        self._suspeitos = []
+        self._blocos = []
+        if self._arquivo is not None and not self._arquivo.closed:
+            self._arquivo.close()
+        if self._diretorio is not None:
+            shutil.rmtree(self._diretorio, ignore_errors=True)
+            self._diretorio = None
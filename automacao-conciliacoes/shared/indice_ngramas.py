@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Índice de n-gramas para casamento aproximado de identificadores.
+
+Este módulo indexa os textos (nomes de ativos, tickers, descrições) do lado
+ainda não casado em um índice invertido de trigramas. Cada consulta avalia
+apenas os candidatos que compartilham trigramas com o texto procurado, em
+vez de compará-lo com todos os registros.
+"""
+
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+import re
+import unicodedata
+
+
+# Número de postings abaixo do qual um n-grama nunca é descartado por frequência
+_MIN_POSTINGS = 100
+
+
+def normalizar_texto(texto: Any) -> str:
+    """
+    Normaliza um texto para comparação aproximada.
+
+    Remove acentos, converte para maiúsculas e troca pontuação por espaço.
+
+    Args:
+        texto: Texto original
+
+    Returns:
+        Texto normalizado
+    """
+    if texto is None:
+        return ""
+
+    decomposto = unicodedata.normalize("NFKD", str(texto))
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return re.sub(r"[^0-9A-Z]+", " ", sem_acentos.upper()).strip()
+
+
+class IndiceNGramas:
+    """
+    Índice invertido de n-gramas com pontuação por coeficiente de Dice.
+
+    Attributes:
+        n (int): Tamanho dos n-gramas
+        frequencia_maxima (float): Fração máxima de documentos em que um
+            n-grama pode aparecer para ser usado na busca
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, n: int = 3, frequencia_maxima: float = 0.2):
+        """
+        Inicializa o índice.
+
+        Args:
+            n: Tamanho dos n-gramas
+            frequencia_maxima: Fração máxima de documentos por n-grama
+                (n-gramas muito comuns, como "BR ", não discriminam)
+        """
+        self.n = n
+        self.frequencia_maxima = frequencia_maxima
+        self.logger = logging.getLogger("indice_ngramas")
+        self._postings: Dict[str, List[int]] = {}
+        self._tamanhos: List[int] = []
+
+    def ngramas(self, texto: Any) -> set:
+        """
+        Extrai o conjunto de n-gramas de um texto normalizado.
+
+        Args:
+            texto: Texto original
+
+        Returns:
+            Conjunto de n-gramas
+        """
+        normalizado = normalizar_texto(texto)
+        if not normalizado:
+            return set()
+
+        preenchido = f" {normalizado} "
+        if len(preenchido) < self.n:
+            return {preenchido}
+        return {preenchido[i:i + self.n] for i in range(len(preenchido) - self.n + 1)}
+
+    def adicionar(self, texto: Any) -> int:
+        """
+        Adiciona um texto ao índice.
+
+        Args:
+            texto: Texto a indexar
+
+        Returns:
+            Identificador do texto no índice (posição de inserção)
+        """
+        identificador = len(self._tamanhos)
+        gramas = self.ngramas(texto)
+
+        for grama in gramas:
+            self._postings.setdefault(grama, []).append(identificador)
+        self._tamanhos.append(len(gramas))
+
+        return identificador
+
+    def buscar(self, texto: Any, limiar: float = 0.6, max_resultados: int = 5) -> List[Tuple[int, float]]:
+        """
+        Busca os textos indexados mais parecidos com o texto informado.
+
+        Args:
+            texto: Texto procurado
+            limiar: Similaridade mínima (Dice, entre 0 e 1)
+            max_resultados: Número máximo de candidatos retornados
+
+        Returns:
+            Lista de pares (identificador, similaridade), do mais parecido
+            para o menos parecido
+        """
+        gramas = self.ngramas(texto)
+        if not gramas:
+            return []
+
+        # Em índices pequenos todos os n-gramas são usados
+        limite_postings = max(_MIN_POSTINGS, int(self.frequencia_maxima * len(self._tamanhos)))
+        comuns: Counter = Counter()
+
+        for grama in gramas:
+            postings = self._postings.get(grama)
+            if postings and len(postings) <= limite_postings:
+                comuns.update(postings)
+
+        resultados = []
+        for identificador, compartilhados in comuns.items():
+            similaridade = 2.0 * compartilhados / (len(gramas) + self._tamanhos[identificador])
+            if similaridade >= limiar:
+                resultados.append((identificador, similaridade))
+
+        resultados.sort(key=lambda par: par[1], reverse=True)
+        return resultados[:max_resultados]
+
+    def __len__(self) -> int:
+        """Retorna o número de textos indexados."""
+        return len(self._tamanhos)
+
+
+def casar_aproximado(esquerda: List[Dict[str, Any]], direita: List[Dict[str, Any]],
+                     campo_esquerda: str, campo_direita: Optional[str] = None,
+                     limiar: float = 0.6, n: int = 3) -> Dict[str, Any]:
+    """
+    Casa registros não casados pela similaridade de um campo texto.
+
+    O lado direito é indexado; cada registro da esquerda consulta o índice e
+    os pares são atribuídos de forma gulosa, do mais parecido para o menos
+    parecido, sem reutilizar registros.
+
+    Args:
+        esquerda: Registros não casados do lado esquerdo
+        direita: Registros não casados do lado direito
+        campo_esquerda: Campo texto do lado esquerdo (ex.: "ativo")
+        campo_direita: Campo texto do lado direito (padrão: o mesmo da esquerda)
+        limiar: Similaridade mínima para aceitar um par
+        n: Tamanho dos n-gramas
+
+    Returns:
+        Dicionário com `pares` (índices e similaridade) e os índices
+        `nao_casados_esquerda`/`nao_casados_direita`
+    """
+    campo_direita = campo_direita or campo_esquerda
+    indice = IndiceNGramas(n=n)
+    for registro in direita:
+        indice.adicionar(registro.get(campo_direita))
+
+    candidatos = []
+    for posicao, registro in enumerate(esquerda):
+        for identificador, similaridade in indice.buscar(registro.get(campo_esquerda), limiar):
+            candidatos.append((similaridade, posicao, identificador))
+
+    candidatos.sort(key=lambda item: item[0], reverse=True)
+    usados_esq = set()
+    usados_dir = set()
+    pares = []
+
+    for similaridade, posicao, identificador in candidatos:
+        if posicao in usados_esq or identificador in usados_dir:
+            continue
+        usados_esq.add(posicao)
+        usados_dir.add(identificador)
+        pares.append({"esquerda": posicao, "direita": identificador, "similaridade": round(similaridade, 4)})
+
+    logging.getLogger("indice_ngramas").info(
+        f"🔎 Casamento aproximado: {len(pares)} pares com similaridade >= {limiar}"
+    )
+
+    return {
+        "pares": pares,
+        "nao_casados_esquerda": [i for i in range(len(esquerda)) if i not in usados_esq],
+        "nao_casados_direita": [i for i in range(len(direita)) if i not in usados_dir]
+    }
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Motor de alertas com estado persistente no banco de status.
+
+Os alertas ficam na tabela `alertas` do banco do StatusReporter. A cada
+avaliação, apenas os módulos cujo status mudou desde a última versão de
+dados avaliada e os prazos de inatividade já vencidos são processados.
+Alertas repetidos são agrupados pela chave de deduplicação e podem ser
+reconhecidos pela equipe.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+import logging
+import sqlite3
+
+if TYPE_CHECKING:
+    from shared.status_reporter import StatusReporter
+
+
+def _instante(momento: datetime) -> str:
+    """
+    Formata um instante para comparação textual no banco.
+
+    Args:
+        momento: Instante a formatar
+
+    Returns:
+        Texto no formato YYYY-MM-DD HH:MM:SS.ffffff
+    """
+    return momento.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class MotorAlertas:
+    """
+    Avalia regras de alerta de forma incremental e guarda o estado no banco.
+
+    Regras:
+        - erro: módulo com status "erro" (resolvido no próximo sucesso)
+        - inatividade: módulo crítico parado há mais de `limite_inatividade_segundos`
+          (resolvido na próxima atualização do módulo)
+
+    Attributes:
+        status_reporter (StatusReporter): Acesso ao banco de status
+        limite_inatividade_segundos (int): Tempo sem atualização que gera
+            alerta de inatividade em módulos críticos
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, status_reporter: "StatusReporter", limite_inatividade_segundos: int = 3600):
+        """
+        Inicializa o motor de alertas.
+
+        Args:
+            status_reporter: Reporter cujo banco guarda status e alertas
+            limite_inatividade_segundos: Tempo sem atualização que gera alerta
+                de inatividade em módulos críticos
+        """
+        self.status_reporter = status_reporter
+        self.limite_inatividade_segundos = limite_inatividade_segundos
+        self.logger = logging.getLogger("motor_alertas")
+
+    def _descrever_limite(self) -> str:
+        """
+        Descreve o limite de inatividade para as mensagens.
+
+        Returns:
+            Texto como "1 hora" ou "30 minutos"
+        """
+        segundos = self.limite_inatividade_segundos
+        if segundos % 3600 == 0:
+            horas = segundos // 3600
+            return f"{horas} hora" if horas == 1 else f"{horas} horas"
+        minutos = max(1, segundos // 60)
+        return f"{minutos} minuto" if minutos == 1 else f"{minutos} minutos"
+
+    def avaliar(self) -> int:
+        """
+        Avalia as regras para os módulos alterados e os prazos vencidos.
+
+        Sem mudanças nem prazos vencidos, custa uma única consulta de leitura.
+
+        Returns:
+            Número de alertas criados, atualizados ou resolvidos
+        """
+        agora = datetime.now()
+        agora_txt = _instante(agora)
+
+        try:
+            with self.status_reporter.conexao_leitura() as conn:
+                versao_atual, versao_avaliada, proximo_prazo = conn.execute("""
+                    SELECT (SELECT versao FROM controle_versao WHERE id = 1),
+                           (SELECT versao_avaliada FROM estado_alertas WHERE id = 1),
+                           (SELECT MIN(vence_em) FROM prazos_alertas)
+                """).fetchone()
+
+            if versao_atual == versao_avaliada and (proximo_prazo is None or proximo_prazo > agora_txt):
+                return 0
+
+            alteracoes = 0
+            with self.status_reporter.conexao() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Relido dentro do lock de escrita: outro processo pode ter avaliado antes
+                versao_avaliada = cursor.execute(
+                    "SELECT versao_avaliada FROM estado_alertas WHERE id = 1"
+                ).fetchone()[0]
+
+                modulos = cursor.execute("""
+                    SELECT nome_modulo, criticidade, status, erro, timestamp_atualizacao, timestamp_fim
+                    FROM status_modulos
+                    WHERE versao > ?
+                """, (versao_avaliada,)).fetchall()
+
+                for modulo in modulos:
+                    alteracoes += self._avaliar_modulo(cursor, *modulo, agora=agora)
+
+                vencidos = cursor.execute(
+                    "SELECT nome_modulo, vence_em FROM prazos_alertas WHERE vence_em <= ?", (agora_txt,)
+                ).fetchall()
+
+                for nome_modulo, vence_em in vencidos:
+                    alteracoes += self._disparar_inatividade(cursor, nome_modulo, vence_em, agora)
+
+                # Inclui as versões geradas pelos próprios alertas, que não exigem nova avaliação
+                cursor.execute("""
+                    UPDATE estado_alertas
+                    SET versao_avaliada = (SELECT versao FROM controle_versao WHERE id = 1)
+                    WHERE id = 1
+                """)
+
+            if alteracoes:
+                self.logger.info(f"🚨 Alertas avaliados: {len(modulos)} módulos alterados, "
+                                 f"{len(vencidos)} prazos vencidos, {alteracoes} alterações")
+            return alteracoes
+
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao avaliar alertas: {e}")
+            return 0
+
+    def _avaliar_modulo(self, cursor: sqlite3.Cursor, nome_modulo: str, criticidade: str,
+                        status: str, erro: Optional[str], timestamp_atualizacao: Optional[str],
+                        timestamp_fim: Optional[str], agora: datetime) -> int:
+        """
+        Aplica as regras a um módulo cujo status mudou.
+
+        Args:
+            cursor: Cursor dentro da transação de avaliação
+            nome_modulo: Nome do módulo
+            criticidade: Criticidade do módulo
+            status: Status atual
+            erro: Descrição do último erro
+            timestamp_atualizacao: Última atualização do status
+            timestamp_fim: Fim da última execução
+            agora: Instante da avaliação
+
+        Returns:
+            Número de alertas criados, atualizados ou resolvidos
+        """
+        alteracoes = 0
+
+        if status == "erro":
+            alteracoes += self._abrir_alerta(
+                cursor, f"erro:{nome_modulo}", "erro", criticidade, nome_modulo,
+                f"Módulo {nome_modulo} falhou: {erro or 'Erro desconhecido'}",
+                timestamp_fim or timestamp_atualizacao, agora
+            )
+        elif status == "sucesso":
+            alteracoes += self._resolver_alerta(cursor, f"erro:{nome_modulo}", agora)
+
+        # Qualquer atualização do módulo reinicia a contagem de inatividade
+        alteracoes += self._resolver_alerta(cursor, f"inatividade:{nome_modulo}", agora)
+
+        if criticidade == "critica" and status != "executando" and timestamp_atualizacao:
+            vence_em = datetime.fromisoformat(timestamp_atualizacao) + timedelta(seconds=self.limite_inatividade_segundos)
+            cursor.execute("""
+                INSERT INTO prazos_alertas (nome_modulo, vence_em) VALUES (?, ?)
+                ON CONFLICT (nome_modulo) DO UPDATE SET vence_em = excluded.vence_em
+            """, (nome_modulo, _instante(vence_em)))
+        else:
+            cursor.execute("DELETE FROM prazos_alertas WHERE nome_modulo = ?", (nome_modulo,))
+
+        return alteracoes
+
+    def _disparar_inatividade(self, cursor: sqlite3.Cursor, nome_modulo: str,
+                              vence_em: str, agora: datetime) -> int:
+        """
+        Abre o alerta de inatividade de um módulo crítico cujo prazo venceu.
+
+        Args:
+            cursor: Cursor dentro da transação de avaliação
+            nome_modulo: Nome do módulo
+            vence_em: Prazo vencido
+            agora: Instante da avaliação
+
+        Returns:
+            Número de alertas criados ou atualizados
+        """
+        cursor.execute("DELETE FROM prazos_alertas WHERE nome_modulo = ?", (nome_modulo,))
+        return self._abrir_alerta(
+            cursor, f"inatividade:{nome_modulo}", "atencao", "critica", nome_modulo,
+            f"Módulo crítico {nome_modulo} não executado há mais de {self._descrever_limite()}",
+            vence_em, agora
+        )
+
+    def _abrir_alerta(self, cursor: sqlite3.Cursor, chave_dedup: str, tipo: str, criticidade: str,
+                      nome_modulo: str, mensagem: str, referencia: Optional[str], agora: datetime) -> int:
+        """
+        Abre um alerta ou registra nova ocorrência do alerta ativo de mesma chave.
+
+        A mesma ocorrência (mesma `referencia`) vista de novo não é contada.
+        Uma nova ocorrência reabre um alerta já reconhecido.
+
+        Args:
+            cursor: Cursor dentro da transação de avaliação
+            chave_dedup: Chave que identifica o alerta ativo
+            tipo: Tipo do alerta ("erro", "atencao")
+            criticidade: Criticidade do alerta
+            nome_modulo: Módulo do alerta
+            mensagem: Mensagem do alerta
+            referencia: Identificação da ocorrência (ex.: fim da execução)
+            agora: Instante da avaliação
+
+        Returns:
+            1 se o alerta foi criado ou atualizado, 0 caso contrário
+        """
+        ativo = cursor.execute(
+            "SELECT id, referencia FROM alertas WHERE chave_dedup = ? AND estado != 'resolvido'",
+            (chave_dedup,)
+        ).fetchone()
+
+        if ativo is None:
+            cursor.execute("""
+                INSERT INTO alertas
+                (chave_dedup, tipo, criticidade, nome_modulo, mensagem, estado, ocorrencias,
+                 referencia, timestamp_criacao, timestamp_atualizacao)
+                VALUES (?, ?, ?, ?, ?, 'aberto', 1, ?, ?, ?)
+            """, (chave_dedup, tipo, criticidade, nome_modulo, mensagem, referencia, agora, agora))
+            return 1
+
+        if ativo[1] == referencia:
+            return 0
+
+        cursor.execute("""
+            UPDATE alertas
+            SET ocorrencias = ocorrencias + 1, mensagem = ?, referencia = ?,
+                estado = 'aberto', timestamp_atualizacao = ?
+            WHERE id = ?
+        """, (mensagem, referencia, agora, ativo[0]))
+        return 1
+
+    def _resolver_alerta(self, cursor: sqlite3.Cursor, chave_dedup: str, agora: datetime) -> int:
+        """
+        Resolve o alerta ativo de uma chave, se houver.
+
+        Args:
+            cursor: Cursor dentro da transação de avaliação
+            chave_dedup: Chave do alerta
+            agora: Instante da avaliação
+
+        Returns:
+            Número de alertas resolvidos
+        """
+        cursor.execute("""
+            UPDATE alertas
+            SET estado = 'resolvido', timestamp_resolucao = ?, timestamp_atualizacao = ?
+            WHERE chave_dedup = ? AND estado != 'resolvido'
+        """, (agora, agora, chave_dedup))
+        return cursor.rowcount
+
+    def alertas_abertos(self, criticidade: Optional[str] = None,
+                        incluir_reconhecidos: bool = True) -> List[Dict[str, Any]]:
+        """
+        Lista os alertas ativos, do mais recente para o mais antigo.
+
+        Args:
+            criticidade: Filtra por criticidade (None = todas)
+            incluir_reconhecidos: Se False, lista apenas alertas não reconhecidos
+
+        Returns:
+            Lista de alertas
+        """
+        condicoes = ["estado != 'resolvido'"]
+        params: List[Any] = []
+        if not incluir_reconhecidos:
+            condicoes.append("estado = 'aberto'")
+        if criticidade:
+            condicoes.append("criticidade = ?")
+            params.append(criticidade)
+
+        try:
+            with self.status_reporter.conexao_leitura() as conn:
+                linhas = conn.execute(f"""
+                    SELECT id, tipo, criticidade, nome_modulo, mensagem, estado, ocorrencias,
+                           timestamp_criacao, timestamp_atualizacao, reconhecido_por
+                    FROM alertas
+                    WHERE {' AND '.join(condicoes)}
+                    ORDER BY timestamp_atualizacao DESC
+                """, params).fetchall()
+
+            return [
+                {
+                    "id": linha[0],
+                    "tipo": linha[1],
+                    "criticidade": linha[2],
+                    "modulo": linha[3],
+                    "mensagem": linha[4],
+                    "estado": linha[5],
+                    "ocorrencias": linha[6],
+                    "timestamp_criacao": linha[7],
+                    "timestamp": linha[8],
+                    "reconhecido_por": linha[9]
+                }
+                for linha in linhas
+            ]
+
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao listar alertas: {e}")
+            return []
+
+    def reconhecer(self, id_alerta: int, usuario: str = "") -> bool:
+        """
+        Marca um alerta aberto como reconhecido.
+
+        O alerta continua ativo até ser resolvido pelas regras; uma nova
+        ocorrência o reabre.
+
+        Args:
+            id_alerta: Identificador do alerta
+            usuario: Quem reconheceu o alerta
+
+        Returns:
+            True se o alerta estava aberto e foi reconhecido
+        """
+        try:
+            with self.status_reporter.conexao() as conn:
+                cursor = conn.execute("""
+                    UPDATE alertas
+                    SET estado = 'reconhecido', timestamp_reconhecimento = ?, reconhecido_por = ?
+                    WHERE id = ? AND estado = 'aberto'
+                """, (datetime.now(), usuario, id_alerta))
+                reconhecido = cursor.rowcount > 0
+
+            if reconhecido:
+                self.logger.info(f"👀 Alerta {id_alerta} reconhecido por {usuario or 'usuário'}")
+            return reconhecido
+
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao reconhecer alerta {id_alerta}: {e}")
+            return False
@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+Motor de comparação colunar para conciliações.
+
+Este módulo fornece um motor vetorizado (NumPy) que alinha dois conjuntos
+de colunas por chave (sistema vs. fonte) e aplica as tolerâncias de
+`validacoes` de uma só vez, sem laços Python por registro.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Any, List, Sequence, Tuple
+import hashlib
+import logging
+
+import numpy as np
+
+
+# Limite para códigos compostos antes de refatorar (evita overflow de int64)
+_LIMITE_CODIGO = 2 ** 62
+
+# Constantes do finalizador splitmix64 usado para misturar hashes
+_SEMENTE_HASH = np.uint64(0x9E3779B97F4A7C15)
+_MULT_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MULT_2 = np.uint64(0x94D049BB133111EB)
+
+# Hash único de valores ausentes e marca que separa datas de números
+_HASH_NULO = np.uint64(0x6A09E667F3BCC908)
+_MARCA_DATA = np.uint64(0x3C6EF372FE94F82B)
+
+
+def _fatorar(sistema: Sequence, fonte: Sequence) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Converte duas colunas de chave em códigos inteiros comparáveis.
+
+    Args:
+        sistema: Valores da coluna no lado do sistema
+        fonte: Valores da coluna no lado da fonte
+
+    Returns:
+        Tupla (códigos do sistema, códigos da fonte, cardinalidade)
+    """
+    a = np.asarray(sistema)
+    b = np.asarray(fonte)
+
+    try:
+        unicos, codigos = np.unique(np.concatenate([a, b]), return_inverse=True)
+    except TypeError:
+        # Tipos mistos (ex.: None com texto): comparar como texto
+        unicos, codigos = np.unique(
+            np.concatenate([a.astype(str), b.astype(str)]), return_inverse=True
+        )
+
+    codigos = codigos.reshape(-1).astype(np.int64)
+    return codigos[:len(a)], codigos[len(a):], len(unicos)
+
+
+def codificar_chaves(sistema: Dict[str, Sequence], fonte: Dict[str, Sequence],
+                     chaves: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gera um código inteiro por registro a partir de uma chave composta.
+
+    Registros com a mesma combinação de valores de chave recebem o mesmo
+    código nos dois lados.
+
+    Args:
+        sistema: Colunas do sistema
+        fonte: Colunas da fonte
+        chaves: Nomes das colunas que compõem a chave
+
+    Returns:
+        Tupla (códigos do sistema, códigos da fonte)
+
+    Raises:
+        ValueError: Se nenhuma coluna de chave for informada
+    """
+    if not chaves:
+        raise ValueError("Informe ao menos uma coluna de chave")
+
+    codigos_sis, codigos_fon, cardinalidade = _fatorar(sistema[chaves[0]], fonte[chaves[0]])
+
+    for chave in chaves[1:]:
+        cod_sis, cod_fon, card = _fatorar(sistema[chave], fonte[chave])
+
+        if cardinalidade * card >= _LIMITE_CODIGO:
+            # Compactar códigos acumulados antes de combinar
+            codigos_sis, codigos_fon, cardinalidade = _fatorar(codigos_sis, codigos_fon)
+
+        codigos_sis = codigos_sis * card + cod_sis
+        codigos_fon = codigos_fon * card + cod_fon
+        cardinalidade *= card
+
+    return codigos_sis, codigos_fon
+
+
+def _misturar(valores: np.ndarray) -> np.ndarray:
+    """
+    Aplica o finalizador splitmix64 a um array uint64.
+
+    Args:
+        valores: Array uint64
+
+    Returns:
+        Array uint64 com bits bem distribuídos
+    """
+    with np.errstate(over='ignore'):
+        valores = valores ^ (valores >> np.uint64(30))
+        valores = valores * _MULT_1
+        valores = valores ^ (valores >> np.uint64(27))
+        valores = valores * _MULT_2
+        return valores ^ (valores >> np.uint64(31))
+
+
+def _hash_numeros(numeros: np.ndarray) -> np.ndarray:
+    """
+    Calcula o hash de números pelos bits do float64 (nulos ainda não tratados).
+
+    Args:
+        numeros: Array numérico
+
+    Returns:
+        Array uint64 com o hash de cada valor
+    """
+    numeros = numeros.astype(np.float64)
+    return np.where(numeros == 0, 0.0, numeros).view(np.uint64)  # unificar -0.0 e 0.0
+
+
+def _hash_datas(datas: np.ndarray) -> np.ndarray:
+    """
+    Calcula o hash de datas pelos microssegundos desde a época.
+
+    Args:
+        datas: Array datetime64
+
+    Returns:
+        Array uint64 com o hash de cada valor
+    """
+    return _misturar(datas.astype('datetime64[us]').view(np.int64).view(np.uint64) ^ _MARCA_DATA)
+
+
+def _hash_textos(textos: Sequence[str]) -> np.ndarray:
+    """
+    Resume textos com blake2b, uma vez por valor distinto.
+
+    Args:
+        textos: Textos a resumir
+
+    Returns:
+        Array uint64 com o hash de cada texto
+    """
+    unicos, inverso = np.unique(np.asarray(textos, dtype=str), return_inverse=True)
+    resumos = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(valor.encode(), digest_size=8).digest(), 'little')
+         for valor in unicos.tolist()),
+        dtype=np.uint64,
+        count=len(unicos)
+    )
+    return resumos[inverso.reshape(-1)]
+
+
+def _hash_coluna(valores: Sequence) -> np.ndarray:
+    """
+    Calcula um hash estável (entre execuções) para cada valor da coluna.
+
+    O hash depende só do valor, nunca do dtype do array: um mesmo valor
+    tem o mesmo hash em um bloco numérico limpo e em um bloco `object`
+    (com None ou tipos misturados). Números são comparados como float64
+    (1 e 1.0 têm o mesmo hash), datas pelos microssegundos, textos com
+    blake2b (uma vez por valor distinto) e ausentes (None, NaN, NaT e
+    texto vazio, como gravado por `para_array`) recebem um único sentinela.
+
+    Args:
+        valores: Valores da coluna
+
+    Returns:
+        Array uint64 com o hash de cada valor
+    """
+    array = np.asarray(valores)
+    if array.dtype.kind in 'US' and not isinstance(valores, np.ndarray):
+        # Listas mistas ([1, "a"]) viram texto no NumPy: classificar valor a valor
+        array = np.asarray(valores, dtype=object)
+    if array.ndim != 1:
+        array = array.reshape(-1)
+
+    if array.dtype.kind in 'biuf':
+        resultado = _hash_numeros(array)
+        if array.dtype.kind == 'f':
+            resultado[np.isnan(array)] = _HASH_NULO
+        return resultado
+
+    if array.dtype.kind == 'M':
+        resultado = _hash_datas(array)
+        resultado[np.isnat(array)] = _HASH_NULO
+        return resultado
+
+    if array.dtype.kind in 'US':
+        resultado = _hash_textos(array)
+        resultado[array == array.dtype.type()] = _HASH_NULO
+        return resultado
+
+    # Coluna `object`: classificar cada valor pelo seu tipo
+    resultado = np.full(len(array), _HASH_NULO, dtype=np.uint64)
+    numeros, datas, textos = [], [], []
+    for posicao, valor in enumerate(array.tolist()):
+        if valor is None or (isinstance(valor, float) and valor != valor):
+            continue
+        if isinstance(valor, str):
+            if valor:
+                textos.append((posicao, valor))
+        elif isinstance(valor, (datetime, date, np.datetime64)):
+            if not np.isnat(np.datetime64(valor, 'us')):
+                datas.append((posicao, valor))
+        elif isinstance(valor, (int, float, np.number)):
+            numeros.append((posicao, valor))
+        else:
+            textos.append((posicao, str(valor)))
+
+    for grupo, calcular, dtype in ((numeros, _hash_numeros, np.float64),
+                                   (datas, _hash_datas, 'datetime64[us]'),
+                                   (textos, _hash_textos, None)):
+        if grupo:
+            posicoes, itens = zip(*grupo)
+            resultado[list(posicoes)] = calcular(np.asarray(itens, dtype=dtype))
+
+    return resultado
+
+
+def hash_linhas(colunas: Dict[str, Sequence], nomes: List[str]) -> np.ndarray:
+    """
+    Calcula um hash de 64 bits por linha sobre as colunas informadas.
+
+    O hash é estável entre processos e execuções, podendo ser gravado em
+    disco e comparado com o de outro dia.
+
+    Args:
+        colunas: Colunas dos dados (nome -> valores)
+        nomes: Colunas que participam do hash, na ordem informada
+
+    Returns:
+        Array uint64 com o hash de cada linha
+    """
+    if not nomes:
+        raise ValueError("Informe ao menos uma coluna para o hash")
+
+    resultado = None
+    with np.errstate(over='ignore'):
+        for posicao, nome in enumerate(nomes):
+            parcial = _misturar(_hash_coluna(colunas[nome]) + _SEMENTE_HASH * np.uint64(posicao + 1))
+            resultado = parcial if resultado is None else _misturar(resultado * _MULT_1 + parcial)
+
+    return resultado
+
+
+def limite_tolerancia(referencia: Any, tolerancia_percentual: float = 0.0,
+                      tolerancia_absoluta: float = 0.0) -> np.ndarray:
+    """
+    Calcula a diferença máxima aceita em relação a um valor de referência.
+
+    É o maior entre a tolerância absoluta e `tolerancia_percentual` (em %)
+    da referência. Aceita escalares ou arrays.
+
+    Args:
+        referencia: Valor(es) de referência (ex.: fonte, alvo de uma soma)
+        tolerancia_percentual: Tolerância relativa em percentual (0.01 = 0,01%)
+        tolerancia_absoluta: Tolerância absoluta na unidade do valor
+
+    Returns:
+        Diferença absoluta máxima aceita, no formato da referência
+    """
+    referencia = np.asarray(referencia, dtype=np.float64)
+    return np.maximum(tolerancia_absoluta, np.abs(referencia) * (tolerancia_percentual / 100.0))
+
+
+def dentro_tolerancia(sistema: Any, fonte: Any,
+                      tolerancia_percentual: float = 0.0,
+                      tolerancia_absoluta: float = 0.0) -> np.ndarray:
+    """
+    Verifica, elemento a elemento, se os valores estão dentro da tolerância.
+
+    A diferença é aceita quando não excede `limite_tolerancia` do valor da
+    fonte. Dois valores ausentes (NaN ou None) são considerados iguais.
+    Aceita escalares (retorna um booleano NumPy) ou arrays.
+
+    Args:
+        sistema: Valores do sistema
+        fonte: Valores da fonte
+        tolerancia_percentual: Tolerância relativa em percentual (0.01 = 0,01%)
+        tolerancia_absoluta: Tolerância absoluta na unidade do valor
+
+    Returns:
+        Máscara booleana com True para valores conciliados
+    """
+    sistema = np.asarray(sistema, dtype=np.float64)
+    fonte = np.asarray(fonte, dtype=np.float64)
+
+    limite = limite_tolerancia(fonte, tolerancia_percentual, tolerancia_absoluta)
+
+    with np.errstate(invalid='ignore'):
+        conciliado = np.abs(sistema - fonte) <= limite
+
+    return conciliado | (np.isnan(sistema) & np.isnan(fonte))
+
+
+def montar_resultado_validacao(total_registros: int, registros_validos: int,
+                               erros: List[Dict[str, Any]], alertas: List[Dict[str, Any]],
+                               inicio: datetime, **extras: Any) -> Dict[str, Any]:
+    """
+    Monta o dicionário de resultado no formato de `_executar_validacoes`.
+
+    É o formato consumido por `StatusReporter.reportar_sucesso`.
+
+    Args:
+        total_registros: Total de registros avaliados
+        registros_validos: Registros conciliados
+        erros: Lista de erros encontrados
+        alertas: Lista de alertas encontrados
+        inicio: Instante de início da validação
+        **extras: Campos adicionais a incluir no resultado
+
+    Returns:
+        Resultado padronizado
+    """
+    resultado = {
+        "status": "sucesso",
+        "total_registros": total_registros,
+        "registros_validos": registros_validos,
+        "registros_invalidos": total_registros - registros_validos,
+        "erros": erros,
+        "alertas": alertas,
+        "metricas": {
+            "tempo_execucao": (datetime.now() - inicio).total_seconds(),
+            "taxa_sucesso": (registros_validos / total_registros * 100) if total_registros > 0 else 100.0
+        }
+    }
+    resultado.update(extras)
+    return resultado
+
+
+class MotorComparacao:
+    """
+    Motor vetorizado de comparação entre colunas do sistema e da fonte.
+
+    Attributes:
+        tolerancia_percentual (float): Tolerância relativa em percentual
+        tolerancia_absoluta (float): Tolerância absoluta
+        max_divergencias_detalhadas (int): Limite de divergências detalhadas no resultado
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, tolerancia_percentual: float = 0.0, tolerancia_absoluta: float = 0.0,
+                 max_divergencias_detalhadas: int = 1000):
+        """
+        Inicializa o motor de comparação.
+
+        Args:
+            tolerancia_percentual: Tolerância relativa em percentual
+            tolerancia_absoluta: Tolerância absoluta
+            max_divergencias_detalhadas: Máximo de divergências listadas no resultado
+        """
+        self.tolerancia_percentual = tolerancia_percentual
+        self.tolerancia_absoluta = tolerancia_absoluta
+        self.max_divergencias_detalhadas = max_divergencias_detalhadas
+        self.logger = logging.getLogger("motor_comparacao")
+
+    @classmethod
+    def a_partir_de_config(cls, config: Dict[str, Any]) -> "MotorComparacao":
+        """
+        Cria o motor a partir da seção `validacoes` da configuração do módulo.
+
+        Args:
+            config: Configuração completa do módulo
+
+        Returns:
+            Motor configurado
+        """
+        validacoes = config.get("validacoes", {})
+        return cls(
+            tolerancia_percentual=validacoes.get("tolerancia_percentual", 0.0),
+            tolerancia_absoluta=validacoes.get("tolerancia_absoluta", 0.0),
+            max_divergencias_detalhadas=validacoes.get("max_divergencias_detalhadas", 1000)
+        )
+
+    def validar_pares(self, colunas: Dict[str, Sequence], pares: Dict[str, str]) -> np.ndarray:
+        """
+        Valida linhas que já trazem os valores do sistema e da fonte lado a lado.
+
+        Args:
+            colunas: Colunas dos dados (nome -> valores)
+            pares: Mapeamento coluna do sistema -> coluna da fonte
+
+        Returns:
+            Máscara booleana com True para linhas conciliadas em todas as colunas
+        """
+        total = len(np.asarray(colunas[next(iter(colunas))])) if colunas else 0
+        valido = np.ones(total, dtype=bool)
+
+        for coluna_sistema, coluna_fonte in pares.items():
+            valido &= dentro_tolerancia(
+                colunas[coluna_sistema], colunas[coluna_fonte],
+                self.tolerancia_percentual, self.tolerancia_absoluta
+            )
+
+        return valido
+
+    def alinhar(self, sistema: Dict[str, Sequence], fonte: Dict[str, Sequence],
+                chaves: List[str]) -> np.ndarray:
+        """
+        Localiza, para cada registro do sistema, o registro da fonte com a mesma chave.
+
+        Se a chave se repete na fonte, vale o primeiro registro; as
+        repetições são apontadas por `comparar`.
+
+        Args:
+            sistema: Colunas do sistema
+            fonte: Colunas da fonte
+            chaves: Colunas que compõem a chave
+
+        Returns:
+            Array com o índice do registro na fonte (-1 quando ausente)
+        """
+        return self._alinhar_codigos(*codificar_chaves(sistema, fonte, chaves))
+
+    @staticmethod
+    def _alinhar_codigos(codigos_sis: np.ndarray, codigos_fon: np.ndarray) -> np.ndarray:
+        """
+        Alinha os códigos de chave do sistema aos da fonte.
+
+        Args:
+            codigos_sis: Códigos de chave do sistema
+            codigos_fon: Códigos de chave da fonte
+
+        Returns:
+            Array com o índice do primeiro registro da fonte com o mesmo código (-1 quando ausente)
+        """
+        if len(codigos_fon) == 0:
+            return np.full(len(codigos_sis), -1, dtype=np.int64)
+
+        ordem = np.argsort(codigos_fon, kind='stable')
+        ordenados = codigos_fon[ordem]
+        posicoes = np.minimum(np.searchsorted(ordenados, codigos_sis), len(ordenados) - 1)
+        encontrado = ordenados[posicoes] == codigos_sis
+
+        return np.where(encontrado, ordem[posicoes], -1)
+
+    def _duplicadas_fonte(self, fonte: Dict[str, Sequence], chaves: List[str],
+                          codigos_fon: np.ndarray) -> Tuple[np.ndarray, int, List[Dict[str, Any]]]:
+        """
+        Identifica chaves que aparecem mais de uma vez na fonte.
+
+        Args:
+            fonte: Colunas da fonte
+            chaves: Colunas que compõem a chave
+            codigos_fon: Códigos de chave da fonte
+
+        Returns:
+            Tupla (códigos repetidos, registros além do primeiro de cada chave,
+            detalhes das chaves repetidas com as linhas da fonte)
+        """
+        ordem = np.argsort(codigos_fon, kind='stable')
+        ordenados = codigos_fon[ordem]
+        inicio = np.flatnonzero(np.r_[True, ordenados[1:] != ordenados[:-1]]) if len(ordenados) \
+            else np.empty(0, dtype=np.int64)
+        tamanhos = np.diff(np.r_[inicio, len(ordenados)])
+        grupos = np.flatnonzero(tamanhos > 1)
+
+        detalhes = []
+        for grupo in grupos[:self.max_divergencias_detalhadas].tolist():
+            linhas = np.sort(ordem[inicio[grupo]:inicio[grupo] + tamanhos[grupo]])
+            detalhes.append({
+                "chave": {chave: np.asarray(fonte[chave])[linhas[0]].item() for chave in chaves},
+                "linhas_fonte": linhas.tolist()
+            })
+
+        return ordenados[inicio[grupos]], int((tamanhos[grupos] - 1).sum()), detalhes
+
+    def avaliar(self, sistema: Dict[str, Sequence], fonte: Dict[str, Sequence],
+                indice_fonte: np.ndarray, colunas_valor: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Aplica as tolerâncias às colunas de valor já alinhadas.
+
+        Args:
+            sistema: Colunas do sistema
+            fonte: Colunas da fonte
+            indice_fonte: Resultado de `alinhar`
+            colunas_valor: Colunas numéricas a comparar
+
+        Returns:
+            Máscara de divergência por coluna (True = divergente)
+        """
+        presente = indice_fonte >= 0
+        indice = np.where(presente, indice_fonte, 0)
+        divergencias = {}
+
+        for coluna in colunas_valor:
+            valores_sis = np.asarray(sistema[coluna], dtype=np.float64)
+            valores_fon = np.asarray(fonte[coluna], dtype=np.float64)
+
+            if len(valores_fon) == 0:
+                divergencias[coluna] = np.zeros(len(valores_sis), dtype=bool)
+                continue
+
+            conciliado = dentro_tolerancia(
+                valores_sis, valores_fon[indice],
+                self.tolerancia_percentual, self.tolerancia_absoluta
+            )
+            divergencias[coluna] = presente & ~conciliado
+
+        return divergencias
+
+    def comparar(self, sistema: Dict[str, Sequence], fonte: Dict[str, Sequence],
+                 chaves: List[str], colunas_valor: List[str]) -> Dict[str, Any]:
+        """
+        Compara sistema e fonte por chave e aplica as tolerâncias configuradas.
+
+        Registros do sistema sem correspondente na fonte contam como inválidos.
+        Registros apenas na fonte são contabilizados à parte. Chaves repetidas
+        na fonte são listadas em `chaves_duplicadas_fonte`, e os registros do
+        sistema com essas chaves (comparados com a primeira ocorrência)
+        contados em `registros_ambiguos`.
+
+        Args:
+            sistema: Colunas do sistema (nome da coluna -> valores)
+            fonte: Colunas da fonte (nome da coluna -> valores)
+            chaves: Colunas que compõem a chave
+            colunas_valor: Colunas numéricas a comparar
+
+        Returns:
+            Dicionário com contagens e divergências encontradas
+        """
+        codigos_sis, codigos_fon = codificar_chaves(sistema, fonte, chaves)
+        indice_fonte = self._alinhar_codigos(codigos_sis, codigos_fon)
+        divergencias = self.avaliar(sistema, fonte, indice_fonte, colunas_valor)
+        repetidos, duplicados_fonte, chaves_duplicadas = self._duplicadas_fonte(fonte, chaves, codigos_fon)
+
+        total_sistema = len(indice_fonte)
+        total_fonte = len(np.asarray(fonte[chaves[0]]))
+
+        ausente_fonte = indice_fonte < 0
+        divergente = np.zeros(total_sistema, dtype=bool)
+        for mascara in divergencias.values():
+            divergente |= mascara
+        invalido = divergente | ausente_fonte
+
+        # Repetições de uma chave presente no sistema não contam como "apenas na fonte"
+        correspondidos = np.isin(codigos_fon, codigos_sis)
+        ambiguos = int(np.isin(codigos_sis, repetidos).sum()) if len(repetidos) else 0
+
+        if duplicados_fonte:
+            self.logger.warning(
+                f"⚠️ {len(repetidos)} chaves repetidas na fonte ({duplicados_fonte} registros excedentes); "
+                f"{ambiguos} registros do sistema com correspondência ambígua"
+            )
+
+        registros_invalidos = int(invalido.sum())
+        self.logger.info(
+            f"🔍 Comparação concluída: {total_sistema - registros_invalidos}/{total_sistema} conciliados"
+        )
+
+        linhas = np.flatnonzero(invalido)
+        detalhadas = linhas[:self.max_divergencias_detalhadas]
+
+        return {
+            "total_registros": total_sistema,
+            "registros_validos": total_sistema - registros_invalidos,
+            "registros_invalidos": registros_invalidos,
+            "registros_ausentes_fonte": int(ausente_fonte.sum()),
+            "registros_ausentes_sistema": int(total_fonte - correspondidos.sum()),
+            "registros_duplicados_fonte": duplicados_fonte,
+            "registros_ambiguos": ambiguos,
+            "chaves_duplicadas_fonte": chaves_duplicadas,
+            "divergencias": self._detalhar(sistema, fonte, chaves, indice_fonte, divergencias, detalhadas),
+            "divergencias_omitidas": int(len(linhas) - len(detalhadas))
+        }
+
+    def _detalhar(self, sistema: Dict[str, Sequence], fonte: Dict[str, Sequence],
+                  chaves: List[str], indice_fonte: np.ndarray,
+                  divergencias: Dict[str, np.ndarray], linhas: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Monta a lista de divergências apenas para as linhas informadas.
+
+        Args:
+            sistema: Colunas do sistema
+            fonte: Colunas da fonte
+            chaves: Colunas que compõem a chave
+            indice_fonte: Resultado de `alinhar`
+            divergencias: Resultado de `avaliar`
+            linhas: Linhas do sistema a detalhar
+
+        Returns:
+            Lista de divergências serializáveis em JSON
+        """
+        colunas_chave = {chave: np.asarray(sistema[chave])[linhas].tolist() for chave in chaves}
+        detalhes = []
+
+        for posicao, linha in enumerate(linhas.tolist()):
+            registro = {
+                "linha_sistema": linha,
+                "chave": {chave: valores[posicao] for chave, valores in colunas_chave.items()}
+            }
+
+            linha_fonte = int(indice_fonte[linha])
+            if linha_fonte < 0:
+                registro["motivo"] = "ausente_fonte"
+            else:
+                registro["motivo"] = "valor_divergente"
+                registro["linha_fonte"] = linha_fonte
+                registro["colunas"] = {
+                    coluna: {
+                        "sistema": float(sistema[coluna][linha]),
+                        "fonte": float(fonte[coluna][linha_fonte])
+                    }
+                    for coluna, mascara in divergencias.items() if mascara[linha]
+                }
+
+            detalhes.append(registro)
+
+        return detalhes
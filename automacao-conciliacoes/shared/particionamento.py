@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Particionamento dos dados de um módulo para validação paralela.
+
+Este módulo divide os dados carregados por uma coluna de partição
+(carteira, classe de ativo) e junta os resultados das partições de volta
+no formato padrão de `_executar_validacoes`.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+
+# Campos do resultado que não são somados entre partições
+_CAMPOS_NAO_SOMADOS = {"status", "metricas", "particoes"}
+
+
+def _e_tabela_colunar(valor: Any, coluna: str) -> bool:
+    """
+    Verifica se um valor é uma tabela colunar (nome -> valores) com a coluna.
+
+    Args:
+        valor: Valor de uma entrada dos dados
+        coluna: Coluna de partição
+
+    Returns:
+        True se o valor é um dicionário de colunas que contém a coluna
+    """
+    return isinstance(valor, dict) and coluna in valor and not isinstance(valor[coluna], (str, bytes, dict))
+
+
+def indices_particoes(dados: Dict[str, Any], coluna: str) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Calcula as linhas de cada tabela colunar que pertencem a cada partição.
+
+    Args:
+        dados: Dados carregados pelo módulo
+        coluna: Coluna de partição
+
+    Returns:
+        Dicionário valor da partição -> tabela -> linhas originais, em ordem
+
+    Raises:
+        ValueError: Se nenhuma tabela dos dados tiver a coluna de partição
+    """
+    tabelas = [nome for nome, valor in dados.items() if _e_tabela_colunar(valor, coluna)]
+    if not tabelas:
+        raise ValueError(f"Nenhuma tabela dos dados contém a coluna de partição '{coluna}'")
+
+    por_tabela: Dict[str, Dict[str, np.ndarray]] = {}
+    for nome in tabelas:
+        valores = np.asarray(dados[nome][coluna]).astype(str)
+        unicos, inverso = np.unique(valores, return_inverse=True)
+        ordem = np.argsort(inverso, kind='stable')
+        limites = np.cumsum(np.bincount(inverso, minlength=len(unicos)))[:-1]
+        por_tabela[nome] = dict(zip(unicos.tolist(), np.split(ordem, limites)))
+
+    return {
+        valor: {
+            nome: por_tabela[nome].get(valor, np.empty(0, dtype=np.int64)) for nome in tabelas
+        }
+        for valor in sorted(set().union(*(por_tabela[nome] for nome in tabelas)))
+    }
+
+
+def particionar(dados: Dict[str, Any], coluna: str,
+                indices: Optional[Dict[str, Dict[str, np.ndarray]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Divide os dados pelos valores distintos de uma coluna.
+
+    Toda entrada de `dados` que seja uma tabela colunar com a coluna de
+    partição (`colunas`, `sistema`, `fonte`...) é dividida; as demais
+    entradas são repetidas em todas as partições.
+
+    Args:
+        dados: Dados carregados pelo módulo
+        coluna: Coluna de partição
+        indices: Linhas de cada partição já calculadas por `indices_particoes`
+
+    Returns:
+        Dicionário valor da partição -> dados da partição
+
+    Raises:
+        ValueError: Se nenhuma tabela dos dados tiver a coluna de partição
+    """
+    if indices is None:
+        indices = indices_particoes(dados, coluna)
+
+    particoes = {}
+    for valor, selecoes in indices.items():
+        parte = dict(dados)
+        for nome, selecao in selecoes.items():
+            parte[nome] = {
+                campo: np.asarray(valores)[selecao] for campo, valores in dados[nome].items()
+            }
+        particoes[valor] = parte
+
+    return particoes
+
+
+def _remapear_linhas(itens: List[Any], origens: Dict[str, np.ndarray]) -> List[Any]:
+    """
+    Converte as posições de linha de uma partição nas posições dos dados originais.
+
+    Segue a convenção dos resultados de validação: `linha_<tabela>` é a
+    posição de um registro e `linhas_<tabela>` uma lista de posições.
+
+    Args:
+        itens: Itens de uma lista do resultado (divergências, grupos...)
+        origens: Tabela -> linhas originais da partição
+
+    Returns:
+        Itens com as posições convertidas
+    """
+    remapeados = []
+    for item in itens:
+        if isinstance(item, dict):
+            item = dict(item)
+            for campo, conteudo in item.items():
+                prefixo, _, tabela = campo.partition("_")
+                if tabela not in origens:
+                    continue
+                if prefixo == "linha" and isinstance(conteudo, (int, np.integer)):
+                    item[campo] = int(origens[tabela][conteudo])
+                elif prefixo == "linhas" and isinstance(conteudo, list):
+                    item[campo] = origens[tabela][conteudo].tolist()
+        remapeados.append(item)
+    return remapeados
+
+
+def mesclar_resultados(resultados: Dict[str, Dict[str, Any]], inicio: datetime,
+                       indices: Optional[Dict[str, Dict[str, np.ndarray]]] = None) -> Dict[str, Any]:
+    """
+    Junta os resultados das partições em um único resultado padrão.
+
+    Campos numéricos são somados, listas são concatenadas e a taxa de
+    sucesso é recalculada sobre o total. O status é "erro" se qualquer
+    partição terminou com erro. Com `indices`, as posições de linha dos
+    itens das listas voltam a se referir aos dados originais.
+
+    Args:
+        resultados: Valor da partição -> resultado de `_executar_validacoes`
+        inicio: Instante de início da validação particionada
+        indices: Linhas de cada partição, de `indices_particoes`
+
+    Returns:
+        Resultado consolidado, com o resumo de cada partição em `particoes`
+    """
+    consolidado: Dict[str, Any] = {
+        "status": "sucesso",
+        "total_registros": 0,
+        "registros_validos": 0,
+        "registros_invalidos": 0,
+        "erros": [],
+        "alertas": []
+    }
+    particoes = {}
+
+    for valor, resultado in resultados.items():
+        if resultado.get("status") == "erro":
+            consolidado["status"] = "erro"
+
+        for campo, conteudo in resultado.items():
+            if campo in _CAMPOS_NAO_SOMADOS:
+                continue
+            if isinstance(conteudo, list):
+                if indices is not None and valor in indices:
+                    conteudo = _remapear_linhas(conteudo, indices[valor])
+                consolidado.setdefault(campo, []).extend(conteudo)
+            elif isinstance(conteudo, (int, float)) and not isinstance(conteudo, bool):
+                consolidado[campo] = consolidado.get(campo, 0) + conteudo
+
+        particoes[valor] = {
+            "status": resultado.get("status"),
+            "total_registros": resultado.get("total_registros", 0),
+            "registros_validos": resultado.get("registros_validos", 0),
+            "tempo_execucao": resultado.get("metricas", {}).get("tempo_execucao", 0)
+        }
+
+    total = consolidado["total_registros"]
+    consolidado["metricas"] = {
+        "tempo_execucao": (datetime.now() - inicio).total_seconds(),
+        "taxa_sucesso": (consolidado["registros_validos"] / total * 100) if total > 0 else 100.0
+    }
+    consolidado["particoes"] = particoes
+    return consolidado
+
+
+def validar_particao(conciliacao: Any, dados: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Executa `_executar_validacoes` de um módulo sobre uma partição.
+
+    Função de nível de módulo para poder ser enviada a um processo filho.
+
+    Args:
+        conciliacao: Instância do módulo de conciliação
+        dados: Dados da partição
+
+    Returns:
+        Resultado da validação da partição
+    """
+    return conciliacao._executar_validacoes(dados)
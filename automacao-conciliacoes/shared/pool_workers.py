@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Pool de processos pré-aquecidos para execução dos módulos de conciliação.
+
+Cada worker é um processo Python que importa as bibliotecas pesadas uma
+única vez e depois executa o `conciliacao.py` de cada módulo como script
+(`runpy.run_path` com `__name__ == "__main__"`), com diretório de trabalho,
+argumentos e saídas padrão próprios da tarefa. Ao fim de cada tarefa, os
+módulos importados pelo script são descarregados, para que a próxima
+execução comece com um namespace limpo.
+
+Timeouts e quedas ficam contidos no worker: o processo é encerrado e
+substituído por um novo, sem afetar as demais execuções.
+
+Os workers não são daemon, para que os scripts possam criar seus próprios
+processos (ex.: `ProcessPoolExecutor` da validação particionada); o pool os
+encerra explicitamente em `encerrar` e, como garantia, na saída do
+interpretador.
+"""
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import runpy
+import sys
+import tempfile
+import traceback
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+
+# Bibliotecas importadas por padrão na inicialização de cada worker
+MODULOS_PRE_IMPORTADOS = ["numpy", "openpyxl", "dateutil", "shared.base_conciliacao"]
+
+
+def _codigo_saida(excecao: SystemExit) -> int:
+    """
+    Converte um `sys.exit` do script no código de saída do processo.
+
+    Args:
+        excecao: Exceção levantada por `sys.exit`
+
+    Returns:
+        Código de saída, como o interpretador devolveria
+    """
+    if excecao.code is None:
+        return 0
+    if isinstance(excecao.code, int):
+        return excecao.code
+    print(excecao.code, file=sys.stderr)
+    return 1
+
+
+def _descarregar_estado(modulos_antes: set, loggers_antes: set,
+                        handlers_raiz: List[logging.Handler], nivel_raiz: int) -> None:
+    """
+    Remove módulos e loggers criados pelo script executado.
+
+    Args:
+        modulos_antes: Nomes em `sys.modules` antes da tarefa
+        loggers_antes: Nomes de loggers antes da tarefa
+        handlers_raiz: Handlers do logger raiz antes da tarefa
+        nivel_raiz: Nível do logger raiz antes da tarefa
+    """
+    for nome in set(sys.modules) - modulos_antes:
+        del sys.modules[nome]
+
+    # `logging.basicConfig` do script configura o logger raiz
+    for handler in logging.root.handlers[:]:
+        if handler not in handlers_raiz:
+            logging.root.removeHandler(handler)
+            handler.close()
+    logging.root.setLevel(nivel_raiz)
+
+    gerenciador = logging.root.manager
+    for nome in set(gerenciador.loggerDict) - loggers_antes:
+        logger = gerenciador.loggerDict.pop(nome)
+        for handler in getattr(logger, "handlers", [])[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def _executar_tarefa(caminho: str, diretorio: str, argumentos: Sequence[str],
+                     ambiente: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Executa um script no processo atual, isolando saídas e estado.
+
+    As saídas são capturadas nos descritores 1 e 2, o que inclui handlers
+    de logging e bibliotecas que escrevem direto no descritor.
+
+    Args:
+        caminho: Caminho absoluto do script
+        diretorio: Diretório de trabalho da execução
+        argumentos: Argumentos de linha de comando do script
+        ambiente: Variáveis de ambiente adicionais da execução
+
+    Returns:
+        Dicionário com codigo_saida, stdout e stderr
+    """
+    modulos_antes = set(sys.modules)
+    loggers_antes = set(logging.root.manager.loggerDict)
+    handlers_raiz = list(logging.root.handlers)
+    nivel_raiz = logging.root.level
+    path_antes = list(sys.path)
+    argv_antes = list(sys.argv)
+    cwd_antes = os.getcwd()
+    ambiente_antes = dict(os.environ)
+
+    with tempfile.TemporaryFile() as saida, tempfile.TemporaryFile() as erros:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        fd_saida, fd_erros = os.dup(1), os.dup(2)
+        os.dup2(saida.fileno(), 1)
+        os.dup2(erros.fileno(), 2)
+
+        codigo = 0
+        try:
+            os.chdir(diretorio)
+            os.environ.update(ambiente or {})
+            sys.argv = [caminho, *argumentos]
+            sys.path.insert(0, os.path.dirname(caminho))
+            runpy.run_path(caminho, run_name="__main__")
+        except SystemExit as e:
+            codigo = _codigo_saida(e)
+        except BaseException:
+            traceback.print_exc()
+            codigo = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(fd_saida, 1)
+            os.dup2(fd_erros, 2)
+            os.close(fd_saida)
+            os.close(fd_erros)
+
+            os.chdir(cwd_antes)
+            sys.argv = argv_antes
+            sys.path[:] = path_antes
+            os.environ.clear()
+            os.environ.update(ambiente_antes)
+            _descarregar_estado(modulos_antes, loggers_antes, handlers_raiz, nivel_raiz)
+
+        saida.seek(0)
+        erros.seek(0)
+        return {
+            "codigo_saida": codigo,
+            "stdout": saida.read().decode('utf-8', errors='replace'),
+            "stderr": erros.read().decode('utf-8', errors='replace')
+        }
+
+
+def _loop_worker(conexao: Connection, modulos_pre_importados: List[str]) -> None:
+    """
+    Função principal de um worker: importa as bibliotecas e atende tarefas.
+
+    Função de nível de módulo para poder ser usada com o método "spawn".
+
+    Args:
+        conexao: Extremidade do worker no canal com o pool
+        modulos_pre_importados: Módulos importados antes da primeira tarefa
+    """
+    try:
+        for nome in modulos_pre_importados:
+            try:
+                __import__(nome)
+            except Exception:
+                # Biblioteca ausente não impede o worker; o script falhará ao importá-la
+                pass
+
+        conexao.send(("pronto", os.getpid()))
+
+        while True:
+            tarefa = conexao.recv()
+            if tarefa is None:
+                break
+            conexao.send(_executar_tarefa(*tarefa))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conexao.close()
+
+
+class _Worker:
+    """
+    Processo do pool e seu canal de comunicação.
+
+    Attributes:
+        processo (multiprocessing.Process): Processo do worker
+        conexao (Connection): Extremidade do pool no canal
+        pronto (bool): Se o worker já concluiu as importações iniciais
+        tarefas (int): Tarefas executadas por este worker
+    """
+
+    def __init__(self, contexto: Any, modulos_pre_importados: List[str]):
+        """
+        Inicia o processo do worker.
+
+        Args:
+            contexto: Contexto de multiprocessing
+            modulos_pre_importados: Módulos importados na inicialização
+        """
+        self.conexao, conexao_worker = contexto.Pipe()
+        # Processos daemon não podem ter filhos, o que quebraria scripts com ProcessPoolExecutor
+        self.processo = contexto.Process(
+            target=_loop_worker, args=(conexao_worker, modulos_pre_importados), daemon=False
+        )
+        self.processo.start()
+        conexao_worker.close()
+        self.pronto = False
+        self.tarefas = 0
+
+    def encerrar(self, timeout: float = 5.0) -> None:
+        """
+        Pede o encerramento do worker e o mata se não responder.
+
+        Args:
+            timeout: Tempo de espera pelo encerramento normal
+        """
+        try:
+            self.conexao.send(None)
+        except (OSError, ValueError):
+            pass
+        self.processo.join(timeout)
+        self.matar()
+
+    def matar(self) -> None:
+        """
+        Mata o processo do worker imediatamente.
+        """
+        if self.processo.is_alive():
+            self.processo.kill()
+            self.processo.join()
+        self.conexao.close()
+
+
+class PoolWorkers:
+    """
+    Pool de processos pré-aquecidos que executam scripts de conciliação.
+
+    Attributes:
+        tamanho (int): Número de workers
+        modulos_pre_importados (list): Módulos importados por cada worker
+        max_tarefas_por_worker (int): Tarefas antes de reciclar um worker (0 = sem limite)
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, tamanho: int = 3, modulos_pre_importados: Optional[List[str]] = None,
+                 max_tarefas_por_worker: int = 0):
+        """
+        Inicializa o pool (os processos são criados em `iniciar`).
+
+        Args:
+            tamanho: Número de workers
+            modulos_pre_importados: Módulos importados por cada worker
+                (padrão: MODULOS_PRE_IMPORTADOS)
+            max_tarefas_por_worker: Tarefas antes de reciclar um worker (0 = sem limite)
+        """
+        self.tamanho = max(1, tamanho)
+        self.modulos_pre_importados = list(
+            MODULOS_PRE_IMPORTADOS if modulos_pre_importados is None else modulos_pre_importados
+        )
+        self.max_tarefas_por_worker = max_tarefas_por_worker
+        self.logger = logging.getLogger("pool_workers")
+
+        # "spawn" em todas as plataformas: o processo principal tem threads e conexões abertas
+        self._contexto = multiprocessing.get_context("spawn")
+        self._workers: List[_Worker] = []
+        self._livres: Optional[asyncio.Queue] = None
+
+    async def iniciar(self) -> None:
+        """
+        Cria os workers; as importações iniciais seguem em segundo plano.
+        """
+        if self._livres is not None:
+            return
+
+        self._livres = asyncio.Queue()
+        for _ in range(self.tamanho):
+            self._livres.put_nowait(self._novo_worker())
+        atexit.register(self._encerrar_restantes)
+
+        self.logger.info(f"🔥 Pool de workers iniciado: {self.tamanho} processos")
+
+    def _novo_worker(self) -> _Worker:
+        """
+        Cria um worker e o registra no pool.
+
+        Returns:
+            Worker criado
+        """
+        worker = _Worker(self._contexto, self.modulos_pre_importados)
+        self._workers.append(worker)
+        return worker
+
+    def _substituir(self, worker: _Worker) -> _Worker:
+        """
+        Mata um worker e cria outro no lugar.
+
+        Args:
+            worker: Worker a substituir
+
+        Returns:
+            Novo worker
+        """
+        worker.matar()
+        self._workers.remove(worker)
+        return self._novo_worker()
+
+    async def _aguardar_pronto(self, worker: _Worker) -> None:
+        """
+        Aguarda o worker concluir as importações iniciais.
+
+        Args:
+            worker: Worker a aguardar
+
+        Raises:
+            RuntimeError: Se o worker terminar antes de ficar pronto
+        """
+        if worker.pronto:
+            return
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, worker.conexao.recv)
+        except (EOFError, OSError):
+            raise RuntimeError(f"Worker encerrou na inicialização (código {worker.processo.exitcode})")
+        worker.pronto = True
+
+    async def executar(self, caminho: str, diretorio: str, argumentos: Sequence[str] = (),
+                       timeout: Optional[float] = None,
+                       ambiente: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Executa um script em um worker livre.
+
+        Args:
+            caminho: Caminho do script
+            diretorio: Diretório de trabalho da execução
+            argumentos: Argumentos de linha de comando do script
+            timeout: Tempo máximo da execução em segundos
+            ambiente: Variáveis de ambiente adicionais da execução
+
+        Returns:
+            Dicionário com codigo_saida, stdout e stderr
+
+        Raises:
+            asyncio.TimeoutError: Se a execução exceder o timeout (o worker é substituído)
+            asyncio.CancelledError: Se a execução for cancelada (o worker é substituído)
+        """
+        await self.iniciar()
+        worker = await self._livres.get()
+        loop = asyncio.get_running_loop()
+        tarefa = (str(Path(caminho).resolve()), str(Path(diretorio).resolve()), list(argumentos),
+                  dict(ambiente or {}))
+
+        try:
+            await self._aguardar_pronto(worker)
+
+            try:
+                worker.conexao.send(tarefa)
+            except OSError:
+                # Worker morto enquanto livre: a tarefa ainda não começou, vai para um novo
+                self.logger.warning(f"💥 Worker {worker.processo.pid} encerrou enquanto livre; substituindo")
+                worker = self._substituir(worker)
+                await self._aguardar_pronto(worker)
+                worker.conexao.send(tarefa)
+            worker.tarefas += 1
+
+            resultado = await asyncio.wait_for(loop.run_in_executor(None, worker.conexao.recv), timeout)
+
+        except asyncio.TimeoutError:
+            self.logger.warning(f"⏰ Worker {worker.processo.pid} excedeu {timeout}s; substituindo")
+            worker = self._substituir(worker)
+            raise
+
+        except (EOFError, OSError):
+            codigo = worker.processo.exitcode
+            self.logger.error(f"💥 Worker {worker.processo.pid} encerrou inesperadamente (código {codigo}); substituindo")
+            worker = self._substituir(worker)
+            return {
+                "codigo_saida": codigo if codigo is not None else -1,
+                "stdout": "",
+                "stderr": f"Worker encerrado inesperadamente (código {codigo})"
+            }
+
+        except RuntimeError:
+            worker = self._substituir(worker)
+            raise
+
+        except BaseException:
+            # Cancelamento: a thread do executor segue presa no recv deste
+            # worker, que por isso não pode voltar para a fila
+            self.logger.warning(f"⏹️ Tarefa do worker {worker.processo.pid} cancelada; substituindo")
+            worker = self._substituir(worker)
+            raise
+
+        else:
+            if self.max_tarefas_por_worker and worker.tarefas >= self.max_tarefas_por_worker:
+                worker = self._substituir(worker)
+            return resultado
+
+        finally:
+            self._livres.put_nowait(worker)
+
+    def _encerrar_restantes(self) -> None:
+        """
+        Encerra, na saída do interpretador, os workers que ainda estiverem vivos.
+
+        Sem isso, a saída esperaria indefinidamente pelos workers (não daemon)
+        se `encerrar` não tiver sido chamado.
+        """
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.encerrar(timeout=1.0)
+
+    async def encerrar(self) -> None:
+        """
+        Encerra todos os workers.
+        """
+        atexit.unregister(self._encerrar_restantes)
+        workers, self._workers = self._workers, []
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, worker.encerrar) for worker in workers))
+        self._livres = None
+
+        if workers:
+            self.logger.info(f"🛑 Pool de workers encerrado: {len(workers)} processos")
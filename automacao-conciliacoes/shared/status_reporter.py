@@ -6,40 +6,367 @@ Este módulo fornece funcionalidades para que cada módulo de conciliação
 reporte seu status, progresso e resultados para o mapa central de controle.
 """
 
+import atexit
+import hashlib
 import json
+import math
+import os
+import queue
 import sqlite3
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Callable, Union, Sequence
 from pathlib import Path
 import logging
 
+from shared.motor_alertas import MotorAlertas
+
+
+# Intervalos nomeados das séries temporais: (duração aproximada em segundos, expressão SQL)
+INTERVALOS_SERIE = {
+    "hora": (3600, "strftime('%Y-%m-%d %H:00:00', he.timestamp_execucao)"),
+    "dia": (86400, "date(he.timestamp_execucao)"),
+    "semana": (604800, "date(he.timestamp_execucao, 'weekday 0', '-6 days')"),
+    "mes": (2629800, "strftime('%Y-%m-01', he.timestamp_execucao)"),
+}
+
+
+def compactar_resultado(dados: Any) -> bytes:
+    """
+    Serializa um resultado em JSON compactado com zlib.
+    
+    Args:
+        dados: Resultado serializável em JSON
+        
+    Returns:
+        JSON compactado
+    """
+    return zlib.compress(json.dumps(dados, ensure_ascii=False).encode('utf-8'), 6)
+
+
+def descompactar_resultado(compactado: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Decodifica um resultado gravado por `compactar_resultado`.
+    
+    Args:
+        compactado: JSON compactado (ou None, se não houver resultado)
+        
+    Returns:
+        Resultado como dicionário, ou None
+    """
+    if not compactado:
+        return None
+    return json.loads(zlib.decompress(compactado).decode('utf-8'))
+
+
+# Colunas de status_modulos cuja alteração muda a versão de dados; atualizações
+# só de progresso, mensagem e timestamp_atualizacao não geram nova versão
+_COLUNAS_VERSIONADAS_STATUS = (
+    "nome_modulo", "categoria", "criticidade", "status", "timestamp_inicio",
+    "timestamp_fim", "dados_resultado", "id_resultado", "erro"
+)
+
+
+# Colunas lidas de status_modulos (sm) e resultados_compactados (rc), na ordem de `_linha_status`
+_COLUNAS_STATUS = """
+    sm.nome_modulo, sm.categoria, sm.criticidade, sm.status, sm.progresso,
+    sm.mensagem, sm.timestamp_inicio, sm.timestamp_fim,
+    sm.timestamp_atualizacao, rc.dados, sm.erro
+"""
+
+
+class PoolConexoes:
+    """
+    Pool de conexões SQLite reutilizáveis entre chamadas e threads.
+    
+    Cada conexão é configurada uma única vez (WAL, `synchronous=NORMAL`,
+    `busy_timeout`) e mantém seu cache de comandos preparados, então
+    chamadas repetidas não pagam abertura de arquivo nem recompilação de SQL.
+    Uma conexão é usada por uma thread de cada vez.
+    
+    Um pool somente leitura abre o banco com `mode=ro`: em WAL, suas
+    transações de leitura enxergam o último commit sem esperar escritores.
+    
+    Attributes:
+        db_path (Path): Caminho para o banco de dados SQLite
+        tamanho (int): Número máximo de conexões abertas
+        busy_timeout_ms (int): Espera máxima por um lock, em milissegundos
+        somente_leitura (bool): Se True, as conexões não podem escrever
+    """
+    
+    def __init__(self, db_path: Path, tamanho: int = 4, busy_timeout_ms: int = 5000,
+                 comandos_em_cache: int = 128, somente_leitura: bool = False):
+        """
+        Inicializa o pool (as conexões são abertas sob demanda).
+        
+        Args:
+            db_path: Caminho para o banco de dados SQLite
+            tamanho: Número máximo de conexões abertas
+            busy_timeout_ms: Espera máxima por um lock, em milissegundos
+            comandos_em_cache: Comandos preparados mantidos por conexão
+            somente_leitura: Se True, abre as conexões em modo somente leitura
+                (o banco já deve existir e estar em WAL)
+        """
+        self.db_path = db_path
+        self.somente_leitura = somente_leitura
+        self.tamanho = max(1, tamanho)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.comandos_em_cache = comandos_em_cache
+        self._livres: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._abertas: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+    
+    def _abrir(self) -> sqlite3.Connection:
+        """
+        Abre e configura uma nova conexão.
+        
+        Returns:
+            Conexão configurada
+        """
+        if self.somente_leitura:
+            conn = sqlite3.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False,
+                cached_statements=self.comandos_em_cache
+            )
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False,
+                cached_statements=self.comandos_em_cache
+            )
+            # Só tem efeito em banco novo e antes do modo WAL; bancos
+            # existentes passam pela migração de auto_vacuum
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+    
+    def _obter(self) -> sqlite3.Connection:
+        """
+        Retira uma conexão livre do pool, abrindo uma nova se houver espaço.
+        
+        Returns:
+            Conexão para uso exclusivo da thread atual
+        """
+        if os.getpid() != self._pid:
+            # Conexões SQLite não podem ser compartilhadas com processos filhos
+            self._livres = queue.LifoQueue()
+            self._abertas = []
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+        
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if len(self._abertas) < self.tamanho:
+                conn = self._abrir()
+                self._abertas.append(conn)
+                return conn
+        
+        return self._livres.get()
+    
+    @contextmanager
+    def conexao(self) -> Iterator[sqlite3.Connection]:
+        """
+        Empresta uma conexão do pool dentro de uma transação.
+        
+        Faz commit ao sair normalmente e rollback se houver exceção.
+        
+        Yields:
+            Conexão SQLite
+        """
+        conn = self._obter()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._livres.put(conn)
+    
+    def fechar(self) -> None:
+        """
+        Fecha todas as conexões abertas pelo pool.
+        """
+        with self._lock:
+            for conn in self._abertas:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._abertas = []
+            self._livres = queue.LifoQueue()
+
 
 class StatusReporter:
     """
     Classe responsável por reportar status dos módulos para o mapa central.
     
+    No modo de escrita assíncrona, `reportar_progresso` apenas guarda a
+    última atualização de cada módulo em memória; uma thread grava as
+    pendências em uma única transação a cada `intervalo_flush` segundos ou
+    quando `lote_flush` módulos acumulam atualizações. Início, sucesso e
+    erro gravam as pendências antes de si mesmos, preservando a ordem.
+    
+    As consultas (`obter_*`) usam um pool separado, somente leitura, para
+    não disputar conexões nem locks com as escritas de uma execução em
+    andamento.
+    
     Attributes:
         db_path (Path): Caminho para o banco de dados SQLite
+        escrita_assincrona (bool): Se True, o progresso é gravado em segundo plano
+        intervalo_flush (float): Intervalo máximo entre gravações do progresso, em segundos
+        lote_flush (int): Número de módulos pendentes que antecipa a gravação
         logger (logging.Logger): Logger para operações
     """
     
-    def __init__(self, db_path: str = "status_conciliacoes.db"):
+    def __init__(self, db_path: str = "status_conciliacoes.db", tamanho_pool: int = 4,
+                 busy_timeout_ms: int = 5000, escrita_assincrona: bool = False,
+                 intervalo_flush: float = 1.0, lote_flush: int = 100,
+                 leitura_separada: bool = True):
         """
         Inicializa o reporter de status.
         
         Args:
             db_path: Caminho para o banco de dados SQLite
+            tamanho_pool: Número máximo de conexões mantidas abertas
+            busy_timeout_ms: Espera máxima por um lock do banco, em milissegundos
+            escrita_assincrona: Se True, agrupa e grava o progresso em segundo plano
+            intervalo_flush: Intervalo máximo entre gravações do progresso, em segundos
+            lote_flush: Número de módulos pendentes que antecipa a gravação
+            leitura_separada: Se True, consultas usam um pool somente leitura
         """
         self.db_path = Path(db_path)
         self.logger = logging.getLogger("status_reporter")
+        self._pool = PoolConexoes(self.db_path, tamanho_pool, busy_timeout_ms)
         self._inicializar_banco()
+        self._pool_leitura = (
+            PoolConexoes(self.db_path, tamanho_pool, busy_timeout_ms, somente_leitura=True)
+            if leitura_separada else self._pool
+        )
+        
+        self.escrita_assincrona = escrita_assincrona
+        self.intervalo_flush = intervalo_flush
+        self.lote_flush = max(1, lote_flush)
+        self._pendentes: Dict[str, Tuple[int, str, datetime]] = {}
+        self._lock_pendentes = threading.Lock()
+        self._lock_escrita = threading.RLock()
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread_flush: Optional[threading.Thread] = None
+        
+        if escrita_assincrona:
+            self._thread_flush = threading.Thread(
+                target=self._laco_flush, name="status_reporter_flush", daemon=True
+            )
+            self._thread_flush.start()
+            atexit.register(self.descarregar_progresso)
+    
+    def _laco_flush(self) -> None:
+        """
+        Laço da thread de escrita: grava as pendências por tempo ou por lote.
+        """
+        while not self._parar.is_set():
+            self._acordar.wait(self.intervalo_flush)
+            self._acordar.clear()
+            self.descarregar_progresso()
+    
+    def descarregar_progresso(self) -> int:
+        """
+        Grava imediatamente as atualizações de progresso pendentes.
+        
+        Returns:
+            Número de módulos atualizados
+        """
+        with self._lock_escrita:
+            with self._lock_pendentes:
+                lote, self._pendentes = self._pendentes, {}
+            
+            if not lote:
+                return 0
+            
+            try:
+                with self._pool.conexao() as conn:
+                    conn.executemany("""
+                        UPDATE status_modulos 
+                        SET progresso = ?, mensagem = ?, timestamp_atualizacao = ?
+                        WHERE nome_modulo = ?
+                    """, [(progresso, mensagem, instante, nome)
+                          for nome, (progresso, mensagem, instante) in lote.items()])
+                
+                self.logger.debug(f"📈 Progresso gravado: {len(lote)} módulos")
+                return len(lote)
+                
+            except Exception as e:
+                self.logger.error(f"❌ Erro ao gravar progresso: {e}")
+                return 0
+    
+    @contextmanager
+    def _escrita_ordenada(self) -> Iterator[None]:
+        """
+        Serializa uma escrita de estado após gravar o progresso pendente.
+        
+        Garante que nenhuma atualização de progresso anterior seja gravada
+        depois do início, sucesso ou erro de um módulo.
+        """
+        with self._lock_escrita:
+            self.descarregar_progresso()
+            yield
+    
+    def fechar(self) -> None:
+        """
+        Grava o progresso pendente e fecha as conexões mantidas pelo reporter.
+        """
+        if self._thread_flush is not None:
+            self._parar.set()
+            self._acordar.set()
+            self._thread_flush.join()
+            self._thread_flush = None
+            atexit.unregister(self.descarregar_progresso)
+        
+        self.descarregar_progresso()
+        self._pool.fechar()
+        self._pool_leitura.fechar()
+    
+    def conexao(self) -> Iterator[sqlite3.Connection]:
+        """
+        Empresta uma conexão de escrita, para componentes que guardam estado
+        no banco de status (ex.: motor de alertas).
+        
+        Returns:
+            Gerenciador de contexto com a conexão (commit ao sair)
+        """
+        return self._pool.conexao()
+    
+    def conexao_leitura(self) -> Iterator[sqlite3.Connection]:
+        """
+        Empresta uma conexão do pool de leitura.
+        
+        Returns:
+            Gerenciador de contexto com a conexão
+        """
+        return self._pool_leitura.conexao()
     
     def _inicializar_banco(self) -> None:
         """
         Inicializa o banco de dados SQLite com as tabelas necessárias.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.conexao() as conn:
                 cursor = conn.cursor()
                 
                 # Tabela de status dos módulos
@@ -77,28 +404,509 @@ class StatusReporter:
                     )
                 """)
                 
-                # Tabela de métricas consolidadas
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS metricas_consolidadas (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        data_consolidacao DATE NOT NULL,
-                        total_modulos INTEGER,
-                        modulos_executados INTEGER,
-                        modulos_sucesso INTEGER,
-                        modulos_erro INTEGER,
-                        tempo_total_execucao REAL,
-                        taxa_sucesso_geral REAL,
-                        timestamp_consolidacao DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
                 conn.commit()
-                self.logger.info("✅ Banco de dados inicializado")
+            
+            self._aplicar_migracoes()
+            self.logger.info("✅ Banco de dados inicializado")
                 
         except Exception as e:
             self.logger.error(f"❌ Erro ao inicializar banco: {e}")
             raise
     
+    def ativar_auto_vacuum(self) -> bool:
+        """
+        Ativa `auto_vacuum=INCREMENTAL`, permitindo devolver páginas livres
+        ao sistema sem reescrever o banco inteiro.
+        
+        Em bancos existentes a mudança exige um VACUUM completo, que bloqueia
+        o banco enquanto roda. É feito uma única vez, pela migração de
+        auto_vacuum; se o banco estiver ocupado nesse momento, pode ser
+        repetido como manutenção (`mapa_central.py --compactar-banco`).
+        
+        Returns:
+            True se o auto_vacuum incremental estiver ativo ao final
+        """
+        try:
+            with self._pool.conexao() as conn:
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                    return True
+                
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            
+            self.logger.info("🧹 auto_vacuum incremental ativado")
+            return True
+            
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ VACUUM não executado ({e}); repita com mapa_central.py --compactar-banco")
+            return False
+    
+    def _migracoes(self) -> List[Tuple[str, Callable[[sqlite3.Cursor], None]]]:
+        """
+        Lista as migrações de esquema, em ordem.
+        
+        A migração na posição N leva o banco à versão N (`PRAGMA user_version`).
+        Novas migrações devem ser sempre acrescentadas ao final.
+        
+        Returns:
+            Lista de pares (descrição, função que aplica a migração)
+        """
+        return [
+            ("status_modulos com uma linha por módulo", self._migracao_status_unico),
+            ("índices de cobertura do histórico por data", self._migracao_indices_historico),
+            ("métricas consolidadas por dia e categoria", self._migracao_metricas_consolidadas),
+            ("resultados compactados e armazenados uma única vez", self._migracao_resultados_compactados),
+            ("versão de dados para leitura incremental", self._migracao_versao_dados),
+            ("estado persistente de alertas", self._migracao_alertas),
+            ("auto_vacuum incremental", self._migracao_auto_vacuum),
+            ("categoria gravada em cada execução do histórico", self._migracao_categoria_historico),
+            ("versão de dados ignora atualizações de progresso", self._migracao_versao_sem_progresso),
+        ]
+    
+    def _aplicar_migracoes(self) -> None:
+        """
+        Aplica as migrações pendentes, cada uma em sua própria transação.
+        
+        A versão é relida depois de obter o lock de escrita, então vários
+        processos podem inicializar o mesmo banco ao mesmo tempo.
+        """
+        with self._pool.conexao() as conn:
+            versao_atual = conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        self._vacuum_pendente = False
+        for versao, (descricao, migracao) in enumerate(self._migracoes(), start=1):
+            if versao <= versao_atual:
+                continue
+            
+            with self._pool.conexao() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                if conn.execute("PRAGMA user_version").fetchone()[0] >= versao:
+                    continue
+                
+                migracao(conn.cursor())
+                conn.execute(f"PRAGMA user_version = {versao}")
+            
+            self.logger.info(f"🔧 Migração {versao} aplicada: {descricao}")
+        
+        # VACUUM não roda dentro de transação: feito após as migrações
+        if self._vacuum_pendente:
+            self.ativar_auto_vacuum()
+    
+    def _migracao_status_unico(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Remove linhas duplicadas de status_modulos e torna nome_modulo único.
+        
+        Mantém, para cada módulo, a linha atualizada mais recentemente.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("""
+            DELETE FROM status_modulos
+            WHERE id NOT IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY nome_modulo
+                        ORDER BY timestamp_atualizacao DESC, id DESC
+                    ) AS ordem
+                    FROM status_modulos
+                )
+                WHERE ordem = 1
+            )
+        """)
+        
+        if cursor.rowcount:
+            self.logger.info(f"🧹 Status duplicados removidos: {cursor.rowcount}")
+        
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_status_modulos_nome
+            ON status_modulos (nome_modulo)
+        """)
+    
+    def _migracao_indices_historico(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Normaliza timestamp_execucao e cria índices de cobertura do histórico.
+        
+        Com todos os instantes no formato `YYYY-MM-DD HH:MM:SS`, filtros por
+        data viram comparações de intervalo sobre o texto, que usam índice.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("""
+            UPDATE historico_execucoes
+            SET timestamp_execucao = strftime('%Y-%m-%d %H:%M:%S', timestamp_execucao)
+            WHERE strftime('%Y-%m-%d %H:%M:%S', timestamp_execucao) IS NOT NULL
+              AND timestamp_execucao != strftime('%Y-%m-%d %H:%M:%S', timestamp_execucao)
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_historico_timestamp_status
+            ON historico_execucoes (timestamp_execucao, status, tempo_execucao,
+                                    taxa_sucesso, registros_processados)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_historico_modulo_timestamp
+            ON historico_execucoes (nome_modulo, timestamp_execucao, status, tempo_execucao)
+        """)
+    
+    def _migracao_metricas_consolidadas(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Recria metricas_consolidadas como agregado diário por categoria.
+        
+        A tabela original nunca era preenchida. A nova guarda somas e
+        contagens (as médias saem de soma / contagem); o histórico existente
+        é somado por `_migracao_categoria_historico`.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("DROP TABLE IF EXISTS metricas_consolidadas")
+        cursor.execute("""
+            CREATE TABLE metricas_consolidadas (
+                data_consolidacao TEXT NOT NULL,
+                categoria TEXT NOT NULL,
+                execucoes INTEGER NOT NULL DEFAULT 0,
+                execucoes_sucesso INTEGER NOT NULL DEFAULT 0,
+                execucoes_erro INTEGER NOT NULL DEFAULT 0,
+                soma_tempo_execucao REAL NOT NULL DEFAULT 0,
+                contagem_tempo_execucao INTEGER NOT NULL DEFAULT 0,
+                soma_taxa_sucesso REAL NOT NULL DEFAULT 0,
+                contagem_taxa_sucesso INTEGER NOT NULL DEFAULT 0,
+                total_registros_processados INTEGER NOT NULL DEFAULT 0,
+                timestamp_consolidacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (data_consolidacao, categoria)
+            ) WITHOUT ROWID
+        """)
+    
+    def _migracao_resultados_compactados(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Move os resultados em JSON para a tabela resultados_compactados.
+        
+        status_modulos e historico_execucoes passam a referenciar o resultado
+        por `id_resultado`; resultados idênticos são gravados uma única vez.
+        O espaço liberado só volta ao sistema após um VACUUM.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS resultados_compactados (
+                id INTEGER PRIMARY KEY,
+                dados BLOB NOT NULL
+            )
+        """)
+        cursor.execute("ALTER TABLE historico_execucoes ADD COLUMN id_resultado INTEGER")
+        cursor.execute("ALTER TABLE status_modulos ADD COLUMN id_resultado INTEGER")
+        
+        ids_por_conteudo: Dict[bytes, int] = {}
+        
+        def mover(tabela: str, coluna: str) -> None:
+            linhas = cursor.execute(
+                f"SELECT id, {coluna} FROM {tabela} WHERE {coluna} IS NOT NULL"
+            ).fetchall()
+            for id_linha, texto in linhas:
+                assinatura = hashlib.blake2b(texto.encode('utf-8'), digest_size=16).digest()
+                if assinatura not in ids_por_conteudo:
+                    cursor.execute(
+                        "INSERT INTO resultados_compactados (dados) VALUES (?)",
+                        (zlib.compress(texto.encode('utf-8'), 6),)
+                    )
+                    ids_por_conteudo[assinatura] = cursor.lastrowid
+                cursor.execute(
+                    f"UPDATE {tabela} SET id_resultado = ?, {coluna} = NULL WHERE id = ?",
+                    (ids_por_conteudo[assinatura], id_linha)
+                )
+        
+        mover("historico_execucoes", "dados_completos")
+        mover("status_modulos", "dados_resultado")
+        
+        if ids_por_conteudo:
+            self.logger.info(f"🗜️ Resultados compactados: {len(ids_por_conteudo)}")
+    
+    def _migracao_versao_dados(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Cria a versão global de dados e a coluna `versao` nas tabelas de status.
+        
+        Triggers incrementam a versão em controle_versao a cada inserção ou
+        atualização de status_modulos e historico_execucoes e gravam o novo
+        valor na linha alterada. Em status_modulos, atualizações só de
+        progresso não contam. As linhas existentes ficam com a versão 1.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("""
+            CREATE TABLE controle_versao (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                versao INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("INSERT INTO controle_versao (id, versao) VALUES (1, 1)")
+        
+        for tabela in ("status_modulos", "historico_execucoes"):
+            cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN versao INTEGER NOT NULL DEFAULT 0")
+            cursor.execute(f"UPDATE {tabela} SET versao = 1")
+            cursor.execute(f"CREATE INDEX idx_{tabela}_versao ON {tabela} (versao)")
+            self._criar_triggers_versao(
+                cursor, tabela, _COLUNAS_VERSIONADAS_STATUS if tabela == "status_modulos" else ()
+            )
+    
+    def _criar_triggers_versao(self, cursor: sqlite3.Cursor, tabela: str,
+                               colunas_update: Sequence[str] = ()) -> None:
+        """
+        Cria os triggers que incrementam a versão de dados a cada escrita na tabela.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+            tabela: Tabela com colunas `id` e `versao`
+            colunas_update: Colunas cuja atualização muda a versão (padrão: todas)
+        """
+        atualizacao = f"UPDATE OF {', '.join(colunas_update)}" if colunas_update else "UPDATE"
+        for evento, condicao in (("INSERT", ""), (atualizacao, "WHEN NEW.versao IS OLD.versao")):
+            cursor.execute(f"""
+                CREATE TRIGGER trg_{tabela}_versao_{evento.split()[0].lower()}
+                AFTER {evento} ON {tabela}
+                {condicao}
+                BEGIN
+                    UPDATE controle_versao SET versao = versao + 1 WHERE id = 1;
+                    UPDATE {tabela}
+                    SET versao = (SELECT versao FROM controle_versao WHERE id = 1)
+                    WHERE id = NEW.id;
+                END
+            """)
+    
+    def _migracao_alertas(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Cria as tabelas do motor de alertas (ver `shared.motor_alertas`).
+        
+        - alertas: um alerta ativo por `chave_dedup` (índice único parcial);
+          estados aberto, reconhecido e resolvido
+        - prazos_alertas: instante em que cada módulo crítico passa a gerar
+          alerta de inatividade
+        - estado_alertas: última versão de dados já avaliada
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("""
+            CREATE TABLE alertas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chave_dedup TEXT NOT NULL,
+                tipo TEXT NOT NULL,
+                criticidade TEXT NOT NULL,
+                nome_modulo TEXT NOT NULL,
+                mensagem TEXT NOT NULL,
+                estado TEXT NOT NULL DEFAULT 'aberto',
+                ocorrencias INTEGER NOT NULL DEFAULT 1,
+                referencia TEXT,
+                timestamp_criacao DATETIME NOT NULL,
+                timestamp_atualizacao DATETIME NOT NULL,
+                timestamp_reconhecimento DATETIME,
+                reconhecido_por TEXT,
+                timestamp_resolucao DATETIME,
+                versao INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX idx_alertas_ativos_chave
+            ON alertas (chave_dedup) WHERE estado != 'resolvido'
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_alertas_ativos
+            ON alertas (timestamp_atualizacao) WHERE estado != 'resolvido'
+        """)
+        self._criar_triggers_versao(cursor, "alertas")
+        
+        cursor.execute("""
+            CREATE TABLE prazos_alertas (
+                nome_modulo TEXT PRIMARY KEY,
+                vence_em TEXT NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX idx_prazos_alertas_vencimento ON prazos_alertas (vence_em)")
+        
+        cursor.execute("""
+            CREATE TABLE estado_alertas (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                versao_avaliada INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("INSERT INTO estado_alertas (id, versao_avaliada) VALUES (1, 0)")
+    
+    def _migracao_auto_vacuum(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Agenda a ativação do auto_vacuum incremental em bancos antigos.
+        
+        Bancos criados já com auto_vacuum não precisam de nada; nos demais,
+        o VACUUM completo roda uma única vez, logo após as migrações.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        self._vacuum_pendente = cursor.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+    
+    def _migracao_categoria_historico(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Grava em historico_execucoes a categoria do módulo em cada execução.
+        
+        Até aqui o agregado usava a categoria atual de status_modulos e o dia
+        de timestamp_execucao. As execuções existentes recebem a categoria
+        atual (a única conhecida) e os dias ainda cobertos pelo histórico são
+        refeitos pela data de referência; dias anteriores, cujo histórico já
+        foi removido, são mantidos como estão.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        cursor.execute("ALTER TABLE historico_execucoes ADD COLUMN categoria TEXT NOT NULL DEFAULT ''")
+        cursor.execute("""
+            UPDATE historico_execucoes
+            SET categoria = (
+                SELECT sm.categoria FROM status_modulos sm
+                WHERE sm.nome_modulo = historico_execucoes.nome_modulo
+            )
+            WHERE nome_modulo IN (SELECT nome_modulo FROM status_modulos)
+        """)
+        cursor.execute("CREATE INDEX idx_historico_referencia ON historico_execucoes (data_referencia)")
+        
+        inicio_historico = cursor.execute(
+            "SELECT date(MIN(timestamp_execucao)) FROM historico_execucoes"
+        ).fetchone()[0]
+        if inicio_historico is not None:
+            cursor.execute("DELETE FROM metricas_consolidadas WHERE data_consolidacao >= ?", (inicio_historico,))
+            self._acumular_metricas(cursor, "1 = 1", ())
+    
+    def _migracao_versao_sem_progresso(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Recria os triggers de versão de status_modulos ignorando atualizações de progresso.
+        
+        `reportar_progresso` e a gravação em lote do progresso mudavam a
+        versão a cada chamada, invalidando o snapshot do dashboard e a
+        avaliação de alertas sem que status, resultado ou erro mudassem.
+        
+        Args:
+            cursor: Cursor dentro da transação da migração
+        """
+        for evento in ("insert", "update"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_status_modulos_versao_{evento}")
+        self._criar_triggers_versao(cursor, "status_modulos", _COLUNAS_VERSIONADAS_STATUS)
+    
+    def _gravar_resultado(self, cursor: sqlite3.Cursor, dados: Any) -> int:
+        """
+        Grava um resultado compactado.
+        
+        Args:
+            cursor: Cursor dentro da transação corrente
+            dados: Resultado serializável em JSON
+            
+        Returns:
+            Identificador do resultado em resultados_compactados
+        """
+        cursor.execute(
+            "INSERT INTO resultados_compactados (dados) VALUES (?)",
+            (compactar_resultado(dados),)
+        )
+        return cursor.lastrowid
+    
+    def _acumular_metricas(self, cursor: sqlite3.Cursor, filtro: str, params: Tuple) -> None:
+        """
+        Soma execuções do histórico ao agregado diário por categoria.
+        
+        O dia é a data de referência da execução e a categoria, a do módulo
+        no momento da execução ("" se o módulo não tinha status registrado).
+        
+        Args:
+            cursor: Cursor dentro da transação corrente
+            filtro: Condição SQL sobre `he` (historico_execucoes) das execuções a somar
+            params: Parâmetros da condição
+        """
+        cursor.execute(f"""
+            INSERT INTO metricas_consolidadas
+            (data_consolidacao, categoria, execucoes, execucoes_sucesso, execucoes_erro,
+             soma_tempo_execucao, contagem_tempo_execucao, soma_taxa_sucesso,
+             contagem_taxa_sucesso, total_registros_processados, timestamp_consolidacao)
+            SELECT
+                he.data_referencia,
+                he.categoria,
+                COUNT(*),
+                COUNT(CASE WHEN he.status = 'sucesso' THEN 1 END),
+                COUNT(CASE WHEN he.status = 'erro' THEN 1 END),
+                TOTAL(he.tempo_execucao),
+                COUNT(he.tempo_execucao),
+                TOTAL(he.taxa_sucesso),
+                COUNT(he.taxa_sucesso),
+                COALESCE(SUM(he.registros_processados), 0),
+                CURRENT_TIMESTAMP
+            FROM historico_execucoes he
+            WHERE {filtro}
+            GROUP BY 1, 2
+            ON CONFLICT (data_consolidacao, categoria) DO UPDATE SET
+                execucoes = execucoes + excluded.execucoes,
+                execucoes_sucesso = execucoes_sucesso + excluded.execucoes_sucesso,
+                execucoes_erro = execucoes_erro + excluded.execucoes_erro,
+                soma_tempo_execucao = soma_tempo_execucao + excluded.soma_tempo_execucao,
+                contagem_tempo_execucao = contagem_tempo_execucao + excluded.contagem_tempo_execucao,
+                soma_taxa_sucesso = soma_taxa_sucesso + excluded.soma_taxa_sucesso,
+                contagem_taxa_sucesso = contagem_taxa_sucesso + excluded.contagem_taxa_sucesso,
+                total_registros_processados = total_registros_processados + excluded.total_registros_processados,
+                timestamp_consolidacao = excluded.timestamp_consolidacao
+        """, params)
+    
+    def _recalcular_dia(self, cursor: sqlite3.Cursor, data: str) -> None:
+        """
+        Refaz as linhas do agregado de uma data de referência a partir do histórico.
+        
+        Args:
+            cursor: Cursor dentro da transação corrente
+            data: Data de referência no formato YYYY-MM-DD
+        """
+        cursor.execute("DELETE FROM metricas_consolidadas WHERE data_consolidacao = ?", (data,))
+        self._acumular_metricas(cursor, "he.data_referencia = ?", (data,))
+    
+    def _consolidar_execucao(self, cursor: sqlite3.Cursor, id_execucao: int, data_referencia: str) -> None:
+        """
+        Leva ao agregado diário uma execução recém-gravada no histórico.
+        
+        Execuções de datas de referência anteriores a hoje (reprocessamentos
+        e cargas atrasadas) refazem o dia inteiro, desde que o histórico
+        ainda cubra o dia; as demais são somadas ao agregado.
+        
+        Args:
+            cursor: Cursor dentro da transação corrente
+            id_execucao: Identificador da execução em historico_execucoes
+            data_referencia: Data de referência da execução (YYYY-MM-DD)
+        """
+        if data_referencia < datetime.now().strftime("%Y-%m-%d"):
+            inicio_historico = cursor.execute(
+                "SELECT date(MIN(timestamp_execucao)) FROM historico_execucoes"
+            ).fetchone()[0]
+            if inicio_historico is not None and data_referencia >= inicio_historico:
+                self._recalcular_dia(cursor, data_referencia)
+                return
+        
+        self._acumular_metricas(cursor, "he.id = ?", (id_execucao,))
+    
+    def recalcular_metricas_dia(self, data: str) -> None:
+        """
+        Recalcula o agregado de uma data de referência a partir do histórico.
+        
+        Usado quando execuções chegam ou são corrigidas fora de ordem; apenas
+        as linhas da data informada são refeitas. Datas cujas execuções já
+        foram removidas do histórico por `limpar_historico_antigo` ficam zeradas.
+        
+        Args:
+            data: Data de referência no formato YYYY-MM-DD
+        """
+        try:
+            with self._pool.conexao() as conn:
+                self._recalcular_dia(conn.cursor(), data)
+            
+            self.logger.info(f"🔄 Métricas recalculadas: {data}")
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao recalcular métricas de {data}: {e}")
+    
     def reportar_inicio(self, nome_modulo: str, categoria: str = "", criticidade: str = "") -> None:
         """
         Reporta o início da execução de um módulo.
@@ -109,15 +917,27 @@ class StatusReporter:
             criticidade: Criticidade do módulo
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._escrita_ordenada(), self._pool.conexao() as conn:
                 cursor = conn.cursor()
                 
-                # Inserir ou atualizar status
+                # Inserir ou atualizar status (uma linha por módulo)
                 cursor.execute("""
-                    INSERT OR REPLACE INTO status_modulos 
+                    INSERT INTO status_modulos 
                     (nome_modulo, categoria, criticidade, status, progresso, 
                      mensagem, timestamp_inicio, timestamp_atualizacao)
                     VALUES (?, ?, ?, 'executando', 0, 'Iniciando execução...', ?, ?)
+                    ON CONFLICT (nome_modulo) DO UPDATE SET
+                        categoria = excluded.categoria,
+                        criticidade = excluded.criticidade,
+                        status = excluded.status,
+                        progresso = excluded.progresso,
+                        mensagem = excluded.mensagem,
+                        timestamp_inicio = excluded.timestamp_inicio,
+                        timestamp_fim = NULL,
+                        timestamp_atualizacao = excluded.timestamp_atualizacao,
+                        dados_resultado = NULL,
+                        id_resultado = NULL,
+                        erro = NULL
                 """, (nome_modulo, categoria, criticidade, datetime.now(), datetime.now()))
                 
                 conn.commit()
@@ -130,13 +950,23 @@ class StatusReporter:
         """
         Reporta o progresso da execução de um módulo.
         
+        Com `escrita_assincrona`, a atualização fica em memória (só a última
+        de cada módulo) até a próxima gravação em lote.
+        
         Args:
             nome_modulo: Nome do módulo
             progresso: Percentual de progresso (0-100)
             mensagem: Mensagem descritiva do progresso
         """
+        if self.escrita_assincrona:
+            with self._lock_pendentes:
+                self._pendentes[nome_modulo] = (progresso, mensagem, datetime.now())
+                if len(self._pendentes) >= self.lote_flush:
+                    self._acordar.set()
+            return
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.conexao() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -160,37 +990,44 @@ class StatusReporter:
             resultados: Resultados da execução
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._escrita_ordenada(), self._pool.conexao() as conn:
                 cursor = conn.cursor()
                 
+                # Resultado gravado uma vez, compactado, e referenciado pelas duas tabelas
+                id_resultado = self._gravar_resultado(cursor, resultados)
+                
                 # Atualizar status do módulo
                 cursor.execute("""
                     UPDATE status_modulos 
                     SET status = 'sucesso', progresso = 100, 
                         mensagem = 'Execução concluída com sucesso',
                         timestamp_fim = ?, timestamp_atualizacao = ?,
-                        dados_resultado = ?
+                        id_resultado = ?
                     WHERE nome_modulo = ?
-                """, (datetime.now(), datetime.now(), json.dumps(resultados), nome_modulo))
+                """, (datetime.now(), datetime.now(), id_resultado, nome_modulo))
                 
-                # Inserir no histórico
+                # Inserir no histórico, com a categoria do módulo nesta execução
                 metricas = resultados.get("metricas", {})
+                data_referencia = resultados.get("data_referencia", datetime.now().strftime("%Y-%m-%d"))
                 cursor.execute("""
                     INSERT INTO historico_execucoes
                     (nome_modulo, data_referencia, status, tempo_execucao,
                      registros_processados, registros_validos, registros_invalidos,
-                     taxa_sucesso, dados_completos)
-                    VALUES (?, ?, 'sucesso', ?, ?, ?, ?, ?, ?)
+                     taxa_sucesso, id_resultado, categoria)
+                    VALUES (?, ?, 'sucesso', ?, ?, ?, ?, ?, ?,
+                            COALESCE((SELECT categoria FROM status_modulos WHERE nome_modulo = ?), ''))
                 """, (
                     nome_modulo,
-                    resultados.get("data_referencia", datetime.now().strftime("%Y-%m-%d")),
+                    data_referencia,
                     metricas.get("tempo_execucao", 0),
                     resultados.get("total_registros", 0),
                     resultados.get("registros_validos", 0),
                     resultados.get("registros_invalidos", 0),
                     metricas.get("taxa_sucesso", 100.0),
-                    json.dumps(resultados)
+                    id_resultado,
+                    nome_modulo
                 ))
+                self._consolidar_execucao(cursor, cursor.lastrowid, data_referencia)
                 
                 conn.commit()
                 self.logger.info(f"✅ Sucesso reportado: {nome_modulo}")
@@ -207,7 +1044,7 @@ class StatusReporter:
             erro: Descrição do erro
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._escrita_ordenada(), self._pool.conexao() as conn:
                 cursor = conn.cursor()
                 
                 # Atualizar status do módulo
@@ -219,16 +1056,19 @@ class StatusReporter:
                     WHERE nome_modulo = ?
                 """, (f"Erro: {erro}", datetime.now(), datetime.now(), erro, nome_modulo))
                 
-                # Inserir no histórico
+                # Inserir no histórico, com a categoria do módulo nesta execução
                 cursor.execute("""
                     INSERT INTO historico_execucoes
-                    (nome_modulo, data_referencia, status, dados_completos)
-                    VALUES (?, ?, 'erro', ?)
+                    (nome_modulo, data_referencia, status, id_resultado, categoria)
+                    VALUES (?, ?, 'erro', ?,
+                            COALESCE((SELECT categoria FROM status_modulos WHERE nome_modulo = ?), ''))
                 """, (
                     nome_modulo,
                     datetime.now().strftime("%Y-%m-%d"),
-                    json.dumps({"erro": erro, "timestamp": datetime.now().isoformat()})
+                    self._gravar_resultado(cursor, {"erro": erro, "timestamp": datetime.now().isoformat()}),
+                    nome_modulo
                 ))
+                self._acumular_metricas(cursor, "he.id = ?", (cursor.lastrowid,))
                 
                 conn.commit()
                 self.logger.error(f"❌ Erro reportado: {nome_modulo} - {erro}")
@@ -236,6 +1076,72 @@ class StatusReporter:
         except Exception as e:
             self.logger.error(f"❌ Erro ao reportar erro: {e}")
     
+    def reportar_ignorado(self, nome_modulo: str, motivo: str, categoria: str = "", criticidade: str = "") -> None:
+        """
+        Reporta que um módulo não foi executado (ex.: dependência falhou).
+        
+        Não gera registro no histórico, pois não houve execução.
+        
+        Args:
+            nome_modulo: Nome do módulo
+            motivo: Motivo de o módulo não ter sido executado
+            categoria: Categoria do módulo
+            criticidade: Criticidade do módulo
+        """
+        try:
+            with self._escrita_ordenada(), self._pool.conexao() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    INSERT INTO status_modulos 
+                    (nome_modulo, categoria, criticidade, status, progresso, 
+                     mensagem, timestamp_fim, timestamp_atualizacao)
+                    VALUES (?, ?, ?, 'ignorado', 0, ?, ?, ?)
+                    ON CONFLICT (nome_modulo) DO UPDATE SET
+                        categoria = excluded.categoria,
+                        criticidade = excluded.criticidade,
+                        status = excluded.status,
+                        progresso = excluded.progresso,
+                        mensagem = excluded.mensagem,
+                        timestamp_inicio = NULL,
+                        timestamp_fim = excluded.timestamp_fim,
+                        timestamp_atualizacao = excluded.timestamp_atualizacao,
+                        dados_resultado = NULL,
+                        id_resultado = NULL,
+                        erro = NULL
+                """, (nome_modulo, categoria, criticidade, f"Ignorado: {motivo}", datetime.now(), datetime.now()))
+                
+                conn.commit()
+                self.logger.warning(f"⏭️ Módulo ignorado: {nome_modulo} - {motivo}")
+                
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao reportar módulo ignorado: {e}")
+    
+    @staticmethod
+    def _linha_status(row: Tuple) -> Dict[str, Any]:
+        """
+        Converte uma linha de status_modulos no dicionário de status.
+        
+        Args:
+            row: Linha com as colunas de `_COLUNAS_STATUS`, na mesma ordem
+            
+        Returns:
+            Dicionário com status do módulo
+        """
+        return {
+            "nome_modulo": row[0],
+            "categoria": row[1],
+            "criticidade": row[2],
+            "status": row[3],
+            "progresso": row[4],
+            "mensagem": row[5],
+            "timestamp_inicio": row[6],
+            "timestamp_fim": row[7],
+            "timestamp_atualizacao": row[8],
+            "dados_resultado": descompactar_resultado(row[9]),
+            "erro": row[10]
+        }
+    
     def obter_status_modulo(self, nome_modulo: str) -> Optional[Dict[str, Any]]:
         """
         Obtém o status atual de um módulo específico.
@@ -247,36 +1153,18 @@ class StatusReporter:
             Dicionário com status do módulo ou None se não encontrado
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool_leitura.conexao() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT nome_modulo, categoria, criticidade, status, progresso,
-                           mensagem, timestamp_inicio, timestamp_fim, 
-                           timestamp_atualizacao, dados_resultado, erro
-                    FROM status_modulos 
-                    WHERE nome_modulo = ?
-                    ORDER BY timestamp_atualizacao DESC
-                    LIMIT 1
+                cursor.execute(f"""
+                    SELECT {_COLUNAS_STATUS}
+                    FROM status_modulos sm
+                    LEFT JOIN resultados_compactados rc ON rc.id = sm.id_resultado
+                    WHERE sm.nome_modulo = ?
                 """, (nome_modulo,))
                 
                 row = cursor.fetchone()
-                if row:
-                    return {
-                        "nome_modulo": row[0],
-                        "categoria": row[1],
-                        "criticidade": row[2],
-                        "status": row[3],
-                        "progresso": row[4],
-                        "mensagem": row[5],
-                        "timestamp_inicio": row[6],
-                        "timestamp_fim": row[7],
-                        "timestamp_atualizacao": row[8],
-                        "dados_resultado": json.loads(row[9]) if row[9] else None,
-                        "erro": row[10]
-                    }
-                
-                return None
+                return self._linha_status(row) if row else None
                 
         except Exception as e:
             self.logger.error(f"❌ Erro ao obter status: {e}")
@@ -290,43 +1178,171 @@ class StatusReporter:
             Lista com status de todos os módulos
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool_leitura.conexao() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    SELECT nome_modulo, categoria, criticidade, status, progresso,
-                           mensagem, timestamp_inicio, timestamp_fim, 
-                           timestamp_atualizacao, dados_resultado, erro
-                    FROM status_modulos 
-                    ORDER BY categoria, nome_modulo
+                cursor.execute(f"""
+                    SELECT {_COLUNAS_STATUS}
+                    FROM status_modulos sm
+                    LEFT JOIN resultados_compactados rc ON rc.id = sm.id_resultado
+                    ORDER BY sm.categoria, sm.nome_modulo
                 """)
                 
-                modulos = []
-                for row in cursor.fetchall():
-                    modulos.append({
-                        "nome_modulo": row[0],
-                        "categoria": row[1],
-                        "criticidade": row[2],
-                        "status": row[3],
-                        "progresso": row[4],
-                        "mensagem": row[5],
-                        "timestamp_inicio": row[6],
-                        "timestamp_fim": row[7],
-                        "timestamp_atualizacao": row[8],
-                        "dados_resultado": json.loads(row[9]) if row[9] else None,
-                        "erro": row[10]
-                    })
-                
-                return modulos
+                return [self._linha_status(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             self.logger.error(f"❌ Erro ao obter status de todos os módulos: {e}")
             return []
     
+    def obter_duracoes_esperadas(self, modulos: Optional[Sequence[str]] = None,
+                                 ultimas_execucoes: int = 20) -> Dict[str, float]:
+        """
+        Estima a duração de cada módulo pelas últimas execuções com sucesso.
+        
+        Args:
+            modulos: Módulos a consultar (None = todos)
+            ultimas_execucoes: Número de execuções recentes consideradas por módulo
+            
+        Returns:
+            Dicionário módulo -> duração média em segundos (só módulos com histórico)
+        """
+        filtro = ""
+        params: List[Any] = []
+        if modulos is not None:
+            if not modulos:
+                return {}
+            filtro = f"AND nome_modulo IN ({', '.join('?' * len(modulos))})"
+            params.extend(modulos)
+        
+        try:
+            with self._pool_leitura.conexao() as conn:
+                linhas = conn.execute(f"""
+                    SELECT nome_modulo, AVG(tempo_execucao)
+                    FROM (
+                        SELECT nome_modulo, tempo_execucao,
+                               ROW_NUMBER() OVER (PARTITION BY nome_modulo ORDER BY timestamp_execucao DESC) AS posicao
+                        FROM historico_execucoes
+                        WHERE status = 'sucesso' AND tempo_execucao > 0 {filtro}
+                    )
+                    WHERE posicao <= ?
+                    GROUP BY nome_modulo
+                """, params + [ultimas_execucoes]).fetchall()
+            
+            return {nome: duracao for nome, duracao in linhas}
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao obter durações esperadas: {e}")
+            return {}
+    
+    def obter_versao_dados(self) -> int:
+        """
+        Retorna a versão atual dos dados de status e histórico.
+        
+        A versão cresce a cada escrita em status_modulos ou
+        historico_execucoes; se não mudou, nada mudou.
+        
+        Returns:
+            Versão atual (0 se não for possível consultá-la)
+        """
+        try:
+            with self._pool_leitura.conexao() as conn:
+                return conn.execute("SELECT versao FROM controle_versao WHERE id = 1").fetchone()[0]
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao obter versão dos dados: {e}")
+            return 0
+    
+    def mudancas_desde(self, versao: int, limite: int = 1000) -> Dict[str, Any]:
+        """
+        Retorna os status e execuções alterados depois de uma versão.
+        
+        Uso típico: guardar o campo `versao` do retorno e passá-lo na próxima
+        chamada. Se `completo` for False, há mais mudanças além do limite e a
+        próxima chamada continua de onde esta parou. Remoções (limpeza ou
+        arquivamento do histórico) e atualizações só de progresso não aparecem.
+        
+        Args:
+            versao: Última versão já conhecida pelo consumidor
+            limite: Número máximo de linhas de cada tabela
+            
+        Returns:
+            Dicionário com `versao` (até onde as mudanças foram lidas),
+            `completo`, `status` (status alterados, com `versao`) e
+            `historico` (execuções novas ou alteradas, com `versao`)
+        """
+        try:
+            with self._pool_leitura.conexao() as conn:
+                # Uma única transação de leitura: as consultas veem o mesmo instante
+                conn.execute("BEGIN")
+                versao_atual = conn.execute("SELECT versao FROM controle_versao WHERE id = 1").fetchone()[0]
+                
+                linhas_status = conn.execute(f"""
+                    SELECT {_COLUNAS_STATUS}, sm.versao
+                    FROM status_modulos sm
+                    LEFT JOIN resultados_compactados rc ON rc.id = sm.id_resultado
+                    WHERE sm.versao > ?
+                    ORDER BY sm.versao
+                    LIMIT ?
+                """, (versao, limite)).fetchall()
+                
+                linhas_historico = conn.execute("""
+                    SELECT id, nome_modulo, data_referencia, status, tempo_execucao,
+                           registros_processados, registros_validos, registros_invalidos,
+                           taxa_sucesso, timestamp_execucao, versao
+                    FROM historico_execucoes
+                    WHERE versao > ?
+                    ORDER BY versao
+                    LIMIT ?
+                """, (versao, limite)).fetchall()
+            
+            # Com alguma tabela truncada, só é seguro avançar até a menor última versão lida
+            completo = len(linhas_status) < limite and len(linhas_historico) < limite
+            if not completo:
+                ultimas = [linhas[-1][-1] for linhas in (linhas_status, linhas_historico) if len(linhas) == limite]
+                versao_atual = min(ultimas)
+                linhas_status = [row for row in linhas_status if row[-1] <= versao_atual]
+                linhas_historico = [row for row in linhas_historico if row[-1] <= versao_atual]
+            
+            status = []
+            for row in linhas_status:
+                item = self._linha_status(row)
+                item["versao"] = row[-1]
+                status.append(item)
+            
+            historico = [
+                {
+                    "id": row[0],
+                    "nome_modulo": row[1],
+                    "data_referencia": row[2],
+                    "status": row[3],
+                    "tempo_execucao": row[4],
+                    "registros_processados": row[5],
+                    "registros_validos": row[6],
+                    "registros_invalidos": row[7],
+                    "taxa_sucesso": row[8],
+                    "timestamp_execucao": row[9],
+                    "versao": row[10]
+                }
+                for row in linhas_historico
+            ]
+            
+            return {
+                "versao": versao_atual,
+                "completo": completo,
+                "status": status,
+                "historico": historico
+            }
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao obter mudanças: {e}")
+            return {"versao": versao, "completo": False, "status": [], "historico": []}
+    
     def obter_metricas_consolidadas(self, data_inicio: str = None, data_fim: str = None) -> Dict[str, Any]:
         """
         Obtém métricas consolidadas de execuções.
         
+        Lê o agregado diário por categoria (metricas_consolidadas), mantido a
+        cada `reportar_sucesso`/`reportar_erro`, sem varrer o histórico.
+        
         Args:
             data_inicio: Data de início no formato YYYY-MM-DD
             data_fim: Data de fim no formato YYYY-MM-DD
@@ -335,57 +1351,52 @@ class StatusReporter:
             Dicionário com métricas consolidadas
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool_leitura.conexao() as conn:
                 cursor = conn.cursor()
                 
-                # Query base
+                # Filtro pelo dia (chave primária do agregado)
                 where_clause = ""
                 params = []
-                
-                if data_inicio and data_fim:
-                    where_clause = "WHERE DATE(timestamp_execucao) BETWEEN ? AND ?"
-                    params = [data_inicio, data_fim]
-                elif data_inicio:
-                    where_clause = "WHERE DATE(timestamp_execucao) >= ?"
-                    params = [data_inicio]
-                elif data_fim:
-                    where_clause = "WHERE DATE(timestamp_execucao) <= ?"
-                    params = [data_fim]
-                
-                # Métricas gerais
-                cursor.execute(f"""
-                    SELECT 
-                        COUNT(*) as total_execucoes,
-                        COUNT(CASE WHEN status = 'sucesso' THEN 1 END) as execucoes_sucesso,
-                        COUNT(CASE WHEN status = 'erro' THEN 1 END) as execucoes_erro,
-                        AVG(tempo_execucao) as tempo_medio_execucao,
-                        AVG(taxa_sucesso) as taxa_sucesso_media,
-                        SUM(registros_processados) as total_registros_processados
-                    FROM historico_execucoes 
-                    {where_clause}
-                """, params)
-                
-                row = cursor.fetchone()
+                condicoes = []
+                if data_inicio:
+                    condicoes.append("data_consolidacao >= ?")
+                    params.append(data_inicio)
+                if data_fim:
+                    condicoes.append("data_consolidacao <= ?")
+                    params.append(data_fim)
+                if condicoes:
+                    where_clause = "WHERE " + " AND ".join(condicoes)
                 
                 # Métricas por categoria
                 cursor.execute(f"""
                     SELECT 
-                        sm.categoria,
-                        COUNT(*) as execucoes,
-                        COUNT(CASE WHEN he.status = 'sucesso' THEN 1 END) as sucessos,
-                        AVG(he.tempo_execucao) as tempo_medio
-                    FROM historico_execucoes he
-                    JOIN status_modulos sm ON he.nome_modulo = sm.nome_modulo
+                        categoria,
+                        SUM(execucoes),
+                        SUM(execucoes_sucesso),
+                        SUM(execucoes_erro),
+                        SUM(soma_tempo_execucao),
+                        SUM(contagem_tempo_execucao),
+                        SUM(soma_taxa_sucesso),
+                        SUM(contagem_taxa_sucesso),
+                        SUM(total_registros_processados)
+                    FROM metricas_consolidadas
                     {where_clause}
-                    GROUP BY sm.categoria
+                    GROUP BY categoria
                 """, params)
+                linhas = cursor.fetchall()
+                
+                # Métricas gerais (soma de todas as categorias)
+                totais = [sum(linha[i] for linha in linhas) for i in range(1, 9)]
                 
                 categorias = {}
-                for cat_row in cursor.fetchall():
+                for cat_row in linhas:
+                    # Execuções de módulos sem status registrado só entram no geral
+                    if not cat_row[0]:
+                        continue
                     categorias[cat_row[0]] = {
                         "execucoes": cat_row[1],
                         "sucessos": cat_row[2],
-                        "tempo_medio": cat_row[3] or 0
+                        "tempo_medio": (cat_row[4] / cat_row[5]) if cat_row[5] else 0
                     }
                 
                 return {
@@ -394,12 +1405,12 @@ class StatusReporter:
                         "data_fim": data_fim
                     },
                     "geral": {
-                        "total_execucoes": row[0] or 0,
-                        "execucoes_sucesso": row[1] or 0,
-                        "execucoes_erro": row[2] or 0,
-                        "tempo_medio_execucao": row[3] or 0,
-                        "taxa_sucesso_media": row[4] or 0,
-                        "total_registros_processados": row[5] or 0
+                        "total_execucoes": totais[0],
+                        "execucoes_sucesso": totais[1],
+                        "execucoes_erro": totais[2],
+                        "tempo_medio_execucao": (totais[3] / totais[4]) if totais[4] else 0,
+                        "taxa_sucesso_media": (totais[5] / totais[6]) if totais[6] else 0,
+                        "total_registros_processados": totais[7]
                     },
                     "por_categoria": categorias,
                     "timestamp_consulta": datetime.now().isoformat()
@@ -409,34 +1420,405 @@ class StatusReporter:
             self.logger.error(f"❌ Erro ao obter métricas: {e}")
             return {}
     
-    def limpar_historico_antigo(self, dias_manter: int = 90) -> int:
+    def _intervalo_serie(self, intervalo: Union[str, int], segundos_periodo: float,
+                         max_pontos: int) -> Tuple[Union[str, int], str]:
+        """
+        Escolhe o intervalo efetivo da série e sua expressão SQL.
+        
+        Se o intervalo pedido gerar mais de `max_pontos` pontos no período,
+        usa o próximo intervalo nomeado maior (ou, para intervalos em
+        segundos, um múltiplo maior).
+        
+        Args:
+            intervalo: "hora", "dia", "semana", "mes" ou duração em segundos
+            segundos_periodo: Duração do período consultado, em segundos
+            max_pontos: Número máximo de pontos por série
+            
+        Returns:
+            Tupla (intervalo efetivo, expressão SQL do início do intervalo)
+            
+        Raises:
+            ValueError: Se o intervalo não for reconhecido
+        """
+        minimo = segundos_periodo / max(1, max_pontos)
+        
+        if isinstance(intervalo, str):
+            if intervalo not in INTERVALOS_SERIE:
+                raise ValueError(f"Intervalo inválido: {intervalo}. Use {', '.join(INTERVALOS_SERIE)} ou segundos")
+            nomes = list(INTERVALOS_SERIE)
+            for nome in nomes[nomes.index(intervalo):]:
+                if INTERVALOS_SERIE[nome][0] >= minimo:
+                    return nome, INTERVALOS_SERIE[nome][1]
+            intervalo = INTERVALOS_SERIE["mes"][0]
+        
+        segundos = max(int(intervalo), int(math.ceil(minimo)), 1)
+        expressao = (
+            f"datetime((CAST(strftime('%s', he.timestamp_execucao) AS INTEGER) / {segundos}) "
+            f"* {segundos}, 'unixepoch')"
+        )
+        return segundos, expressao
+    
+    def obter_serie_temporal(self, intervalo: Union[str, int] = "dia", agrupar_por: str = "modulo",
+                             data_inicio: Optional[str] = None, data_fim: Optional[str] = None,
+                             filtro: Optional[Sequence[str]] = None, max_pontos: int = 500,
+                             percentis: Sequence[float] = (50, 95)) -> Dict[str, Any]:
+        """
+        Obtém séries temporais agregadas do histórico de execuções.
+        
+        A agregação é feita no SQL: para cada intervalo e módulo (ou
+        categoria) retorna execuções, taxa de sucesso, tempo médio, percentis
+        do tempo de execução (posto mais próximo) e registros processados.
+        Semanas começam na segunda-feira.
+        
+        Args:
+            intervalo: "hora", "dia", "semana", "mes" ou duração em segundos
+            agrupar_por: "modulo" ou "categoria"
+            data_inicio: Data de início no formato YYYY-MM-DD (padrão: um ano atrás)
+            data_fim: Data de fim no formato YYYY-MM-DD (padrão: hoje)
+            filtro: Módulos ou categorias a incluir (None = todos)
+            max_pontos: Número máximo de pontos por série; o intervalo é
+                aumentado se necessário
+            percentis: Percentis do tempo de execução a calcular (0-100)
+            
+        Returns:
+            Dicionário com o intervalo efetivo e as séries (nome -> lista de pontos)
+        """
+        if agrupar_por not in ("modulo", "categoria"):
+            raise ValueError(f"agrupar_por inválido: {agrupar_por}. Use 'modulo' ou 'categoria'")
+        
+        data_fim = data_fim or datetime.now().strftime("%Y-%m-%d")
+        data_inicio = data_inicio or (datetime.strptime(data_fim, "%Y-%m-%d") - timedelta(days=365)).strftime("%Y-%m-%d")
+        segundos_periodo = (
+            datetime.strptime(data_fim, "%Y-%m-%d") - datetime.strptime(data_inicio, "%Y-%m-%d")
+        ).total_seconds() + 86400
+        intervalo_efetivo, expressao = self._intervalo_serie(intervalo, segundos_periodo, max_pontos)
+        
+        serie = "he.nome_modulo" if agrupar_por == "modulo" else "he.categoria"
+        
+        condicoes = ["he.timestamp_execucao >= ?", "he.timestamp_execucao < date(?, '+1 day')"]
+        params: List[Any] = [data_inicio, data_fim]
+        if filtro:
+            condicoes.append(f"{serie} IN ({', '.join('?' * len(filtro))})")
+            params.extend(filtro)
+        
+        percentis = [float(p) for p in percentis]
+        colunas_percentis = "".join(
+            f", MIN(CASE WHEN posicao * 100 >= ? * n THEN tempo_execucao END)" for _ in percentis
+        )
+        
+        try:
+            with self._pool_leitura.conexao() as conn:
+                linhas = conn.execute(f"""
+                    WITH base AS (
+                        SELECT {expressao} AS periodo, {serie} AS serie,
+                               he.status, he.tempo_execucao, he.registros_processados
+                        FROM historico_execucoes he
+                        WHERE {' AND '.join(condicoes)}
+                    ),
+                    agregado AS (
+                        SELECT periodo, serie,
+                               COUNT(*) AS execucoes,
+                               COUNT(CASE WHEN status = 'sucesso' THEN 1 END) AS sucessos,
+                               AVG(tempo_execucao) AS tempo_medio,
+                               COALESCE(SUM(registros_processados), 0) AS registros
+                        FROM base
+                        GROUP BY periodo, serie
+                    ),
+                    ordenado AS (
+                        SELECT periodo, serie, tempo_execucao,
+                               ROW_NUMBER() OVER (PARTITION BY periodo, serie ORDER BY tempo_execucao) AS posicao,
+                               COUNT(*) OVER (PARTITION BY periodo, serie) AS n
+                        FROM base
+                        WHERE tempo_execucao IS NOT NULL
+                    ),
+                    quantis AS (
+                        SELECT periodo, serie{colunas_percentis}
+                        FROM ordenado
+                        GROUP BY periodo, serie
+                    )
+                    SELECT a.serie, a.periodo, a.execucoes, a.sucessos, a.tempo_medio,
+                           a.registros, q.*
+                    FROM agregado a
+                    LEFT JOIN quantis q ON q.periodo = a.periodo AND q.serie = a.serie
+                    ORDER BY a.serie, a.periodo
+                """, params + percentis).fetchall()
+            
+            nomes_percentis = [f"p{p:g}" for p in percentis]
+            series: Dict[str, List[Dict[str, Any]]] = {}
+            for linha in linhas:
+                ponto = {
+                    "periodo": linha[1],
+                    "execucoes": linha[2],
+                    "taxa_sucesso": linha[3] / linha[2] * 100 if linha[2] else 0,
+                    "tempo_medio": linha[4],
+                    "registros_processados": linha[5]
+                }
+                # Colunas de quantis após periodo e serie repetidos
+                ponto.update(zip(nomes_percentis, linha[8:]))
+                series.setdefault(linha[0], []).append(ponto)
+            
+            return {
+                "periodo": {
+                    "data_inicio": data_inicio,
+                    "data_fim": data_fim
+                },
+                "intervalo": intervalo_efetivo,
+                "agrupar_por": agrupar_por,
+                "series": series
+            }
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao obter série temporal: {e}")
+            return {}
+    
+    def limpar_historico_antigo(self, dias_manter: int = 90, arquivar: bool = False,
+                                diretorio_arquivo: Optional[str] = None) -> int:
         """
         Remove registros de histórico mais antigos que o especificado.
         
+        O agregado em metricas_consolidadas é mantido, então as métricas de
+        períodos antigos continuam disponíveis. O espaço liberado é devolvido
+        com `incremental_vacuum`.
+        
         Args:
             dias_manter: Número de dias de histórico para manter
+            arquivar: Se True, move os registros para os arquivos mensais
+                (ver `arquivar_historico_antigo`) em vez de apagá-los
+            diretorio_arquivo: Diretório dos arquivos mensais (modo arquivar)
             
         Returns:
             Número de registros removidos
         """
+        if arquivar:
+            return self.arquivar_historico_antigo(dias_manter, diretorio_arquivo)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.conexao() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
                     DELETE FROM historico_execucoes 
-                    WHERE timestamp_execucao < datetime('now', '-{} days')
-                """.format(dias_manter))
+                    WHERE timestamp_execucao < datetime('now', ?)
+                """, (f"-{int(dias_manter)} days",))
                 
                 registros_removidos = cursor.rowcount
+                self._remover_resultados_orfaos(cursor)
                 conn.commit()
-                
-                self.logger.info(f"🧹 Histórico limpo: {registros_removidos} registros removidos")
-                return registros_removidos
+            
+            self._vacuum_incremental()
+            self.logger.info(f"🧹 Histórico limpo: {registros_removidos} registros removidos")
+            return registros_removidos
                 
         except Exception as e:
             self.logger.error(f"❌ Erro ao limpar histórico: {e}")
             return 0
+    
+    def _remover_resultados_orfaos(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Remove resultados compactados que deixaram de ser referenciados.
+        
+        Args:
+            cursor: Cursor dentro da transação corrente
+        """
+        cursor.execute("""
+            DELETE FROM resultados_compactados
+            WHERE id NOT IN (SELECT id_resultado FROM historico_execucoes
+                             WHERE id_resultado IS NOT NULL)
+              AND id NOT IN (SELECT id_resultado FROM status_modulos
+                             WHERE id_resultado IS NOT NULL)
+        """)
+    
+    def _vacuum_incremental(self) -> None:
+        """
+        Devolve ao sistema as páginas livres do banco.
+        """
+        with self._pool.conexao() as conn:
+            # executescript roda o pragma até o fim (execute liberaria uma página só)
+            conn.executescript("PRAGMA incremental_vacuum;")
+    
+    def _desanexar_arquivo(self, conn: sqlite3.Connection) -> None:
+        """
+        Desanexa o banco de arquivo sem mascarar um erro já em andamento.
+        
+        Args:
+            conn: Conexão com o arquivo anexado como `arquivo`
+        """
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute("DETACH DATABASE arquivo")
+        except sqlite3.Error as e:
+            self.logger.error(f"❌ Erro ao desanexar arquivo de histórico: {e}")
+    
+    def _diretorio_arquivo(self, diretorio_arquivo: Optional[str]) -> Path:
+        """
+        Retorna o diretório dos arquivos mensais de histórico.
+        
+        Args:
+            diretorio_arquivo: Diretório informado ou None para o padrão
+                (`arquivo_historico` ao lado do banco)
+            
+        Returns:
+            Caminho do diretório
+        """
+        return Path(diretorio_arquivo) if diretorio_arquivo else self.db_path.parent / "arquivo_historico"
+    
+    def arquivar_historico_antigo(self, dias_manter: int = 90, diretorio_arquivo: Optional[str] = None) -> int:
+        """
+        Move registros de histórico antigos para arquivos SQLite mensais.
+        
+        Cada mês vai para `historico_AAAAMM.db`, com o resultado compactado
+        gravado na própria linha, e pode ser consultado depois com
+        `consultar_historico_arquivado`. As linhas mantêm o id original, então
+        repetir um arquivamento interrompido não duplica registros.
+        
+        Args:
+            dias_manter: Número de dias de histórico para manter no banco principal
+            diretorio_arquivo: Diretório dos arquivos mensais
+            
+        Returns:
+            Número de registros arquivados
+        """
+        diretorio = self._diretorio_arquivo(diretorio_arquivo)
+        limite = f"-{int(dias_manter)} days"
+        total_arquivado = 0
+        
+        try:
+            diretorio.mkdir(parents=True, exist_ok=True)
+            
+            with self._pool.conexao() as conn:
+                meses = [linha[0] for linha in conn.execute("""
+                    SELECT DISTINCT strftime('%Y%m', timestamp_execucao)
+                    FROM historico_execucoes
+                    WHERE timestamp_execucao < datetime('now', ?)
+                """, (limite,)).fetchall()]
+            
+            for mes in meses:
+                inicio_mes = f"{mes[:4]}-{mes[4:]}-01"
+                
+                with self._pool.conexao() as conn:
+                    conn.execute("ATTACH DATABASE ? AS arquivo", (str(diretorio / f"historico_{mes}.db"),))
+                    try:
+                        cursor = conn.cursor()
+                        cursor.execute("""
+                            CREATE TABLE IF NOT EXISTS arquivo.historico_execucoes (
+                                id INTEGER PRIMARY KEY,
+                                nome_modulo TEXT NOT NULL,
+                                data_referencia TEXT NOT NULL,
+                                status TEXT NOT NULL,
+                                tempo_execucao REAL,
+                                registros_processados INTEGER,
+                                registros_validos INTEGER,
+                                registros_invalidos INTEGER,
+                                taxa_sucesso REAL,
+                                timestamp_execucao DATETIME,
+                                dados_compactados BLOB
+                            )
+                        """)
+                        cursor.execute("""
+                            CREATE INDEX IF NOT EXISTS arquivo.idx_arquivo_modulo_timestamp
+                            ON historico_execucoes (nome_modulo, timestamp_execucao)
+                        """)
+                        
+                        cursor.execute("BEGIN IMMEDIATE")
+                        filtro = """
+                            timestamp_execucao >= ? AND timestamp_execucao < date(?, '+1 month')
+                            AND timestamp_execucao < datetime('now', ?)
+                        """
+                        cursor.execute(f"""
+                            INSERT OR IGNORE INTO arquivo.historico_execucoes
+                            SELECT he.id, he.nome_modulo, he.data_referencia, he.status,
+                                   he.tempo_execucao, he.registros_processados,
+                                   he.registros_validos, he.registros_invalidos,
+                                   he.taxa_sucesso, he.timestamp_execucao, rc.dados
+                            FROM historico_execucoes he
+                            LEFT JOIN resultados_compactados rc ON rc.id = he.id_resultado
+                            WHERE {filtro}
+                        """, (inicio_mes, inicio_mes, limite))
+                        cursor.execute(f"DELETE FROM main.historico_execucoes WHERE {filtro}",
+                                       (inicio_mes, inicio_mes, limite))
+                        total_arquivado += cursor.rowcount
+                        self._remover_resultados_orfaos(cursor)
+                        conn.commit()
+                    finally:
+                        self._desanexar_arquivo(conn)
+                
+                self.logger.info(f"🗄️ Histórico de {mes} arquivado")
+            
+            self._vacuum_incremental()
+            self.logger.info(f"🗄️ Histórico arquivado: {total_arquivado} registros em {diretorio}")
+            return total_arquivado
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao arquivar histórico: {e}")
+            return total_arquivado
+    
+    def consultar_historico_arquivado(self, data_inicio: str, data_fim: str,
+                                      nome_modulo: Optional[str] = None,
+                                      diretorio_arquivo: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Consulta execuções arquivadas, anexando apenas os meses do período.
+        
+        Args:
+            data_inicio: Data de início no formato YYYY-MM-DD
+            data_fim: Data de fim no formato YYYY-MM-DD
+            nome_modulo: Filtra por módulo (None = todos)
+            diretorio_arquivo: Diretório dos arquivos mensais
+            
+        Returns:
+            Lista de execuções, em ordem cronológica, com o resultado em
+            `dados_resultado`
+        """
+        diretorio = self._diretorio_arquivo(diretorio_arquivo)
+        mes_inicio = data_inicio[:7].replace("-", "")
+        mes_fim = data_fim[:7].replace("-", "")
+        
+        arquivos = sorted(
+            arquivo for arquivo in diretorio.glob("historico_*.db")
+            if mes_inicio <= arquivo.stem[len("historico_"):] <= mes_fim
+        )
+        
+        filtro = "timestamp_execucao >= ? AND timestamp_execucao < date(?, '+1 day')"
+        params: List[Any] = [data_inicio, data_fim]
+        if nome_modulo:
+            filtro += " AND nome_modulo = ?"
+            params.append(nome_modulo)
+        
+        execucoes = []
+        try:
+            with self._pool.conexao() as conn:
+                for arquivo in arquivos:
+                    conn.execute("ATTACH DATABASE ? AS arquivo", (str(arquivo),))
+                    try:
+                        for row in conn.execute(f"""
+                            SELECT nome_modulo, data_referencia, status, tempo_execucao,
+                                   registros_processados, registros_validos,
+                                   registros_invalidos, taxa_sucesso,
+                                   timestamp_execucao, dados_compactados
+                            FROM arquivo.historico_execucoes
+                            WHERE {filtro}
+                            ORDER BY timestamp_execucao
+                        """, params):
+                            execucoes.append({
+                                "nome_modulo": row[0],
+                                "data_referencia": row[1],
+                                "status": row[2],
+                                "tempo_execucao": row[3],
+                                "registros_processados": row[4],
+                                "registros_validos": row[5],
+                                "registros_invalidos": row[6],
+                                "taxa_sucesso": row[7],
+                                "timestamp_execucao": row[8],
+                                "dados_resultado": descompactar_resultado(row[9])
+                            })
+                    finally:
+                        self._desanexar_arquivo(conn)
+            
+            return execucoes
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erro ao consultar histórico arquivado: {e}")
+            return []
 
 
 class MapaCentralAPI:
@@ -445,11 +1827,84 @@ class MapaCentralAPI:
     
     Esta classe fornece uma interface REST-like para que os módulos
     possam se comunicar com o sistema central.
+    
+    Os dados do dashboard ficam em um snapshot em memória, reconstruído só
+    quando a versão dos dados (`StatusReporter.obter_versao_dados`) muda;
+    o progresso de módulos em execução não muda a versão e aparece na
+    próxima mudança de status. Dentro de `max_staleness_segundos` desde a
+    última verificação, o snapshot é devolvido sem consultar o banco.
+    
+    A leitura do dashboard não grava nada: os alertas são avaliados pelo
+    `MotorAlertas` no caminho de escrita (`avaliar_alertas`, chamado por
+    quem grava o status) e periodicamente (`iniciar_avaliacao_periodica`),
+    para os prazos de inatividade; suas mudanças também alteram a versão.
+    O `MapaCentral` faz as duas coisas. Usada de forma avulsa, a API só
+    avalia sozinha em `registrar_modulo`: quem gravar status diretamente
+    no `StatusReporter` deve chamar `avaliar_alertas` ou iniciar a
+    avaliação periódica, senão o dashboard não mostra alertas novos.
     """
     
-    def __init__(self):
-        self.status_reporter = StatusReporter()
+    def __init__(self, status_reporter: Optional[StatusReporter] = None,
+                 max_staleness_segundos: float = 2.0, limite_inatividade_segundos: int = 3600):
+        """
+        Inicializa a API.
+        
+        Args:
+            status_reporter: Reporter de status (padrão: um novo, no banco padrão)
+            max_staleness_segundos: Idade máxima do snapshot sem verificar a
+                versão dos dados (0 verifica a cada chamada)
+            limite_inatividade_segundos: Tempo sem atualização que gera alerta
+                de inatividade em módulos críticos
+        """
+        self.status_reporter = status_reporter or StatusReporter()
+        self.motor_alertas = MotorAlertas(self.status_reporter, limite_inatividade_segundos)
+        self.max_staleness_segundos = max_staleness_segundos
         self.logger = logging.getLogger("mapa_central_api")
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._versao_snapshot: Optional[int] = None
+        self._verificado_em = 0.0
+        self._lock_snapshot = threading.Lock()
+        self._parar_avaliacao = threading.Event()
+        self._thread_avaliacao: Optional[threading.Thread] = None
+    
+    def avaliar_alertas(self) -> int:
+        """
+        Avalia os alertas após gravações de status (fora do caminho de leitura).
+        
+        Returns:
+            Número de alertas criados, atualizados ou resolvidos
+        """
+        return self.motor_alertas.avaliar()
+    
+    def iniciar_avaliacao_periodica(self, intervalo_segundos: float = 60.0) -> None:
+        """
+        Avalia os alertas em segundo plano, para que prazos de inatividade
+        vençam mesmo sem novas gravações.
+        
+        Args:
+            intervalo_segundos: Intervalo entre avaliações
+        """
+        if self._thread_avaliacao is not None or intervalo_segundos <= 0:
+            return
+        
+        def laco() -> None:
+            while not self._parar_avaliacao.wait(intervalo_segundos):
+                self.avaliar_alertas()
+        
+        self._parar_avaliacao.clear()
+        self._thread_avaliacao = threading.Thread(target=laco, name="avaliacao_alertas", daemon=True)
+        self._thread_avaliacao.start()
+    
+    def parar_avaliacao_periodica(self) -> None:
+        """
+        Interrompe a avaliação periódica de alertas, se iniciada.
+        """
+        if self._thread_avaliacao is None:
+            return
+        
+        self._parar_avaliacao.set()
+        self._thread_avaliacao.join()
+        self._thread_avaliacao = None
     
     def registrar_modulo(self, nome: str, categoria: str, criticidade: str) -> bool:
         """
@@ -470,6 +1925,7 @@ class MapaCentralAPI:
             if not status_atual:
                 # Registrar novo módulo
                 self.status_reporter.reportar_inicio(nome, categoria, criticidade)
+                self.avaliar_alertas()
                 self.logger.info(f"📝 Módulo registrado: {nome}")
                 return True
             else:
@@ -480,9 +1936,40 @@ class MapaCentralAPI:
             self.logger.error(f"❌ Erro ao registrar módulo: {e}")
             return False
     
-    def obter_dashboard_data(self) -> Dict[str, Any]:
+    def obter_dashboard_data(self, forcar_atualizacao: bool = False) -> Dict[str, Any]:
+        """
+        Obtém dados consolidados para o dashboard, a partir do snapshot.
+        
+        O dicionário retornado é compartilhado entre chamadas e não deve
+        ser alterado.
+        
+        Args:
+            forcar_atualizacao: Se True, reconstrói o snapshot mesmo sem mudanças
+            
+        Returns:
+            Dados formatados para o dashboard
+        """
+        with self._lock_snapshot:
+            agora = time.monotonic()
+            if (not forcar_atualizacao and self._snapshot is not None
+                    and agora - self._verificado_em < self.max_staleness_segundos):
+                return self._snapshot
+            
+            versao = self.status_reporter.obter_versao_dados()
+            
+            if forcar_atualizacao or self._snapshot is None or versao != self._versao_snapshot:
+                dados = self._montar_dashboard_data()
+                if dados:
+                    self._snapshot = dados
+                    self._versao_snapshot = versao
+                    self.logger.debug(f"🗂️ Snapshot do dashboard reconstruído (versão {versao})")
+            
+            self._verificado_em = agora
+            return self._snapshot or {}
+    
+    def _montar_dashboard_data(self) -> Dict[str, Any]:
         """
-        Obtém dados consolidados para o dashboard.
+        Lê o banco e monta os dados do dashboard.
         
         Returns:
             Dados formatados para o dashboard
@@ -507,6 +1994,7 @@ class MapaCentralAPI:
             modulos_sucesso = len([m for m in modulos if m["status"] == "sucesso"])
             modulos_erro = len([m for m in modulos if m["status"] == "erro"])
             modulos_executando = len([m for m in modulos if m["status"] == "executando"])
+            modulos_ignorados = len([m for m in modulos if m["status"] == "ignorado"])
             
             return {
                 "timestamp_atualizacao": datetime.now().isoformat(),
@@ -515,51 +2003,14 @@ class MapaCentralAPI:
                     "modulos_sucesso": modulos_sucesso,
                     "modulos_erro": modulos_erro,
                     "modulos_executando": modulos_executando,
+                    "modulos_ignorados": modulos_ignorados,
                     "taxa_sucesso": (modulos_sucesso / total_modulos * 100) if total_modulos > 0 else 0
                 },
                 "modulos_por_categoria": categorias,
                 "metricas_historicas": metricas,
-                "alertas": self._gerar_alertas(modulos)
+                "alertas": self.motor_alertas.alertas_abertos()
             }
             
         except Exception as e:
             self.logger.error(f"❌ Erro ao obter dados do dashboard: {e}")
             return {}
-    
-    def _gerar_alertas(self, modulos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Gera alertas baseados no status dos módulos.
-        
-        Args:
-            modulos: Lista de módulos
-            
-        Returns:
-            Lista de alertas
-        """
-        alertas = []
-        
-        for modulo in modulos:
-            # Alertas para módulos com erro
-            if modulo["status"] == "erro":
-                alertas.append({
-                    "tipo": "erro",
-                    "criticidade": modulo["criticidade"],
-                    "modulo": modulo["nome_modulo"],
-                    "mensagem": f"Módulo {modulo['nome_modulo']} falhou: {modulo.get('erro', 'Erro desconhecido')}",
-                    "timestamp": modulo["timestamp_atualizacao"]
-                })
-            
-            # Alertas para módulos críticos parados há muito tempo
-            if modulo["criticidade"] == "critica" and modulo["status"] != "executando":
-                ultima_atualizacao = datetime.fromisoformat(modulo["timestamp_atualizacao"])
-                if (datetime.now() - ultima_atualizacao).total_seconds() > 3600:  # 1 hora
-                    alertas.append({
-                        "tipo": "atencao",
-                        "criticidade": "critica",
-                        "modulo": modulo["nome_modulo"],
-                        "mensagem": f"Módulo crítico {modulo['nome_modulo']} não executado há mais de 1 hora",
-                        "timestamp": datetime.now().isoformat()
-                    })
-        
-        return alertas
-
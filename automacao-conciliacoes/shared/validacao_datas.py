@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Validação vetorizada de colunas de datas.
+
+Este módulo implementa `validacoes.validar_datas`. Colunas de datas têm
+cardinalidade muito baixa, então cada texto distinto é interpretado uma
+única vez (com memória entre blocos) e o resultado é espalhado para a
+coluna inteira com operações NumPy.
+"""
+
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Sequence
+import logging
+
+import numpy as np
+
+
+# Formatos aceitos quando a configuração não define outros
+FORMATOS_PADRAO = ["%Y-%m-%d", "%d/%m/%Y", "%Y%m%d", "%d-%m-%Y"]
+
+# Origem das datas seriais do Excel
+_EPOCA_EXCEL = np.datetime64("1899-12-30", "D")
+
+_NAT = np.datetime64("NaT", "D")
+
+
+def _de_seriais(numeros: np.ndarray) -> np.ndarray:
+    """
+    Converte números seriais do Excel em datas.
+
+    Args:
+        numeros: Array numérico (NaN = ausente)
+
+    Returns:
+        Array datetime64[D], com NaT nos valores não finitos
+    """
+    finitos = np.isfinite(numeros)
+    with np.errstate(invalid='ignore'):
+        dias = np.where(finitos, numeros, 0).astype(np.int64)
+    return np.where(finitos, _EPOCA_EXCEL + dias, _NAT)
+
+
+class ValidadorDatas:
+    """
+    Validador de colunas de datas com cache de textos já interpretados.
+
+    Attributes:
+        formatos (list): Formatos `strptime` aceitos, em ordem de tentativa
+        data_minima (np.datetime64): Menor data aceita (ou NaT)
+        data_maxima (np.datetime64): Maior data aceita (ou NaT)
+        somente_dias_uteis (bool): Se True, rejeita fins de semana e feriados
+        feriados (np.ndarray): Feriados considerados no calendário
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, formatos: Optional[List[str]] = None,
+                 data_minima: Optional[str] = None, data_maxima: Optional[str] = None,
+                 somente_dias_uteis: bool = True, feriados: Optional[List[str]] = None):
+        """
+        Inicializa o validador.
+
+        Args:
+            formatos: Formatos `strptime` aceitos (padrão: FORMATOS_PADRAO)
+            data_minima: Menor data aceita, YYYY-MM-DD
+            data_maxima: Maior data aceita, YYYY-MM-DD
+            somente_dias_uteis: Se True, rejeita fins de semana e feriados
+            feriados: Feriados no formato YYYY-MM-DD
+        """
+        self.formatos = formatos or FORMATOS_PADRAO
+        self.definir_intervalo(data_minima, data_maxima)
+        self.somente_dias_uteis = somente_dias_uteis
+        self.feriados = np.array(feriados or [], dtype="datetime64[D]")
+        self.logger = logging.getLogger("validacao_datas")
+        self._memo: Dict[str, np.datetime64] = {}
+
+    def definir_intervalo(self, data_minima: Optional[str] = None, data_maxima: Optional[str] = None) -> None:
+        """
+        Define o intervalo de datas aceitas, mantendo o cache de interpretação.
+
+        Args:
+            data_minima: Menor data aceita, YYYY-MM-DD (None = sem limite)
+            data_maxima: Maior data aceita, YYYY-MM-DD (None = sem limite)
+        """
+        self.data_minima = np.datetime64(data_minima, "D") if data_minima else _NAT
+        self.data_maxima = np.datetime64(data_maxima, "D") if data_maxima else _NAT
+
+    def _interpretar_texto(self, texto: str) -> np.datetime64:
+        """
+        Interpreta um texto de data, consultando o cache antes.
+
+        Args:
+            texto: Texto da data
+
+        Returns:
+            Data interpretada ou NaT se nenhum formato servir
+        """
+        if texto in self._memo:
+            return self._memo[texto]
+
+        resultado = _NAT
+        limpo = texto.strip()
+
+        for formato in self.formatos:
+            try:
+                resultado = np.datetime64(datetime.strptime(limpo, formato).date(), "D")
+                break
+            except ValueError:
+                continue
+        else:
+            # Datas com hora, como gravadas por openpyxl ("2025-06-07 00:00:00")
+            try:
+                resultado = np.datetime64(datetime.fromisoformat(limpo).date(), "D")
+            except ValueError:
+                pass
+
+        self._memo[texto] = resultado
+        return resultado
+
+    def _interpretar_textos(self, textos: np.ndarray) -> np.ndarray:
+        """
+        Interpreta textos de datas, uma vez por texto distinto.
+
+        Args:
+            textos: Array de textos
+
+        Returns:
+            Array datetime64[D], com NaT nos textos não interpretáveis
+        """
+        unicos, inverso = np.unique(textos.astype(str), return_inverse=True)
+        datas_unicas = np.array([self._interpretar_texto(texto) for texto in unicos.tolist()],
+                                dtype="datetime64[D]")
+        return datas_unicas[inverso.reshape(-1)]
+
+    def interpretar(self, valores: Sequence[Any]) -> np.ndarray:
+        """
+        Converte uma coluna de datas (textos, datas, números seriais) em datetime64[D].
+
+        Colunas mistas (ex.: números e None, ou textos e datas) são separadas
+        por tipo: números seguem como seriais do Excel, textos passam pelos
+        formatos configurados e datas são convertidas diretamente.
+
+        Args:
+            valores: Valores da coluna
+
+        Returns:
+            Array datetime64[D], com NaT nos valores ausentes ou não interpretáveis
+        """
+        array = np.asarray(valores)
+        if array.dtype.kind in 'US' and not isinstance(valores, np.ndarray):
+            # Listas mistas ([45000, "07/06/2025"]) viram texto no NumPy
+            array = np.asarray(valores, dtype=object)
+
+        if array.dtype.kind == 'M':
+            return array.astype("datetime64[D]")
+
+        if array.dtype.kind in 'iuf':
+            return _de_seriais(array)
+
+        if array.dtype.kind != 'O':
+            return self._interpretar_textos(array)
+
+        itens = array.reshape(-1).tolist()
+        if all(valor is None or isinstance(valor, (date, np.datetime64)) for valor in itens):
+            # Somente datas: conversão direta pelo NumPy
+            return np.asarray(
+                [valor.date() if isinstance(valor, datetime) else valor for valor in itens],
+                dtype="datetime64[D]"
+            )
+
+        resultado = np.full(len(itens), _NAT, dtype="datetime64[D]")
+        datas, numeros, textos = [], [], []
+        for posicao, valor in enumerate(itens):
+            if valor is None:
+                continue
+            if isinstance(valor, datetime):
+                datas.append((posicao, valor.date()))
+            elif isinstance(valor, (date, np.datetime64)):
+                datas.append((posicao, valor))
+            elif isinstance(valor, (int, float, np.number)) and not isinstance(valor, bool):
+                numeros.append((posicao, valor))
+            else:
+                textos.append((posicao, str(valor)))
+
+        for grupo, converter in ((datas, lambda v: np.asarray(v, dtype="datetime64[D]")),
+                                 (numeros, lambda v: _de_seriais(np.asarray(v, dtype=np.float64))),
+                                 (textos, lambda v: self._interpretar_textos(np.asarray(v, dtype=str)))):
+            if grupo:
+                posicoes, itens_grupo = zip(*grupo)
+                resultado[list(posicoes)] = converter(list(itens_grupo))
+
+        return resultado
+
+    def validar(self, valores: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Valida uma coluna de datas inteira de uma vez.
+
+        Args:
+            valores: Valores da coluna
+
+        Returns:
+            Dicionário com as datas interpretadas (`datas`), a máscara de
+            registros válidos (`valida`), as máscaras de cada problema
+            (`invalida`, `fora_intervalo`, `nao_util`) e as contagens
+        """
+        datas = self.interpretar(valores)
+        invalida = np.isnat(datas)
+
+        fora_intervalo = np.zeros(len(datas), dtype=bool)
+        if not np.isnat(self.data_minima):
+            fora_intervalo |= ~invalida & (datas < self.data_minima)
+        if not np.isnat(self.data_maxima):
+            fora_intervalo |= ~invalida & (datas > self.data_maxima)
+
+        nao_util = np.zeros(len(datas), dtype=bool)
+        if self.somente_dias_uteis and (~invalida).any():
+            nao_util[~invalida] = ~np.is_busday(datas[~invalida], holidays=self.feriados)
+
+        valida = ~(invalida | fora_intervalo | nao_util)
+
+        contagens = {
+            "total_registros": int(len(datas)),
+            "datas_validas": int(valida.sum()),
+            "datas_invalidas": int(invalida.sum()),
+            "datas_fora_intervalo": int(fora_intervalo.sum()),
+            "datas_nao_uteis": int(nao_util.sum())
+        }
+
+        if contagens["datas_validas"] < contagens["total_registros"]:
+            self.logger.warning(
+                f"⚠️ Datas rejeitadas: {contagens['datas_invalidas']} inválidas, "
+                f"{contagens['datas_fora_intervalo']} fora do intervalo, "
+                f"{contagens['datas_nao_uteis']} em dias não úteis"
+            )
+
+        return {
+            "datas": datas,
+            "valida": valida,
+            "invalida": invalida,
+            "fora_intervalo": fora_intervalo,
+            "nao_util": nao_util,
+            "contagens": contagens
+        }
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Validação incremental D vs. D-1.
+
+Este módulo compara as entradas do dia com o estado conciliado da data de
+referência anterior (gravado em `dados/historico`) e revalida apenas os
+registros incluídos ou alterados, reaproveitando o veredito dos demais.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+
+from shared.motor_comparacao import hash_linhas
+
+
+class ValidacaoIncremental:
+    """
+    Controla o estado diário de validação de um módulo.
+
+    O estado de cada data de referência é gravado em
+    `{nome_modulo}_estado_{AAAAMMDD}.npz` com o hash da chave, o hash da
+    linha e o veredito (válido/inválido) de cada registro.
+
+    Attributes:
+        nome_modulo (str): Nome do módulo de conciliação
+        diretorio (Path): Diretório do histórico
+        logger (logging.Logger): Logger para operações
+    """
+
+    def __init__(self, nome_modulo: str, diretorio: Union[str, Path] = "dados/historico"):
+        """
+        Inicializa a validação incremental.
+
+        Args:
+            nome_modulo: Nome do módulo de conciliação
+            diretorio: Diretório onde os estados diários são gravados
+        """
+        self.nome_modulo = nome_modulo
+        self.diretorio = Path(diretorio)
+        self.logger = logging.getLogger(f"conciliacao.{nome_modulo}.incremental")
+
+    def _arquivo_estado(self, data_referencia: str) -> Path:
+        """
+        Retorna o caminho do estado de uma data de referência.
+
+        Args:
+            data_referencia: Data no formato YYYY-MM-DD
+
+        Returns:
+            Caminho do arquivo de estado
+        """
+        data = datetime.strptime(data_referencia, "%Y-%m-%d").strftime("%Y%m%d")
+        return self.diretorio / f"{self.nome_modulo}_estado_{data}.npz"
+
+    def carregar_estado_anterior(self, data_referencia: str) -> Optional[Tuple[str, Dict[str, np.ndarray]]]:
+        """
+        Carrega o estado da data de referência anterior mais recente.
+
+        Args:
+            data_referencia: Data no formato YYYY-MM-DD
+
+        Returns:
+            Tupla (data do estado, arrays do estado) ou None se não houver
+        """
+        atual = datetime.strptime(data_referencia, "%Y-%m-%d").strftime("%Y%m%d")
+        prefixo = f"{self.nome_modulo}_estado_"
+
+        datas = sorted(
+            arquivo.stem[len(prefixo):]
+            for arquivo in self.diretorio.glob(f"{prefixo}*.npz")
+            if arquivo.stem[len(prefixo):].isdigit() and arquivo.stem[len(prefixo):] < atual
+        )
+        if not datas:
+            return None
+
+        arquivo = self.diretorio / f"{prefixo}{datas[-1]}.npz"
+        try:
+            with np.load(arquivo) as estado:
+                return datas[-1], {nome: estado[nome] for nome in estado.files}
+        except Exception as e:
+            self.logger.warning(f"⚠️ Estado anterior ilegível ({arquivo}): {e}")
+            return None
+
+    def salvar_estado(self, data_referencia: str, chaves: np.ndarray,
+                      linhas: np.ndarray, veredito: np.ndarray, assinatura: str = "") -> None:
+        """
+        Grava o estado da data de referência, ordenado pelo hash da chave.
+
+        Args:
+            data_referencia: Data no formato YYYY-MM-DD
+            chaves: Hash da chave de cada registro
+            linhas: Hash do conteúdo de cada registro
+            veredito: True para registros válidos
+            assinatura: Identificação das regras de validação usadas
+        """
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        ordem = np.argsort(chaves, kind='stable')
+
+        np.savez(
+            self._arquivo_estado(data_referencia),
+            chaves=chaves[ordem],
+            linhas=linhas[ordem],
+            veredito=veredito[ordem],
+            assinatura=np.asarray(assinatura)
+        )
+
+    def executar(self, colunas: Dict[str, Sequence], chaves: List[str],
+                 validar: Callable[[Dict[str, np.ndarray]], np.ndarray],
+                 data_referencia: str, assinatura: str = "") -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Valida apenas os registros novos ou alterados desde o estado anterior.
+
+        Se as regras de validação mudaram (assinatura diferente da gravada no
+        estado anterior), todos os registros são revalidados.
+
+        Args:
+            colunas: Colunas dos dados do dia (nome -> valores)
+            chaves: Colunas que identificam o registro entre os dias
+            validar: Função que recebe um subconjunto das colunas e devolve
+                uma máscara booleana (True = válido) do mesmo tamanho
+            data_referencia: Data de referência no formato YYYY-MM-DD
+            assinatura: Identificação das regras de validação em uso
+
+        Returns:
+            Tupla (veredito por registro, estatísticas da execução)
+        """
+        hash_chaves = hash_linhas(colunas, chaves)
+        hash_linhas_atuais = hash_linhas(colunas, list(colunas))
+        total = len(hash_chaves)
+
+        anterior = self.carregar_estado_anterior(data_referencia)
+        veredito = np.zeros(total, dtype=bool)
+        inalterado = np.zeros(total, dtype=bool)
+        novos = total
+        removidos = 0
+
+        if anterior is not None and str(anterior[1].get("assinatura", "")) != assinatura:
+            self.logger.info("♻️ Regras de validação alteradas: revalidando todos os registros")
+            anterior = None
+
+        if anterior is not None and len(anterior[1]["chaves"]):
+            estado = anterior[1]
+            posicoes = np.minimum(np.searchsorted(estado["chaves"], hash_chaves), len(estado["chaves"]) - 1)
+            encontrado = estado["chaves"][posicoes] == hash_chaves
+
+            inalterado = encontrado & (estado["linhas"][posicoes] == hash_linhas_atuais)
+            veredito[inalterado] = estado["veredito"][posicoes[inalterado]]
+
+            novos = int((~encontrado).sum())
+            removidos = len(estado["chaves"]) - len(np.unique(posicoes[encontrado]))
+
+        revalidar = np.flatnonzero(~inalterado)
+        if len(revalidar):
+            subconjunto = {nome: np.asarray(valores)[revalidar] for nome, valores in colunas.items()}
+            veredito[revalidar] = np.asarray(validar(subconjunto), dtype=bool)
+
+        self.salvar_estado(data_referencia, hash_chaves, hash_linhas_atuais, veredito, assinatura)
+
+        estatisticas = {
+            "estado_anterior": anterior[0] if anterior else None,
+            "registros_reaproveitados": int(inalterado.sum()),
+            "registros_revalidados": int(len(revalidar)),
+            "registros_novos": novos,
+            "registros_alterados": int(len(revalidar) - novos),
+            "registros_removidos": int(removidos)
+        }
+
+        self.logger.info(
+            f"♻️ Validação incremental: {estatisticas['registros_reaproveitados']} reaproveitados, "
+            f"{estatisticas['registros_revalidados']} revalidados"
+        )
+
+        return veredito, estatisticas
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Os módulos importam `shared.*` a partir da raiz do projeto
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
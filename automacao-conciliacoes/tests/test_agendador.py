@@ -0,0 +1,85 @@
+"""Testes do agendamento de módulos por dependências."""
+
+import asyncio
+
+import pytest
+
+from shared.agendador import AgendadorModulos
+
+
+def _executar(agendador, falhas=(), max_paralelas=3):
+    ordem = []
+    ignorados = []
+
+    async def executar_modulo(modulo):
+        ordem.append(modulo["nome"])
+        await asyncio.sleep(0)
+        return {"status": "erro" if modulo["nome"] in falhas else "sucesso", "modulo": modulo["nome"]}
+
+    resultados = asyncio.run(agendador.executar(
+        executar_modulo, max_paralelas, ao_ignorar=lambda modulo, motivo: ignorados.append(modulo["nome"])
+    ))
+    return resultados, ordem, ignorados
+
+
+def test_dependencias_executam_antes_dos_dependentes():
+    modulos = [
+        {"nome": "c", "depende_de": ["a", "b"]},
+        {"nome": "b", "depende_de": ["a"]},
+        {"nome": "a"},
+        {"nome": "d"}
+    ]
+
+    resultados, ordem, _ = _executar(AgendadorModulos(modulos))
+
+    assert ordem.index("a") < ordem.index("b") < ordem.index("c")
+    # Resultados seguem a ordem dos módulos recebidos
+    assert [r["modulo"] for r in resultados] == ["c", "b", "a", "d"]
+
+
+def test_ciclo_de_dependencias_e_rejeitado():
+    modulos = [
+        {"nome": "a", "depende_de": ["c"]},
+        {"nome": "b", "depende_de": ["a"]},
+        {"nome": "c", "depende_de": ["b"]},
+        {"nome": "d"}
+    ]
+
+    with pytest.raises(ValueError, match="a, b, c"):
+        AgendadorModulos(modulos)
+
+
+def test_dependencia_fora_da_execucao_e_desconsiderada():
+    agendador = AgendadorModulos([{"nome": "b", "depende_de": ["a"]}])
+
+    assert agendador.dependencias == {"b": []}
+
+
+def test_falha_ignora_todos_os_modulos_a_jusante():
+    modulos = [
+        {"nome": "a"},
+        {"nome": "b", "depende_de": ["a"]},
+        {"nome": "c", "depende_de": ["b"]},
+        {"nome": "d"}
+    ]
+
+    resultados, ordem, ignorados = _executar(AgendadorModulos(modulos), falhas={"a"})
+
+    assert sorted(ordem) == ["a", "d"]
+    assert sorted(ignorados) == ["b", "c"]
+    assert [r["status"] for r in resultados] == ["erro", "ignorado", "ignorado", "sucesso"]
+    assert resultados[1]["motivo"] == "dependência a não concluída com sucesso"
+
+
+def test_caminho_critico_segue_as_maiores_duracoes():
+    modulos = [
+        {"nome": "a"},
+        {"nome": "b", "depende_de": ["a"]},
+        {"nome": "c", "depende_de": ["a"]},
+        {"nome": "d"}
+    ]
+
+    agendador = AgendadorModulos(modulos, {"a": 10, "b": 5, "c": 30, "d": 20})
+
+    assert agendador.caminho_critico() == ["a", "c"]
+    assert agendador.prioridades["a"] == 40
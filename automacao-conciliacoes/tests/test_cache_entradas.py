@@ -0,0 +1,91 @@
+"""Testes do cache colunar de entradas."""
+
+from datetime import date
+import os
+import threading
+
+import numpy as np
+
+from shared.cache_entradas import CacheEntradas, concatenar_arrays, para_array
+
+
+def _criar_entrada(tmp_path, nome="entrada.bin", conteudo=b"dados"):
+    caminho = tmp_path / nome
+    caminho.write_bytes(conteudo)
+    return caminho
+
+
+def test_armazenar_e_obter_com_chave_calculada_uma_vez(tmp_path, monkeypatch):
+    cache = CacheEntradas(tmp_path / "cache")
+    caminho = _criar_entrada(tmp_path)
+
+    chamadas = []
+    original = cache.impressao_digital
+    monkeypatch.setattr(cache, "impressao_digital", lambda *a, **k: chamadas.append(a) or original(*a, **k))
+
+    chave = cache.impressao_digital(caminho, "v")
+    assert cache.obter(caminho, "v", chave=chave) is None
+    cache.armazenar(caminho, {"valor": [1.0, None, 3.0]}, "v", chave=chave)
+
+    assert len(chamadas) == 1
+    dados = cache.obter(caminho, "v", chave=chave)
+    np.testing.assert_array_equal(dados["valor"], [1.0, np.nan, 3.0])
+
+
+def test_atualizacoes_concorrentes_nao_se_perdem(tmp_path):
+    diretorio = tmp_path / "cache"
+    caminhos = [_criar_entrada(tmp_path, f"e{i}.bin", bytes([i]) * 10) for i in range(8)]
+
+    def gravar(caminho):
+        CacheEntradas(diretorio).armazenar(caminho, {"valor": [1, 2, 3]})
+
+    threads = [threading.Thread(target=gravar, args=(caminho,)) for caminho in caminhos]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(CacheEntradas(diretorio)._carregar_indice()) == len(caminhos)
+
+
+def test_entradas_fora_do_indice_sao_expulsas(tmp_path):
+    diretorio = tmp_path / "cache"
+    cache = CacheEntradas(diretorio)
+
+    # Entrada publicada por um processo que morreu antes de atualizar o índice
+    orfa = diretorio / ("0" * 32)
+    orfa.mkdir()
+    (orfa / "c0.npy").write_bytes(b"x" * 4096)
+    os.utime(orfa, (0, 0))
+
+    cache.limite_bytes = 1024
+    cache.armazenar(_criar_entrada(tmp_path), {"valor": [1, 2, 3]})
+
+    assert not orfa.exists()
+    assert ("0" * 32) not in cache._carregar_indice()
+
+
+def test_concatenar_blocos_equivale_a_coluna_inteira():
+    blocos = [
+        [1, 2, 3],
+        [4, None, 6],
+        [True, False],
+    ]
+    esperado = para_array([valor for bloco in blocos for valor in bloco])
+    resultado = concatenar_arrays([para_array(bloco) for bloco in blocos])
+    assert resultado.dtype == esperado.dtype == np.float64
+    np.testing.assert_array_equal(resultado, esperado)
+
+    # Tipos misturados entre blocos: bloco só de ausentes e bloco de texto
+    blocos = [[None, None], [1.5, 2.0], ["x", None]]
+    esperado = para_array([valor for bloco in blocos for valor in bloco])
+    resultado = concatenar_arrays([para_array(bloco) for bloco in blocos])
+    assert resultado.dtype.kind == esperado.dtype.kind == 'U'
+    assert resultado.tolist() == esperado.tolist() == ["", "", "1.5", "2.0", "x", ""]
+
+    datas = [[date(2024, 1, 1)], [None, date(2024, 1, 3)]]
+    resultado = concatenar_arrays([para_array(bloco) for bloco in datas])
+    assert resultado.dtype == np.dtype("datetime64[D]")
+    assert resultado.tolist() == [date(2024, 1, 1), None, date(2024, 1, 3)]
+
+    assert concatenar_arrays([]).size == 0
@@ -0,0 +1,47 @@
+"""Testes do carregador xlsx em blocos."""
+
+import pytest
+from openpyxl import Workbook
+
+from shared.carregador_xlsx import CarregadorXlsx
+
+
+def _planilha(caminho, linhas, aba="Dados"):
+    workbook = Workbook()
+    planilha = workbook.active
+    planilha.title = aba
+    for linha in linhas:
+        planilha.append(linha)
+    workbook.save(caminho)
+    return caminho
+
+
+def test_blocos_de_tamanho_fixo_ignorando_linhas_vazias(tmp_path):
+    caminho = _planilha(tmp_path / "a.xlsx", [["id", "valor"], [1, 10.0], [2, 20.0], [None, None], [3, 30.0]])
+
+    blocos = list(CarregadorXlsx(tamanho_bloco=2).ler_blocos(caminho))
+
+    assert blocos == [{"id": [1, 2], "valor": [10.0, 20.0]}, {"id": [3], "valor": [30.0]}]
+
+
+def test_selecao_de_colunas_e_aba(tmp_path):
+    caminho = _planilha(tmp_path / "a.xlsx", [["id", "valor", "obs"], [1, 10.0, "x"]], aba="Posicao")
+
+    blocos = list(CarregadorXlsx().ler_blocos(caminho, aba="Posicao", colunas=["valor", "id"]))
+
+    assert blocos == [{"valor": [10.0], "id": [1]}]
+
+
+def test_coluna_ausente(tmp_path):
+    caminho = _planilha(tmp_path / "a.xlsx", [["id"], [1]])
+
+    with pytest.raises(KeyError):
+        list(CarregadorXlsx().ler_blocos(caminho, colunas=["valor"]))
+
+
+def test_cabecalhos_repetidos_sao_renomeados(tmp_path):
+    caminho = _planilha(tmp_path / "a.xlsx", [["valor", "valor", "valor_2", None], [1, 2, 3, 4]])
+
+    blocos = list(CarregadorXlsx().ler_blocos(caminho))
+
+    assert blocos == [{"valor": [1], "valor_3": [2], "valor_2": [3], "coluna_3": [4]}]
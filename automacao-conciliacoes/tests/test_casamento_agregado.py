@@ -0,0 +1,72 @@
+"""Testes do casamento agregado (1:N, N:1 e N:M)."""
+
+import pytest
+
+from shared import casamento_agregado
+from shared.base_conciliacao import ConciliacaoTemplate, VARIAVEL_TIMEOUT_EXECUCAO
+from shared.casamento_agregado import CasadorAgregado
+
+
+def _registros(valores, conta="A"):
+    return [{"conta": conta, "valor": valor} for valor in valores]
+
+
+def test_um_para_muitos():
+    casador = CasadorAgregado(["conta"], "valor")
+    resultado = casador.casar(_registros([100.0]), _registros([30.0, 50.0, 20.0, 7.0]))
+
+    assert len(resultado["casamentos"]) == 1
+    casamento = resultado["casamentos"][0]
+    assert casamento["tipo"] == "1:N"
+    assert sorted(casamento["direita"]) == [0, 1, 2]
+    assert resultado["nao_casados_direita"] == [3]
+
+
+def test_muitos_para_um_dentro_da_tolerancia():
+    casador = CasadorAgregado(["conta"], "valor", tolerancia_absoluta=0.05)
+    resultado = casador.casar(_registros([40.0, 60.02]), _registros([100.0]))
+
+    assert [c["tipo"] for c in resultado["casamentos"]] == ["N:1"]
+    assert resultado["nao_casados_esquerda"] == []
+
+
+def test_grupo_acima_do_limite_e_interrompido():
+    casador = CasadorAgregado(["conta"], "valor", max_itens_grupo=3)
+    resultado = casador.casar(_registros([10.0, 20.0]), _registros([10.0, 20.0]))
+
+    assert resultado["casamentos"] == []
+    assert resultado["grupos_interrompidos"] == [{"conta": "A"}]
+    assert sorted(resultado["nao_casados_esquerda"]) == [0, 1]
+
+
+def test_resultado_validacao_conta_pelo_lado_esquerdo():
+    casador = CasadorAgregado(["conta"], "valor")
+    esquerda = _registros([100.0]) + _registros([5.0], conta="B")
+    resultado = casador.casar(esquerda, _registros([60.0, 40.0]))
+
+    validacao = casador.para_resultado_validacao(resultado, len(esquerda), casamento_agregado.datetime.now())
+
+    assert validacao["total_registros"] == 2
+    assert validacao["registros_validos"] == 1
+
+
+@pytest.mark.parametrize("ambiente, esperado", [(None, 300 * 0.5), ("40", 40 * 0.5), ("x", 300 * 0.5)])
+def test_orcamento_usa_timeout_do_orquestrador(tmp_path, monkeypatch, ambiente, esperado):
+    monkeypatch.chdir(tmp_path)
+    if ambiente is None:
+        monkeypatch.delenv(VARIAVEL_TIMEOUT_EXECUCAO, raising=False)
+    else:
+        monkeypatch.setenv(VARIAVEL_TIMEOUT_EXECUCAO, ambiente)
+
+    recebido = {}
+    original = CasadorAgregado.casar
+
+    def casar(self, esquerda, direita, tempo_limite=None):
+        recebido["tempo_limite"] = tempo_limite
+        return original(self, esquerda, direita, tempo_limite)
+
+    monkeypatch.setattr(CasadorAgregado, "casar", casar)
+    modulo = ConciliacaoTemplate("teste_agregado", "teste", "baixa")
+    modulo._casar_agregado(_registros([10.0]), _registros([10.0]), ["conta"], "valor")
+
+    assert recebido["tempo_limite"] == pytest.approx(esperado)
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from shared.casamento_registros import CasadorRegistros
+from shared.motor_comparacao import dentro_tolerancia, montar_resultado_validacao
+
+
+def test_dentro_tolerancia_aceita_escalares_e_ausentes():
+    assert dentro_tolerancia(100.0, 100.005, tolerancia_percentual=0.01)
+    assert not dentro_tolerancia(100.0, 100.5, tolerancia_percentual=0.01)
+    assert dentro_tolerancia(None, None)
+    assert not dentro_tolerancia(None, 1.0)
+
+
+def test_casar_separa_casados_divergentes_e_exclusivos():
+    esquerda = [
+        {"isin": "A", "valor": 100.0},
+        {"isin": "B", "valor": 200.0},
+        {"isin": "C", "valor": 300.0},
+    ]
+    direita = [
+        {"isin": "A", "valor": 100.001},
+        {"isin": "B", "valor": 250.0},
+        {"isin": "D", "valor": 1.0},
+    ]
+    casador = CasadorRegistros(["isin"], ["valor"], tolerancia_absoluta=0.01)
+
+    grupos = casador.casar(esquerda, direita)
+
+    assert [par[0]["isin"] for par in grupos["casados"]] == ["A"]
+    assert grupos["divergentes"][0]["divergencias"] == {"valor": {"esquerda": 200.0, "direita": 250.0}}
+    assert [r["isin"] for r in grupos["somente_esquerda"]] == ["C"]
+    assert [r["isin"] for r in grupos["somente_direita"]] == ["D"]
+
+
+def test_resultado_validacao_usa_formato_padrao():
+    casador = CasadorRegistros(["isin"], ["valor"])
+    grupos = casador.casar([{"isin": "A", "valor": 1}], [{"isin": "A", "valor": 1}, {"isin": "B", "valor": 2}])
+
+    resultado = casador.para_resultado_validacao(grupos, datetime.now())
+    padrao = montar_resultado_validacao(2, 1, [], [], datetime.now())
+
+    assert set(padrao) <= set(resultado)
+    assert resultado["registros_invalidos"] == 1
+    assert resultado["metricas"]["taxa_sucesso"] == 50.0
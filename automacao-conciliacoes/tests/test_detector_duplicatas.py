@@ -0,0 +1,97 @@
+"""Testes da detecção de duplicatas em blocos colunares."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from shared.base_conciliacao import ConciliacaoTemplate
+from shared.detector_duplicatas import DetectorDuplicatas
+from shared.motor_comparacao import hash_linhas
+
+
+@pytest.mark.parametrize("usar_bloom", [False, True])
+def test_duplicata_entre_blocos_com_tipos_diferentes(tmp_path, usar_bloom):
+    detector = DetectorDuplicatas(["conta", "valor"], usar_bloom=usar_bloom, capacidade_esperada=1000,
+                                  diretorio_temporario=str(tmp_path))
+
+    # Bloco limpo (int/float) e bloco com ausentes (object) com a mesma chave
+    detector.adicionar_bloco({"conta": np.array([1, 2]), "valor": np.array([10.5, 20.0])})
+    detector.adicionar_bloco({"conta": [None, 1], "valor": [None, 10.5]})
+
+    resultado = detector.finalizar()
+
+    assert resultado["grupos_duplicados"] == 1
+    assert resultado["grupos"][0]["linhas"] == [0, 3]
+
+
+def test_ausentes_tem_um_unico_hash():
+    com_nan = hash_linhas({"c": np.array([np.nan, 1.0])}, ["c"])
+    com_none = hash_linhas({"c": [None, 1]}, ["c"])
+    texto_vazio = hash_linhas({"c": np.array(["", "x"])}, ["c"])
+
+    assert com_nan[0] == com_none[0] == texto_vazio[0]
+    assert com_nan[1] == com_none[1]
+
+
+def test_datas_independem_do_tipo_do_bloco():
+    como_objeto = hash_linhas({"d": [datetime(2025, 6, 9), None]}, ["d"])
+    como_array = hash_linhas({"d": np.array(["2025-06-09", "NaT"], dtype="datetime64[D]")}, ["d"])
+
+    np.testing.assert_array_equal(como_objeto, como_array)
+
+
+def test_lista_mista_nao_vira_texto():
+    misto = hash_linhas({"c": [1, "a"]}, ["c"])
+    numerico = hash_linhas({"c": [1, 2]}, ["c"])
+
+    assert misto[0] == numerico[0]
+
+
+def test_sem_colunas_de_chave_a_verificacao_e_ignorada(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    modulo = ConciliacaoTemplate("teste_duplicatas", "teste", "baixa")
+
+    assert modulo._verificar_duplicatas([{"conta": [1, 1]}]) is None
+    assert modulo._verificar_duplicatas([{"conta": [1, 1]}], ["conta"])["grupos_duplicados"] == 1
+
+
+def test_bloom_confere_chaves_reais_dos_candidatos(tmp_path, monkeypatch):
+    # Simula colisão do hash de 64 bits: todas as chaves com o mesmo hash
+    monkeypatch.setattr("shared.detector_duplicatas.hash_linhas",
+                        lambda bloco, chaves: np.full(len(bloco[chaves[0]]), 7, dtype=np.uint64))
+    detector = DetectorDuplicatas(["conta"], usar_bloom=True, capacidade_esperada=1000,
+                                  diretorio_temporario=str(tmp_path))
+
+    detector.adicionar_bloco({"conta": np.array([1, 2])})
+    detector.adicionar_bloco({"conta": ["x", None, 1.0]})
+    detector.adicionar_bloco({"conta": np.array([], dtype=np.int64)})
+    detector.adicionar_bloco({"conta": [None]})
+
+    resultado = detector.finalizar()
+
+    assert sorted(grupo["linhas"] for grupo in resultado["grupos"]) == [[0, 4], [3, 5]]
+    assert resultado["grupos_duplicados"] == 2
+    assert resultado["registros_duplicados"] == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("verificar", [True, False])
+def test_template_anexa_duplicatas_conforme_configuracao(tmp_path, monkeypatch, verificar):
+    monkeypatch.chdir(tmp_path)
+    modulo = ConciliacaoTemplate("teste_duplicatas", "teste", "baixa")
+    modulo.config["validacoes"]["colunas_chave"] = ["conta"]
+    modulo.config["validacoes"]["verificar_duplicatas"] = verificar
+    monkeypatch.setattr(modulo, "_carregar_dados", lambda data: {
+        "colunas": {"conta": np.array([1, 2, 1]), "valor": np.array([1.0, 2.0, 3.0])},
+        "metadados": {"total_registros": 3}
+    })
+
+    resultados = modulo.executar_conciliacao("2025-06-09")
+
+    if verificar:
+        assert resultados["duplicatas"]["colunas"]["grupos"][0]["linhas"] == [0, 2]
+        assert {"tipo": "registros_duplicados", "tabela": "colunas", "quantidade": 1} in resultados["alertas"]
+    else:
+        assert "duplicatas" not in resultados
+        assert resultados["alertas"] == []
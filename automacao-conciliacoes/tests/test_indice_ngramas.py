@@ -0,0 +1,71 @@
+"""Testes do índice de n-gramas e do casamento aproximado."""
+
+import pytest
+
+from shared.indice_ngramas import IndiceNGramas, casar_aproximado, normalizar_texto
+
+
+def test_normalizar_texto_remove_acentos_caixa_e_pontuacao():
+    assert normalizar_texto("  Ação Ordinária - Petrobrás/PN ") == "ACAO ORDINARIA PETROBRAS PN"
+    assert normalizar_texto(None) == ""
+    assert normalizar_texto(123) == "123"
+
+
+def test_buscar_pontua_pelo_coeficiente_de_dice():
+    indice = IndiceNGramas()
+    indice.adicionar("ABCD")
+    indice.adicionar("WXYZ")
+
+    # " ABCD " e " ABCE " têm 4 trigramas cada e compartilham " AB" e "ABC"
+    assert indice.buscar("abce", limiar=0.0) == [(0, pytest.approx(0.5))]
+    assert indice.buscar("ABCD", limiar=0.0) == [(0, pytest.approx(1.0))]
+    assert indice.buscar("", limiar=0.0) == []
+
+
+def test_ngramas_muito_frequentes_sao_ignorados_na_busca():
+    pequeno = IndiceNGramas()
+    for i in range(3):
+        pequeno.adicionar(f"ZZZ {i:03d}")
+    assert pequeno.buscar("ZZZ", limiar=0.0)
+
+    # Com 600 textos o limite é 120 postings; os trigramas de "ZZZ" estão em todos
+    grande = IndiceNGramas(frequencia_maxima=0.2)
+    for i in range(600):
+        grande.adicionar(f"ZZZ {i:03d}")
+    assert len(grande) == 600
+    assert grande.buscar("ZZZ", limiar=0.0) == []
+
+
+def test_casar_aproximado_ignora_acentos_e_caixa():
+    esquerda = [{"ativo": "Ação Petrobrás PN"}]
+    direita = [{"nome": "ACAO PETROBRAS PN"}, {"nome": "VALE ON"}]
+
+    resultado = casar_aproximado(esquerda, direita, "ativo", "nome")
+
+    assert resultado["pares"] == [{"esquerda": 0, "direita": 0, "similaridade": 1.0}]
+    assert resultado["nao_casados_esquerda"] == []
+    assert resultado["nao_casados_direita"] == [1]
+
+
+def test_casar_aproximado_atribui_pares_um_a_um_pelo_mais_parecido():
+    esquerda = [{"ativo": "PETROBRAS PN"}, {"ativo": "PETROBRAS PNA"}]
+    direita = [{"ativo": "PETROBRAS PNA"}]
+
+    resultado = casar_aproximado(esquerda, direita, "ativo", limiar=0.5)
+
+    # Os dois registros da esquerda passam do limiar, mas o único da direita
+    # vai para o par exato e não é reutilizado
+    assert [(par["esquerda"], par["direita"]) for par in resultado["pares"]] == [(1, 0)]
+    assert resultado["nao_casados_esquerda"] == [0]
+    assert resultado["nao_casados_direita"] == []
+
+
+def test_casar_aproximado_rejeita_pares_abaixo_do_limiar():
+    esquerda = [{"ativo": "ITAU UNIBANCO PN"}]
+    direita = [{"ativo": "ITAUSA PN"}]
+
+    resultado = casar_aproximado(esquerda, direita, "ativo", limiar=0.6)
+
+    assert resultado["pares"] == []
+    assert resultado["nao_casados_esquerda"] == [0]
+    assert resultado["nao_casados_direita"] == [0]
@@ -0,0 +1,110 @@
+"""Testes da previsão de prazo e da execução do mapa central."""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from mapa_central import MapaCentral
+from shared.agendador import AgendadorModulos
+
+
+@pytest.fixture
+def mapa(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.json").write_text(json.dumps({
+        "configuracao": {"horario_execucao": "08:00", "intervalo_avaliacao_alertas": 0}
+    }))
+    mapa = MapaCentral("config.json")
+    yield mapa
+    asyncio.run(mapa.encerrar())
+
+
+def _agendador():
+    modulos = [{"nome": "a"}, {"nome": "b", "depende_de": ["a"]}]
+    return AgendadorModulos(modulos, {"a": 1800, "b": 1800})
+
+
+def test_prazo_em_risco(mapa):
+    previsao = mapa._prever_prazo(_agendador(), 3, datetime(2025, 6, 9, 7, 30))
+
+    assert not previsao["prazo_ja_passado"]
+    assert previsao["prazo_em_risco"]
+    assert previsao["modulos_apos_prazo"] == ["b"]
+
+
+def test_dentro_do_prazo(mapa):
+    previsao = mapa._prever_prazo(_agendador(), 3, datetime(2025, 6, 9, 6, 0))
+
+    assert not previsao["prazo_em_risco"]
+    assert previsao["modulos_apos_prazo"] == []
+
+
+def test_execucao_apos_o_prazo_nao_e_prevista_como_perdida(mapa):
+    previsao = mapa._prever_prazo(_agendador(), 3, datetime(2025, 6, 9, 14, 0))
+
+    assert previsao["prazo_ja_passado"]
+    assert not previsao["prazo_em_risco"]
+    assert previsao["modulos_apos_prazo"] == []
+
+
+def test_avaliacao_periodica_so_inicia_em_execucoes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.json").write_text(json.dumps({
+        "configuracao": {"intervalo_avaliacao_alertas": 60}
+    }))
+    mapa = MapaCentral("config.json")
+    try:
+        assert mapa.api._thread_avaliacao is None
+
+        mapa.iniciar_avaliacao_alertas()
+        assert mapa.api._thread_avaliacao.is_alive()
+    finally:
+        asyncio.run(mapa.encerrar())
+
+    assert mapa.api._thread_avaliacao is None
+
+
+def test_alertas_avaliados_fora_do_laco_de_eventos(mapa, monkeypatch):
+    threads = []
+
+    async def executar(modulo, data_referencia=None):
+        return {"status": "sucesso"}
+
+    monkeypatch.setattr(mapa, "_executar_modulo", executar)
+    monkeypatch.setattr(mapa.api, "avaliar_alertas", lambda: threads.append(threading.get_ident()))
+
+    async def rodar():
+        await mapa.executar_modulo({"nome": "a"})
+        return threading.get_ident()
+
+    thread_laco = asyncio.run(rodar())
+
+    assert len(threads) == 1
+    assert threads[0] != thread_laco
+
+
+def test_categoria_respeita_dependencias(mapa, monkeypatch):
+    modulos = [
+        {"nome": "b", "categoria": "impostos", "criticidade": "media", "depende_de": ["a"]},
+        {"nome": "a", "categoria": "impostos", "criticidade": "media"},
+        {"nome": "c", "categoria": "outras", "criticidade": "media"}
+    ]
+    ordem = []
+
+    async def executar(modulo, data_referencia=None):
+        ordem.append(modulo["nome"])
+        return {"status": "erro"}
+
+    monkeypatch.setattr(mapa, "descobrir_modulos", lambda: modulos)
+    monkeypatch.setattr(mapa, "_executar_modulo", executar)
+    monkeypatch.setattr(mapa.api, "avaliar_alertas", lambda: None)
+
+    resultado = asyncio.run(mapa.executar_por_categoria("impostos"))
+
+    assert ordem == ["a"]
+    assert resultado["total_modulos"] == 2
+    assert resultado["ignorados"] == 1
+    assert [r["status"] for r in resultado["resultados"]] == ["ignorado", "erro"]
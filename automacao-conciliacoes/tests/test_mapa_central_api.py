@@ -0,0 +1,66 @@
+"""Testes do snapshot do dashboard e da avaliação de alertas."""
+
+import json
+import time
+
+import pytest
+
+from shared.status_reporter import MapaCentralAPI, StatusReporter
+
+
+@pytest.fixture
+def api(tmp_path):
+    reporter = StatusReporter(str(tmp_path / "status.db"))
+    api = MapaCentralAPI(reporter, max_staleness_segundos=0)
+    yield api
+    api.parar_avaliacao_periodica()
+    reporter.fechar()
+
+
+def test_leitura_do_dashboard_nao_grava(api, monkeypatch):
+    api.status_reporter.reportar_inicio("modulo_a", "outras", "alta")
+    api.status_reporter.reportar_erro("modulo_a", "falha")
+
+    def proibida():
+        raise AssertionError("dashboard abriu conexão de escrita")
+
+    monkeypatch.setattr(api.status_reporter, "conexao", proibida)
+    dados = api.obter_dashboard_data()
+
+    assert dados["alertas"] == []
+
+
+def test_alertas_avaliados_no_caminho_de_escrita(api):
+    api.status_reporter.reportar_inicio("modulo_a", "outras", "alta")
+    api.status_reporter.reportar_erro("modulo_a", "falha")
+
+    assert api.avaliar_alertas() == 1
+    alertas = api.obter_dashboard_data()["alertas"]
+
+    assert [(a["tipo"], a["modulo"]) for a in alertas] == [("erro", "modulo_a")]
+
+
+def test_avaliacao_periodica(api):
+    api.status_reporter.reportar_inicio("modulo_a", "outras", "alta")
+    api.status_reporter.reportar_erro("modulo_a", "falha")
+
+    api.iniciar_avaliacao_periodica(0.05)
+    limite = time.monotonic() + 5
+    while not api.obter_dashboard_data()["alertas"] and time.monotonic() < limite:
+        time.sleep(0.05)
+    api.parar_avaliacao_periodica()
+
+    assert len(api.obter_dashboard_data()["alertas"]) == 1
+
+
+def test_resultados_dos_modulos_sao_serializaveis_em_json(api):
+    reporter = api.status_reporter
+    versao = reporter.obter_versao_dados()
+    reporter.reportar_inicio("modulo_a", "outras", "baixa")
+    reporter.reportar_sucesso("modulo_a", {"total_registros": 3, "saida": "ok"})
+
+    for dados in (reporter.obter_status_modulo("modulo_a"),
+                  reporter.obter_status_todos_modulos(),
+                  reporter.mudancas_desde(versao),
+                  api.obter_dashboard_data()):
+        assert '"saida": "ok"' in json.dumps(dados)
@@ -0,0 +1,43 @@
+"""Testes do motor vetorizado de comparação sistema vs. fonte."""
+
+import numpy as np
+
+from shared.motor_comparacao import MotorComparacao
+
+
+def test_comparar_aplica_tolerancia_e_conta_ausentes():
+    sistema = {"isin": np.array(["A", "B", "C"]), "valor": np.array([100.0, 200.0, 300.0])}
+    fonte = {"isin": np.array(["B", "A", "D"]), "valor": np.array([250.0, 100.004, 1.0])}
+
+    resultado = MotorComparacao(tolerancia_absoluta=0.01).comparar(sistema, fonte, ["isin"], ["valor"])
+
+    assert resultado["total_registros"] == 3
+    assert resultado["registros_validos"] == 1
+    assert resultado["registros_ausentes_fonte"] == 1
+    assert resultado["registros_ausentes_sistema"] == 1
+    assert [(d["chave"]["isin"], d["motivo"]) for d in resultado["divergencias"]] == [
+        ("B", "valor_divergente"), ("C", "ausente_fonte")
+    ]
+    assert resultado["divergencias"][0]["colunas"] == {"valor": {"sistema": 200.0, "fonte": 250.0}}
+
+
+def test_comparar_chave_composta():
+    sistema = {"conta": [1, 1], "data": ["2025-06-09", "2025-06-10"], "valor": [10.0, 20.0]}
+    fonte = {"conta": [1, 1], "data": ["2025-06-10", "2025-06-09"], "valor": [20.0, 10.0]}
+
+    resultado = MotorComparacao().comparar(sistema, fonte, ["conta", "data"], ["valor"])
+
+    assert resultado["registros_validos"] == 2
+    assert resultado["registros_duplicados_fonte"] == 0
+
+
+def test_comparar_aponta_chaves_repetidas_na_fonte():
+    sistema = {"isin": np.array(["A", "B"]), "valor": np.array([1.0, 2.0])}
+    fonte = {"isin": np.array(["A", "B", "A", "A"]), "valor": np.array([1.0, 2.0, 1.0, 9.0])}
+
+    resultado = MotorComparacao().comparar(sistema, fonte, ["isin"], ["valor"])
+
+    assert resultado["registros_duplicados_fonte"] == 2
+    assert resultado["registros_ambiguos"] == 1
+    assert resultado["registros_ausentes_sistema"] == 0
+    assert resultado["chaves_duplicadas_fonte"] == [{"chave": {"isin": "A"}, "linhas_fonte": [0, 2, 3]}]
@@ -0,0 +1,104 @@
+"""Testes do particionamento para validação paralela."""
+
+from datetime import datetime
+import pickle
+
+import numpy as np
+import pytest
+
+from shared.base_conciliacao import ConciliacaoTemplate
+from shared.particionamento import mesclar_resultados, particionar, validar_particao
+
+
+class ConciliacaoCarteiras(ConciliacaoTemplate):
+    """Módulo de teste definido no nível do módulo para poder ser serializado."""
+
+    def __init__(self):
+        super().__init__("teste_particoes", "teste", "baixa")
+
+
+@pytest.fixture
+def modulo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ConciliacaoCarteiras()
+
+
+def _dados():
+    return {
+        "sistema": {
+            "carteira": np.array(["B", "A", "B", "A", "C"]),
+            "id": np.array([1, 2, 3, 4, 5]),
+            "valor": np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+        },
+        "fonte": {
+            "carteira": np.array(["A", "B", "A", "B"]),
+            "id": np.array([2, 1, 4, 3]),
+            "valor": np.array([20.0, 10.0, 45.0, 30.0])
+        },
+        "chaves": ["id"],
+        "colunas_valor": ["valor"]
+    }
+
+
+def test_particionar_divide_tabelas_e_repete_demais_entradas():
+    particoes = particionar(_dados(), "carteira")
+
+    assert list(particoes) == ["A", "B", "C"]
+    assert particoes["A"]["sistema"]["id"].tolist() == [2, 4]
+    assert particoes["A"]["fonte"]["id"].tolist() == [2, 4]
+    assert particoes["C"]["fonte"]["id"].tolist() == []
+    assert particoes["B"]["chaves"] == ["id"]
+
+
+def test_particionar_sem_coluna_de_particao_falha():
+    with pytest.raises(ValueError):
+        particionar({"colunas": {"id": [1, 2]}}, "carteira")
+
+
+def test_mesclar_resultados_soma_concatena_e_propaga_erro():
+    resultados = {
+        "A": {"status": "sucesso", "total_registros": 3, "registros_validos": 3, "registros_invalidos": 0,
+              "erros": [], "alertas": [{"tipo": "x"}], "metricas": {"tempo_execucao": 1.0}},
+        "B": {"status": "erro", "total_registros": 1, "registros_validos": 0, "registros_invalidos": 1,
+              "erros": [{"tipo": "y"}], "alertas": [], "metricas": {"tempo_execucao": 2.0}}
+    }
+
+    consolidado = mesclar_resultados(resultados, datetime.now())
+
+    assert consolidado["status"] == "erro"
+    assert consolidado["total_registros"] == 4
+    assert consolidado["registros_validos"] == 3
+    assert consolidado["erros"] == [{"tipo": "y"}]
+    assert consolidado["alertas"] == [{"tipo": "x"}]
+    assert consolidado["metricas"]["taxa_sucesso"] == pytest.approx(75.0)
+    assert consolidado["particoes"]["B"]["tempo_execucao"] == 2.0
+
+
+def test_subclasse_e_serializavel_para_os_processos(modulo):
+    copia = pickle.loads(pickle.dumps(modulo))
+    parte = particionar(_dados(), "carteira")["A"]
+
+    resultado = validar_particao(copia, parte)
+
+    assert resultado["total_registros"] == 2
+    assert resultado["registros_validos"] == 1
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_validacao_particionada_equivale_a_completa(modulo, processos):
+    completo = modulo._executar_validacoes(_dados())
+
+    modulo.config["execucao"]["chave_particao"] = "carteira"
+    modulo.config["execucao"]["processos"] = processos
+    particionado = modulo._executar_validacoes_particionadas(_dados())
+
+    for campo in ("total_registros", "registros_validos", "registros_invalidos",
+                  "registros_ausentes_fonte", "registros_ausentes_sistema"):
+        assert particionado[campo] == completo[campo]
+
+    # Posições de linha referem-se aos dados originais, não à partição
+    def por_linha(item):
+        return item["linha_sistema"]
+
+    assert sorted(particionado["divergencias"], key=por_linha) == sorted(completo["divergencias"], key=por_linha)
+    assert set(particionado["particoes"]) == {"A", "B", "C"}
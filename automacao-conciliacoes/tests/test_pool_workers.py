@@ -0,0 +1,135 @@
+"""Testes do pool de workers pré-aquecidos."""
+
+import asyncio
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from shared.pool_workers import PoolWorkers
+
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def _executar(pool, script, **kwargs):
+    async def principal():
+        try:
+            return await pool.executar(str(script), str(script.parent), **kwargs)
+        finally:
+            await pool.encerrar()
+    return asyncio.run(principal())
+
+
+def test_script_pode_criar_processos(tmp_path):
+    script = tmp_path / "conciliacao.py"
+    script.write_text(textwrap.dedent("""
+        from concurrent.futures import ProcessPoolExecutor
+
+        def dobro(x):
+            return 2 * x
+
+        if __name__ == "__main__":
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                print(sum(executor.map(dobro, range(10))))
+    """))
+
+    resultado = _executar(PoolWorkers(1, modulos_pre_importados=[]), script, timeout=60)
+
+    assert resultado["codigo_saida"] == 0, resultado["stderr"]
+    assert resultado["stdout"].strip() == "90"
+
+
+def test_ambiente_da_tarefa_e_restaurado(tmp_path):
+    script = tmp_path / "conciliacao.py"
+    script.write_text("import os\nprint(os.environ.get('VARIAVEL_TESTE'))\n")
+    pool = PoolWorkers(1, modulos_pre_importados=[])
+
+    async def principal():
+        try:
+            com = await pool.executar(str(script), str(tmp_path), timeout=30, ambiente={"VARIAVEL_TESTE": "1"})
+            sem = await pool.executar(str(script), str(tmp_path), timeout=30)
+            return com["stdout"].strip(), sem["stdout"].strip()
+        finally:
+            await pool.encerrar()
+
+    assert asyncio.run(principal()) == ("1", "None")
+
+
+def test_saida_sem_encerrar_nao_fica_presa(tmp_path):
+    script = tmp_path / "tarefa.py"
+    script.write_text("print('ok')\n")
+    orquestrador = tmp_path / "orquestrador.py"
+    orquestrador.write_text(textwrap.dedent(f"""
+        import asyncio, sys
+        sys.path.insert(0, {str(RAIZ)!r})
+        from shared.pool_workers import PoolWorkers
+
+        async def principal():
+            pool = PoolWorkers(2, modulos_pre_importados=[])
+            resultado = await pool.executar({str(script)!r}, {str(tmp_path)!r}, timeout=30)
+            print(resultado["stdout"].strip())
+
+        if __name__ == "__main__":
+            asyncio.run(principal())
+    """))
+
+    processo = subprocess.run([sys.executable, str(orquestrador)], capture_output=True, text=True, timeout=60)
+
+    assert processo.returncode == 0, processo.stderr
+    assert processo.stdout.strip() == "ok"
+
+
+def test_worker_morto_enquanto_livre_e_substituido(tmp_path):
+    script = tmp_path / "conciliacao.py"
+    script.write_text("print('ok')\n")
+    pool = PoolWorkers(1, modulos_pre_importados=[])
+
+    async def principal():
+        try:
+            await pool.executar(str(script), str(tmp_path), timeout=30)
+            morto = pool._workers[0].processo
+            morto.kill()
+            morto.join()
+
+            resultado = await pool.executar(str(script), str(tmp_path), timeout=30)
+            return resultado, morto, pool._workers[0].processo
+        finally:
+            await pool.encerrar()
+
+    resultado, morto, atual = asyncio.run(principal())
+
+    assert resultado["codigo_saida"] == 0, resultado["stderr"]
+    assert resultado["stdout"].strip() == "ok"
+    assert atual is not morto
+
+
+def test_tarefa_cancelada_substitui_o_worker(tmp_path):
+    lento = tmp_path / "lento.py"
+    lento.write_text("import time\nprint('lento')\ntime.sleep(60)\n")
+    rapido = tmp_path / "rapido.py"
+    rapido.write_text("print('rapido')\n")
+    pool = PoolWorkers(1, modulos_pre_importados=[])
+
+    async def principal():
+        try:
+            tarefa = asyncio.create_task(pool.executar(str(lento), str(tmp_path), timeout=120))
+            while not pool._workers or not pool._workers[0].tarefas:
+                await asyncio.sleep(0.05)
+            ocupado = pool._workers[0].processo
+
+            tarefa.cancel()
+            try:
+                await tarefa
+            except asyncio.CancelledError:
+                pass
+
+            resultado = await pool.executar(str(rapido), str(tmp_path), timeout=30)
+            return resultado, ocupado
+        finally:
+            await pool.encerrar()
+
+    resultado, ocupado = asyncio.run(principal())
+
+    assert resultado["stdout"].strip() == "rapido"
+    assert not ocupado.is_alive()
@@ -0,0 +1,61 @@
+"""Testes do agregado diário de métricas do StatusReporter."""
+
+import pytest
+
+from shared.status_reporter import StatusReporter
+
+
+@pytest.fixture
+def reporter(tmp_path):
+    reporter = StatusReporter(str(tmp_path / "status.db"))
+    yield reporter
+    reporter.fechar()
+
+
+def _sucesso(reporter, nome, data_referencia, categoria="outras"):
+    reporter.reportar_inicio(nome, categoria, "baixa")
+    reporter.reportar_sucesso(nome, {
+        "data_referencia": data_referencia,
+        "total_registros": 10,
+        "registros_validos": 10,
+        "metricas": {"tempo_execucao": 1.0, "taxa_sucesso": 100.0}
+    })
+
+
+def _execucoes(reporter, data):
+    return reporter.obter_metricas_consolidadas(data, data)["geral"]["total_execucoes"]
+
+
+def test_agregado_usa_a_data_de_referencia(reporter):
+    _sucesso(reporter, "modulo_a", "2025-06-02")
+
+    assert _execucoes(reporter, "2025-06-02") == 1
+    assert reporter.obter_metricas_consolidadas()["geral"]["total_execucoes"] == 1
+
+
+def test_mudanca_de_categoria_nao_move_o_historico(reporter):
+    _sucesso(reporter, "modulo_a", "2025-06-02", categoria="renda_fixa")
+    _sucesso(reporter, "modulo_a", "2025-06-02", categoria="derivativos")
+    reporter.recalcular_metricas_dia("2025-06-02")
+
+    categorias = reporter.obter_metricas_consolidadas()["por_categoria"]
+
+    assert categorias["renda_fixa"]["execucoes"] == 1
+    assert categorias["derivativos"]["execucoes"] == 1
+
+
+def test_execucao_de_data_anterior_recalcula_o_dia(reporter):
+    # Histórico cobrindo o dia: execução antiga gravada diretamente
+    with reporter.conexao() as conn:
+        conn.execute("""
+            INSERT INTO historico_execucoes (nome_modulo, data_referencia, status, timestamp_execucao, categoria)
+            VALUES ('modulo_a', '2025-06-01', 'sucesso', '2025-06-01 20:00:00', 'outras')
+        """)
+    _sucesso(reporter, "modulo_a", "2025-06-02")
+
+    # Agregado desatualizado é refeito na próxima execução da mesma data
+    with reporter.conexao() as conn:
+        conn.execute("UPDATE metricas_consolidadas SET execucoes = 99 WHERE data_consolidacao = '2025-06-02'")
+    _sucesso(reporter, "modulo_a", "2025-06-02")
+
+    assert _execucoes(reporter, "2025-06-02") == 2
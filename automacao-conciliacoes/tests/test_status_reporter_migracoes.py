@@ -0,0 +1,198 @@
+"""Testes das migrações de esquema do StatusReporter."""
+
+import logging
+import sqlite3
+
+import pytest
+
+from shared.status_reporter import StatusReporter
+
+
+# Esquema anterior às migrações (sem user_version e sem auto_vacuum)
+_ESQUEMA_ANTIGO = """
+    CREATE TABLE status_modulos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome_modulo TEXT NOT NULL,
+        categoria TEXT NOT NULL,
+        criticidade TEXT NOT NULL,
+        status TEXT NOT NULL,
+        progresso INTEGER DEFAULT 0,
+        mensagem TEXT,
+        timestamp_inicio DATETIME,
+        timestamp_fim DATETIME,
+        timestamp_atualizacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+        dados_resultado TEXT,
+        erro TEXT
+    );
+    CREATE TABLE historico_execucoes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome_modulo TEXT NOT NULL,
+        data_referencia TEXT NOT NULL,
+        status TEXT NOT NULL,
+        tempo_execucao REAL,
+        registros_processados INTEGER,
+        registros_validos INTEGER,
+        registros_invalidos INTEGER,
+        taxa_sucesso REAL,
+        timestamp_execucao DATETIME DEFAULT CURRENT_TIMESTAMP,
+        dados_completos TEXT
+    );
+"""
+
+
+def _pragma(caminho, nome):
+    with sqlite3.connect(caminho) as conn:
+        return conn.execute(f"PRAGMA {nome}").fetchone()[0]
+
+
+@pytest.fixture
+def vacuums(monkeypatch):
+    chamadas = []
+    original = StatusReporter.ativar_auto_vacuum
+    monkeypatch.setattr(StatusReporter, "ativar_auto_vacuum",
+                        lambda self: chamadas.append(self) or original(self))
+    return chamadas
+
+
+def test_banco_novo_chega_a_ultima_versao_sem_vacuum(tmp_path, vacuums):
+    caminho = tmp_path / "status.db"
+    reporter = StatusReporter(str(caminho))
+    reporter.fechar()
+
+    assert _pragma(caminho, "user_version") == len(reporter._migracoes())
+    assert _pragma(caminho, "auto_vacuum") == 2
+    assert vacuums == []
+
+
+def test_reinicializar_e_idempotente(tmp_path, vacuums):
+    caminho = tmp_path / "status.db"
+    StatusReporter(str(caminho)).fechar()
+    reporter = StatusReporter(str(caminho))
+    reporter.reportar_inicio("modulo_a", "outras", "baixa")
+    reporter.fechar()
+
+    assert _pragma(caminho, "user_version") == len(reporter._migracoes())
+    assert vacuums == []
+
+
+def test_banco_antigo_e_migrado_uma_unica_vez(tmp_path, vacuums):
+    caminho = tmp_path / "status.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.executescript(_ESQUEMA_ANTIGO)
+        conn.executemany(
+            "INSERT INTO status_modulos (nome_modulo, categoria, criticidade, status, timestamp_atualizacao) "
+            "VALUES (?, 'outras', 'baixa', ?, ?)",
+            [("modulo_a", "erro", "2025-06-01 10:00:00"),
+             ("modulo_a", "sucesso", "2025-06-02 10:00:00"),
+             ("modulo_b", "sucesso", "2025-06-02 10:00:00")]
+        )
+
+    reporter = StatusReporter(str(caminho))
+    status = {s["nome_modulo"]: s["status"] for s in reporter.obter_status_todos_modulos()}
+    reporter.fechar()
+    StatusReporter(str(caminho)).fechar()
+
+    assert status == {"modulo_a": "sucesso", "modulo_b": "sucesso"}
+    assert _pragma(caminho, "user_version") == len(reporter._migracoes())
+    assert _pragma(caminho, "auto_vacuum") == 2
+    assert len(vacuums) == 1
+
+
+def test_vacuum_com_banco_ocupado_fica_para_manutencao(tmp_path, monkeypatch, caplog):
+    caminho = tmp_path / "status.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.executescript(_ESQUEMA_ANTIGO)
+        conn.execute("PRAGMA journal_mode=WAL")
+
+    ativar = StatusReporter.ativar_auto_vacuum
+    monkeypatch.setattr(StatusReporter, "ativar_auto_vacuum", lambda self: False)
+    reporter = StatusReporter(str(caminho), busy_timeout_ms=100)
+    monkeypatch.setattr(StatusReporter, "ativar_auto_vacuum", ativar)
+
+    # Outro processo gravando impede o VACUUM
+    outra = sqlite3.connect(caminho, isolation_level=None)
+    outra.execute("BEGIN IMMEDIATE")
+    try:
+        with caplog.at_level(logging.WARNING, logger="status_reporter"):
+            assert not reporter.ativar_auto_vacuum()
+    finally:
+        outra.execute("COMMIT")
+        outra.close()
+
+    assert "--compactar-banco" in caplog.text
+    assert reporter.ativar_auto_vacuum()
+    reporter.fechar()
+    assert _pragma(caminho, "auto_vacuum") == 2
+
+
+def test_erro_ao_desanexar_nao_propaga(tmp_path, caplog):
+    reporter = StatusReporter(str(tmp_path / "status.db"))
+    with caplog.at_level(logging.ERROR, logger="status_reporter"):
+        with reporter.conexao() as conn:
+            reporter._desanexar_arquivo(conn)
+    reporter.fechar()
+
+    assert "desanexar" in caplog.text
+
+
+def test_banco_antigo_consolida_metricas_por_data_de_referencia(tmp_path, vacuums):
+    caminho = tmp_path / "status.db"
+    with sqlite3.connect(caminho) as conn:
+        conn.executescript(_ESQUEMA_ANTIGO)
+        conn.execute(
+            "INSERT INTO status_modulos (nome_modulo, categoria, criticidade, status) "
+            "VALUES ('modulo_a', 'outras', 'baixa', 'sucesso')"
+        )
+        conn.execute(
+            "INSERT INTO historico_execucoes (nome_modulo, data_referencia, status, tempo_execucao, timestamp_execucao) "
+            "VALUES ('modulo_a', '2025-06-02', 'sucesso', 2.0, '2025-06-03 08:00:00')"
+        )
+
+    reporter = StatusReporter(str(caminho))
+    metricas = reporter.obter_metricas_consolidadas("2025-06-02", "2025-06-02")
+    reporter.fechar()
+
+    assert metricas["por_categoria"]["outras"]["execucoes"] == 1
+    assert metricas["geral"]["tempo_medio_execucao"] == 2.0
+
+
+def test_progresso_nao_muda_a_versao_de_dados(tmp_path):
+    reporter = StatusReporter(str(tmp_path / "status.db"))
+    reporter.reportar_inicio("modulo_a", "outras", "baixa")
+    versao = reporter.obter_versao_dados()
+
+    reporter.reportar_progresso("modulo_a", 50, "processando")
+    assert reporter.obter_versao_dados() == versao
+    assert reporter.obter_status_modulo("modulo_a")["progresso"] == 50
+
+    reporter.reportar_erro("modulo_a", "falha")
+    mudancas = reporter.mudancas_desde(versao)
+    reporter.fechar()
+
+    assert mudancas["versao"] > versao
+    assert [s["status"] for s in mudancas["status"]] == ["erro"]
+
+
+def test_banco_versionado_recria_trigger_de_status(tmp_path):
+    caminho = tmp_path / "status.db"
+    reporter = StatusReporter(str(caminho))
+    reporter.fechar()
+
+    # Banco na versão anterior, com o trigger que reagia a qualquer atualização
+    with sqlite3.connect(caminho) as conn:
+        conn.execute("DROP TRIGGER trg_status_modulos_versao_update")
+        conn.execute("""
+            CREATE TRIGGER trg_status_modulos_versao_update
+            AFTER UPDATE ON status_modulos WHEN NEW.versao IS OLD.versao
+            BEGIN
+                UPDATE controle_versao SET versao = versao + 1 WHERE id = 1;
+            END
+        """)
+        conn.execute(f"PRAGMA user_version = {len(reporter._migracoes()) - 1}")
+
+    reporter = StatusReporter(str(caminho))
+    reporter.reportar_inicio("modulo_a", "outras", "baixa")
+    versao = reporter.obter_versao_dados()
+    reporter.reportar_progresso("modulo_a", 50)
+    assert reporter.obter_versao_dados() == versao
+    reporter.fechar()
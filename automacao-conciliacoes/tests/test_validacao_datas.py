@@ -0,0 +1,72 @@
+"""Testes da interpretação e validação vetorizada de datas."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from shared.base_conciliacao import ConciliacaoTemplate
+from shared.validacao_datas import ValidadorDatas
+
+
+def _datas(*textos):
+    return np.array(textos, dtype="datetime64[D]")
+
+
+@pytest.mark.parametrize("valores, esperado", [
+    ([45000, None], _datas("2023-03-15", "NaT")),
+    (np.array(["20250607", None], dtype=object), _datas("2025-06-07", "NaT")),
+    ([datetime(2025, 6, 7, 13, 30), None, date(2025, 1, 2)], _datas("2025-06-07", "NaT", "2025-01-02")),
+    ([45000, "07/06/2025", float("nan")], _datas("2023-03-15", "2025-06-07", "NaT")),
+    (np.array([45000.0, np.nan]), _datas("2023-03-15", "NaT")),
+    (["2025-06-07", "2025-06-07 00:00:00", "x"], _datas("2025-06-07", "2025-06-07", "NaT")),
+    (_datas("2025-06-07", "NaT"), _datas("2025-06-07", "NaT")),
+])
+def test_interpretar_colunas_mistas(valores, esperado):
+    np.testing.assert_array_equal(ValidadorDatas().interpretar(valores), esperado)
+
+
+def test_textos_sao_interpretados_uma_vez_entre_blocos():
+    validador = ValidadorDatas()
+    validador.interpretar(["07/06/2025", "07/06/2025"])
+    validador.interpretar(np.array(["07/06/2025", None], dtype=object))
+
+    assert list(validador._memo) == ["07/06/2025"]
+
+
+def test_validar_intervalo_e_dias_uteis():
+    validador = ValidadorDatas(data_minima="2025-06-01", data_maxima="2025-06-30",
+                               feriados=["2025-06-19"])
+    resultado = validador.validar(["2025-06-09", "2025-06-07", "2025-06-19", "2025-07-01", "?"])
+
+    assert resultado["valida"].tolist() == [True, False, False, False, False]
+    assert resultado["contagens"] == {
+        "total_registros": 5,
+        "datas_validas": 1,
+        "datas_invalidas": 1,
+        "datas_fora_intervalo": 1,
+        "datas_nao_uteis": 2
+    }
+
+
+@pytest.mark.parametrize("validar", [True, False])
+def test_template_anexa_validacao_de_datas_conforme_configuracao(tmp_path, monkeypatch, validar):
+    monkeypatch.chdir(tmp_path)
+    modulo = ConciliacaoTemplate("teste_datas", "teste", "baixa")
+    modulo.config["validacoes"]["validar_datas"] = validar
+    modulo.config["validacoes"]["colunas_data"] = ["liquidacao"]
+    modulo.config["validacoes"]["data_maxima"] = "2025-06-30"
+    monkeypatch.setattr(modulo, "_carregar_dados", lambda data: {
+        "colunas": {"liquidacao": ["2025-06-09", "2025-07-01", "x"]},
+        "metadados": {"total_registros": 3}
+    })
+
+    resultados = modulo.executar_conciliacao("2025-06-09")
+
+    if validar:
+        assert resultados["datas"]["colunas"]["liquidacao"]["datas_validas"] == 1
+        assert {"tipo": "datas_rejeitadas", "tabela": "colunas", "coluna": "liquidacao",
+                "quantidade": 2} in resultados["alertas"]
+    else:
+        assert "datas" not in resultados
+        assert resultados["alertas"] == []
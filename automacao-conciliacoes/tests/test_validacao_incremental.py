@@ -0,0 +1,72 @@
+"""Testes do modo incremental da classe base de conciliação."""
+
+import numpy as np
+import pytest
+
+from shared.base_conciliacao import ConciliacaoTemplate
+
+
+@pytest.fixture
+def modulo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ConciliacaoTemplate("teste_incremental", "teste", "baixa")
+
+
+def _dados():
+    return {
+        "colunas": {
+            "id": np.array([1, 2, 3]),
+            "valor_sistema": np.array([10.0, 20.0, 30.0]),
+            "valor_fonte": np.array([10.0, 25.0, 30.0])
+        },
+        "metadados": {"total_registros": 3}
+    }
+
+
+def test_validar_linhas_padrao_usa_pares_configurados(modulo):
+    modulo.config["validacoes"]["colunas_chave"] = ["id"]
+    modulo.config["validacoes"]["pares_colunas"] = {"valor_sistema": "valor_fonte"}
+
+    resultado = modulo._executar_validacoes_incrementais(_dados(), "2025-06-09")
+
+    assert resultado["total_registros"] == 3
+    assert resultado["registros_validos"] == 2
+    assert resultado["incremental"]["registros_revalidados"] == 3
+
+
+def test_sem_pares_nem_sobrescrita_executa_validacao_completa(modulo):
+    modulo.config["validacoes"]["colunas_chave"] = ["id"]
+
+    resultado = modulo._executar_validacoes_incrementais(_dados(), "2025-06-09")
+
+    assert "incremental" not in resultado
+    assert resultado["total_registros"] == 3
+
+
+def test_segundo_dia_revalida_apenas_registro_alterado(modulo, monkeypatch):
+    modulo.config["validacoes"]["colunas_chave"] = ["id"]
+    modulo.config["validacoes"]["pares_colunas"] = {"valor_sistema": "valor_fonte"}
+
+    primeiro = modulo._executar_validacoes_incrementais(_dados(), "2025-06-09")
+    assert primeiro["registros_validos"] == 2
+
+    validados = []
+    validar_original = modulo._validar_linhas
+
+    def validar_espiao(colunas):
+        validados.extend(np.asarray(colunas["id"]).tolist())
+        return validar_original(colunas)
+
+    monkeypatch.setattr(modulo, "_validar_linhas", validar_espiao)
+
+    dados = _dados()
+    dados["colunas"]["valor_fonte"] = np.array([10.0, 20.0, 30.0])
+    segundo = modulo._executar_validacoes_incrementais(dados, "2025-06-10")
+
+    assert validados == [2]
+    assert segundo["registros_validos"] == 3
+    assert segundo["incremental"]["estado_anterior"] == "20250609"
+    assert segundo["incremental"]["registros_revalidados"] == 1
+    assert segundo["incremental"]["registros_alterados"] == 1
+    assert segundo["incremental"]["registros_novos"] == 0
+    assert segundo["incremental"]["registros_reaproveitados"] == 2